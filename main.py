@@ -1,14 +1,31 @@
 """Entry point for OGame bot."""
 
 import argparse
+import json
 import os
+import random
+import sys
+from contextlib import contextmanager, nullcontext
+from dataclasses import replace
 from pathlib import Path
 
-from src.ogame_bot.bot import OGameBot
+# Browser code (bot, actions) is imported only by the modes that launch one,
+# so --plan starts fast and works without Playwright
 from src.ogame_bot.config import OGameConfig
-from src.ogame_bot.actions.fleet import Fleet
-from src.ogame_bot.actions.navigation import Navigation
-from src.ogame_bot.mission_config import load_expeditions, load_farming
+from src.ogame_bot.mission_config import (
+    load_build_plan,
+    load_expeditions,
+    load_farming,
+    load_harvest,
+    save_build_plan,
+)
+from src.ogame_bot.profiling import PHASES, RunProfiler
+from src.ogame_bot.utils.log import dump_recent, get_logger, log_context, setup_logging, shutdown_logging
+
+# --plan exit code when the run would send nothing (so cron can skip it)
+EXIT_NOTHING_TO_SEND = 3
+
+log = get_logger("main")
 
 
 def _parse_args() -> argparse.Namespace:
@@ -18,6 +35,87 @@ def _parse_args() -> argparse.Namespace:
         action="store_true",
         help="Run only expedition missions and skip farming.",
     )
+    parser.add_argument(
+        "--plan",
+        action="store_true",
+        help="Print what a run would send, from the cached empire state, without "
+             f"opening the browser. Exits with {EXIT_NOTHING_TO_SEND} if nothing would be sent.",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="With --plan, print the plan as JSON.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip farm targets the dispatch journal shows were hit within "
+             "FARM_COOLDOWN minutes (e.g., after a crash).",
+    )
+    parser.add_argument(
+        "--track-activity",
+        nargs="?",
+        type=float,
+        const=15,
+        metavar="MINUTES",
+        help="Sample the farm targets' activity from the galaxy view every MINUTES "
+             "(default 15) until interrupted, instead of sending missions.",
+    )
+    parser.add_argument(
+        "--harvest",
+        nargs="?",
+        type=float,
+        const=10,
+        metavar="MINUTES",
+        help="Send recyclers to the debris fields around the harvest planets every "
+             "MINUTES (default 10) until interrupted, instead of sending missions.",
+    )
+    parser.add_argument(
+        "--fleetsave-watch",
+        nargs="?",
+        type=float,
+        const=0,
+        metavar="MINUTES",
+        help="Watch the event list and send away the fleet of any planet a hostile "
+             "fleet is heading to, for MINUTES (default: until interrupted), instead "
+             "of sending missions.",
+    )
+    parser.add_argument(
+        "--build-queue",
+        action="store_true",
+        help="Work through the build/research plan instead of sending missions.",
+    )
+    parser.add_argument(
+        "--optimize-build",
+        metavar="STATE",
+        help="Search the best build order for the planets in STATE (JSON) and write "
+             "it as the build plan. Needs NumPy (uv sync --extra sim).",
+    )
+    parser.add_argument(
+        "--horizon",
+        type=float,
+        default=72,
+        help="Hours ahead at which --optimize-build compares production (default 72).",
+    )
+    har = parser.add_mutually_exclusive_group()
+    har.add_argument(
+        "--record",
+        metavar="HAR",
+        help="Record the session's traffic to a HAR file (secrets are scrubbed).",
+    )
+    har.add_argument(
+        "--replay",
+        metavar="HAR",
+        help="Serve all traffic from a recorded HAR file instead of the real server.",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="all",
+        choices=PHASES,
+        help="Write a cProfile dump, Playwright trace and timing report for the run "
+             "(or only the given phase) to PROFILE_DIR (default: profiles/).",
+    )
     return parser.parse_args()
 
 
@@ -28,16 +126,52 @@ def _config_path(env_key: str, default_name: str) -> Path:
     return Path(__file__).resolve().parent / "config" / default_name
 
 
-def main():
+def main() -> int | None:
     """Run the OGame bot."""
-    print("Starting OGame Bot...\n")
-
     args = _parse_args()
+    if args.plan:
+        return _plan(args)
 
     config = OGameConfig.from_env()
+    setup_logging(Path(config.log_dir).expanduser(), console_level=config.log_level.upper())
+    try:
+        return _main(args, config)
+    except Exception:
+        log.exception("Run failed")
+        dump_recent("crash")
+        raise
+    finally:
+        shutdown_logging()
+
+
+def _main(args, config: OGameConfig):
+    log.info("Starting OGame Bot...")
+
+    if args.record:
+        config.record_har = args.record
+    if args.replay:
+        config.replay_har = args.replay
+        # Same waits on every replay, so timings can be compared run to run
+        random.seed(0)
+
+    log.info(f"Lobby URL: {config.lobby_url}")
+    log.info(f"Bot profile: {config.chrome_user_data_dir}")
+
+    if args.optimize_build:
+        _optimize_build(Path(args.optimize_build).expanduser(), args.horizon)
+        return
+
+    if args.build_queue:
+        _run_build_queue(config)
+        return
 
-    print(f"Lobby URL: {config.lobby_url}")
-    print(f"Bot profile: {config.chrome_user_data_dir}\n")
+    if args.harvest:
+        _harvest(config, args.harvest)
+        return
+
+    if args.fleetsave_watch is not None:
+        _watch_fleetsave(config, args.fleetsave_watch)
+        return
 
     expeditions_path = _config_path("EXPEDITIONS_CONFIG", "expeditions.json")
     farming_path = _config_path("FARMING_CONFIG", "farming.json")
@@ -48,61 +182,258 @@ def main():
         if not args.expeditions_only:
             farming_config = load_farming(farming_path)
     except (FileNotFoundError, ValueError) as exc:
-        print(f"Config error: {exc}")
+        log.error(f"Config error: {exc}")
+        return
+
+    if args.track_activity:
+        _track_activity(config, farming_path, args.track_activity)
         return
 
-    print(f"Expeditions config: {expeditions_path}")
+    log.info(f"Expeditions config: {expeditions_path}")
     if not args.expeditions_only:
-        print(f"Farming config: {farming_path}")
-    print()
+        log.info(f"Farming config: {farming_path}")
+
+    profiler = None
+    if args.profile:
+        profiler = RunProfiler(_profile_root(), phase=args.profile)
+        profiler.start()
+
+    try:
+        _run(config, args, expedition_config, farming_config, profiler)
+    finally:
+        if profiler:
+            profiler.finish()
+
+
+def _plan(args) -> int:
+    from src.ogame_bot.dry_run import build_plan, format_plan
+    from src.ogame_bot.journal import DispatchJournal
+    from src.ogame_bot.snapshot import EmpireSnapshot
+
+    config = OGameConfig.from_env()
+    try:
+        expedition_config = load_expeditions(_config_path("EXPEDITIONS_CONFIG", "expeditions.json"))
+        farming_config = None
+        if not args.expeditions_only:
+            farming_config = load_farming(_config_path("FARMING_CONFIG", "farming.json"))
+        build_path = _config_path("BUILD_CONFIG", "build.json")
+        if build_path.exists():
+            load_build_plan(build_path)
+    except (FileNotFoundError, ValueError) as exc:
+        print(f"Config error: {exc}", file=sys.stderr)
+        return 1
+
+    snapshot = EmpireSnapshot.load(Path(config.snapshot_path).expanduser())
+    journal = None
+    journal_path = Path(config.journal_path).expanduser()
+    if args.resume and journal_path.exists():
+        journal = DispatchJournal.read(journal_path, cooldown=config.farm_cooldown * 60)
+
+    plan = build_plan(expedition_config, farming_config, snapshot, journal)
+    if args.json:
+        print(json.dumps(plan.to_dict(), indent=2, ensure_ascii=False))
+    else:
+        print(format_plan(plan))
+
+    # With gaps in the cached state a real run may still find work
+    if plan.complete and not plan.would_send:
+        return EXIT_NOTHING_TO_SEND
+    return 0
+
+
+def _optimize_build(state_path: Path, horizon: float):
+    from src.ogame_bot.simulator import load_economy, optimize_build_order
+
+    try:
+        planets = load_economy(state_path)
+    except (FileNotFoundError, ValueError) as exc:
+        log.error(f"Config error: {exc}")
+        return
+
+    build_path = _config_path("BUILD_CONFIG", "build.json")
+    existing = None
+    if build_path.exists():
+        try:
+            existing = load_build_plan(build_path)
+        except ValueError as exc:
+            log.error(f"Not overwriting {build_path}, it can't be merged: {exc}")
+            return
+
+    log.info(f"Optimizing build order for {len(planets)} planets over {horizon:.0f}h...")
+    plan = optimize_build_order(planets, horizon_hours=horizon)
+    if existing is not None:
+        # Only the optimized planets' build orders are replaced; research and
+        # other planets stay as the user wrote them
+        plan = replace(
+            plan,
+            planets={**existing.planets, **plan.planets},
+            research=existing.research,
+            research_planet=existing.research_planet,
+        )
+    save_build_plan(plan, build_path)
+    for name, items in plan.planets.items():
+        log.info(f"  {name}: {', '.join(f'{key}:{level}' for key, level in items)}")
+    log.info(f"Build plan written to {build_path}")
+
+
+def _run_build_queue(config):
+    build_path = _config_path("BUILD_CONFIG", "build.json")
+    try:
+        plan = load_build_plan(build_path)
+    except (FileNotFoundError, ValueError) as exc:
+        log.error(f"Config error: {exc}")
+        return
+
+    log.info(f"Build plan: {build_path}")
+    from src.ogame_bot.bot import OGameBot
 
     with OGameBot(config) as bot:
-        fleet = Fleet(bot.page)
-        nav = Navigation(bot.page)
+        queued = bot.run_build_plan(plan)
+        log.info(f"Queued {queued} builds/researches")
 
-        # === 1. EXPEDITIONS ===
-        print("\n" + "="*60)
-        print("PHASE 1: EXPEDITIONS")
-        print("="*60)
 
-        nav.select_planet(expedition_config.planet)
-        nav.click_menu_by_text("Flota")
+def _harvest(config, minutes: float):
+    harvest_path = _config_path("HARVEST_CONFIG", "harvest.json")
+    try:
+        harvest_config = load_harvest(harvest_path)
+    except (FileNotFoundError, ValueError) as exc:
+        log.error(f"Config error: {exc}")
+        return
 
-        available = fleet.get_available_expeditions()
-        if expedition_config.max_expeditions is not None:
-            available = min(available, expedition_config.max_expeditions)
-        print(f"\n>>> {available} expedition slots available <<<\n")
+    log.info(f"Harvesting debris around {', '.join(harvest_config.planets)} every {minutes:.0f} min "
+             "(Ctrl+C to stop)")
+    from src.ogame_bot.bot import OGameBot
 
-        if available == 0:
-            print("No expedition slots available, skipping expeditions.")
-        else:
-            for i in range(available):
-                print(f"\n--- Expedition {i + 1} of {available} ---")
-                fleet.send_expedition(
+    with OGameBot(config) as bot:
+        try:
+            bot.harvest(harvest_config, interval=minutes * 60)
+        except KeyboardInterrupt:
+            log.info("Stopped harvesting")
+
+
+def _watch_fleetsave(config, minutes: float):
+    if minutes:
+        log.info(f"Watching for hostile fleets for {minutes:.0f} min (Ctrl+C to stop)")
+    else:
+        log.info("Watching for hostile fleets (Ctrl+C to stop)")
+    from src.ogame_bot.bot import OGameBot
+
+    with OGameBot(config) as bot:
+        try:
+            bot.watch_fleetsave(duration=minutes * 60 or None)
+        except KeyboardInterrupt:
+            log.info("Stopped watching")
+
+
+def _track_activity(config, farming_path: Path, minutes: float):
+    try:
+        farming_config = load_farming(farming_path)
+    except (FileNotFoundError, ValueError) as exc:
+        log.error(f"Config error: {exc}")
+        return
+
+    log.info(f"Tracking {len(farming_config.targets)} farm targets every {minutes:.0f} min (Ctrl+C to stop)")
+    from src.ogame_bot.bot import OGameBot
+
+    with OGameBot(config) as bot:
+        try:
+            bot.track_activity(farming_config.targets, interval=minutes * 60)
+        except KeyboardInterrupt:
+            log.info("Stopped tracking")
+
+
+def _profile_root() -> Path:
+    raw_path = os.getenv("PROFILE_DIR")
+    if raw_path:
+        return Path(raw_path).expanduser()
+    return Path(__file__).resolve().parent / "profiles"
+
+
+def _run(config, args, expedition_config, farming_config, profiler):
+    from src.ogame_bot.actions.fleet import Fleet
+    from src.ogame_bot.bot import OGameBot
+
+    @contextmanager
+    def phase(name: str):
+        with log_context(phase=name), (profiler.phase(name) if profiler else nullcontext()):
+            yield
+
+    with OGameBot(config, profiler=profiler) as bot:
+        supervisor = bot.supervisor
+
+        def fleet() -> Fleet:
+            # Built per attempt: a recovery may have replaced the game page
+            return Fleet(
+                supervisor.page, snapshot=bot.snapshot, journal=bot.journal,
+                mode=config.dispatch_mode, supervisor=supervisor,
+            )
+
+        # === 1. EXPEDITIONS ===
+        log.info("Phase 1: expeditions")
+
+        def send_expeditions():
+            if len(expedition_config.planets) == 1:
+                return fleet().send_expeditions(
                     planet=expedition_config.planet,
                     ships=expedition_config.ships,
+                    count=expedition_config.max_expeditions,
+                )
+            return fleet().send_distributed_expeditions(
+                planets=expedition_config.planets,
+                ships=expedition_config.ships,
+                count=expedition_config.max_expeditions,
+            )
+
+        with phase("expeditions"):
+            # Re-running the phase is safe: it re-reads the free slots
+            stats = supervisor.run("expeditions", send_expeditions)
+            if stats.attempted == 0:
+                log.info("No expedition slots available, skipping expeditions.")
+            else:
+                log.info(
+                    f"Expeditions: {stats.sent} sent in {stats.elapsed:.0f}s "
+                    f"({stats.per_minute:.1f}/min)"
                 )
 
         # === 2. FARM ATTACKS ===
         if args.expeditions_only:
-            print("\n" + "="*60)
-            print("PHASE 2: FARM ATTACKS (SKIPPED)")
-            print("="*60)
+            log.info("Phase 2: farm attacks (skipped)")
         else:
-            print("\n" + "="*60)
-            print("PHASE 2: FARM ATTACKS")
-            print("="*60)
-
-            fleet.send_farm_attacks(
-                planet=farming_config.planet,
-                ships=farming_config.ships,
-                targets=farming_config.targets,
-            )
+            log.info("Phase 2: farm attacks")
+
+            attempts = 0
+
+            def send_farm_attacks():
+                nonlocal attempts
+                # A repeated attempt resumes from the journal instead of hitting targets twice
+                resume = args.resume or attempts > 0
+                attempts += 1
+                if resume:
+                    bot.reconcile_journal()
+                targets = bot.order_farm_targets(
+                    farming_config.planets, farming_config.ships, farming_config.targets
+                )
+                if len(farming_config.planets) == 1:
+                    return fleet().send_farm_attacks(
+                        planet=farming_config.planet,
+                        ships=farming_config.ships,
+                        targets=targets,
+                        resume=resume,
+                    )
+                return fleet().send_distributed_farm_attacks(
+                    planets=farming_config.planets,
+                    ships=farming_config.ships,
+                    targets=targets,
+                    resume=resume,
+                )
+
+            with phase("farming"):
+                supervisor.run("farming", send_farm_attacks)
 
-        print("\n" + "="*60)
-        print("ALL COMPLETE!")
-        print("="*60)
+        # The next run re-reads the ships of planets whose fleets are back by then
+        bot.note_fleet_landings()
+        log.info("All complete!")
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,323 @@
+"""Event-list polling for fleets in flight."""
+
+import re
+import time
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Callable
+
+from playwright.sync_api import Page, Error as PlaywrightError
+
+from ..game_data import Mission
+from ..utils.governor import pace
+from ..utils.log import get_logger
+from ..utils.urls import game_url
+
+log = get_logger(__name__)
+
+
+COORDS_PATTERN = re.compile(r"\[(\d+):(\d+):(\d+)\]")
+
+
+@dataclass(frozen=True)
+class FleetEvent:
+    """A single fleet movement from the event list."""
+
+    event_id: int
+    mission: int
+    origin: tuple[int, int, int] | None
+    destination: tuple[int, int, int] | None
+    arrival_time: int  # unix seconds (server clock)
+    is_return: bool
+    hostile: bool
+
+    @property
+    def mission_name(self) -> str:
+        try:
+            return Mission(self.mission).name.lower()
+        except ValueError:
+            return f"mission-{self.mission}"
+
+
+@dataclass
+class EventDiff:
+    """Changes between two consecutive event-list polls."""
+
+    added: list[FleetEvent] = field(default_factory=list)
+    changed: list[FleetEvent] = field(default_factory=list)
+    removed: list[FleetEvent] = field(default_factory=list)
+    observed_at: float = 0.0  # time.monotonic() when the poll returned
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+    @property
+    def new_hostile(self) -> list[FleetEvent]:
+        """Hostile events that appeared (or turned hostile) in this poll."""
+        return [event for event in self.added + self.changed if event.hostile]
+
+
+class _EventListParser(HTMLParser):
+    """Collect the fields we need from the event-list HTML fragment."""
+
+    def __init__(self):
+        super().__init__()
+        self.rows: list[dict] = []
+        self._row: dict | None = None
+        self._cell: str | None = None
+        self._depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        classes = (attrs.get("class") or "").split()
+
+        if tag == "tr" and (attrs.get("id") or "").startswith("eventRow-"):
+            self._row = {
+                "id": attrs["id"].removeprefix("eventRow-"),
+                "mission": attrs.get("data-mission-type"),
+                "return": attrs.get("data-return-flight"),
+                "arrival": attrs.get("data-arrival-time"),
+                "hostile": False,
+                "coordsOrigin": "",
+                "destCoords": "",
+            }
+            self._depth = 0
+            return
+
+        if self._row is None:
+            return
+
+        if tag == "td":
+            self._cell = classes[0] if classes else None
+        if self._cell == "countDown" and "hostile" in classes:
+            self._row["hostile"] = True
+        if tag == "tr":
+            self._depth += 1
+
+    def handle_endtag(self, tag):
+        if self._row is None:
+            return
+        if tag == "td":
+            self._cell = None
+        elif tag == "tr":
+            if self._depth:
+                self._depth -= 1
+                return
+            self.rows.append(self._row)
+            self._row = None
+
+    def handle_data(self, data):
+        if self._row is not None and self._cell in ("coordsOrigin", "destCoords"):
+            self._row[self._cell] += data
+
+
+def _parse_coords(text: str) -> tuple[int, int, int] | None:
+    match = COORDS_PATTERN.search(text)
+    if not match:
+        return None
+    return (int(match.group(1)), int(match.group(2)), int(match.group(3)))
+
+
+def parse_event_list(html: str) -> list[FleetEvent]:
+    """
+    Parse the event-list AJAX fragment into FleetEvents.
+
+    Rows without an id, mission type or arrival time are skipped.
+    """
+    parser = _EventListParser()
+    parser.feed(html)
+    parser.close()
+
+    events = []
+    for row in parser.rows:
+        try:
+            event_id = int(row["id"])
+            mission = int(row["mission"])
+            arrival = int(row["arrival"])
+        except (TypeError, ValueError):
+            continue
+        events.append(FleetEvent(
+            event_id=event_id,
+            mission=mission,
+            origin=_parse_coords(row["coordsOrigin"]),
+            destination=_parse_coords(row["destCoords"]),
+            arrival_time=arrival,
+            is_return=row["return"] == "true",
+            hostile=row["hostile"],
+        ))
+    return events
+
+
+def fleet_landings(events: list[FleetEvent]) -> dict[tuple[int, int, int], float]:
+    """
+    Unix time at which each coordinate next sees one of our fleets land.
+
+    A return flight lands back at its origin; any other flight at its destination.
+    Hostile fleets are left out.
+    """
+    landings: dict[tuple[int, int, int], float] = {}
+    for event in events:
+        if event.hostile:
+            continue
+        coords = event.origin if event.is_return else event.destination
+        if coords is not None:
+            landings[coords] = min(landings.get(coords, float("inf")), event.arrival_time)
+    return landings
+
+
+class EventTimeline:
+    """In-memory timeline of fleet events, keyed by event id."""
+
+    def __init__(self):
+        self._events: dict[int, FleetEvent] = {}
+
+    def update(self, events: list[FleetEvent]) -> EventDiff:
+        """Replace the timeline with a fresh poll and return what changed."""
+        diff = EventDiff()
+        fresh = {event.event_id: event for event in events}
+
+        for event_id, event in fresh.items():
+            previous = self._events.get(event_id)
+            if previous is None:
+                diff.added.append(event)
+            elif previous != event:
+                diff.changed.append(event)
+
+        for event_id, event in self._events.items():
+            if event_id not in fresh:
+                diff.removed.append(event)
+
+        self._events = fresh
+        return diff
+
+    @property
+    def events(self) -> list[FleetEvent]:
+        """All known events, soonest arrival first."""
+        return sorted(self._events.values(), key=lambda event: event.arrival_time)
+
+    def next_event(self, now: float | None = None) -> FleetEvent | None:
+        """The next event that has not arrived yet."""
+        now = time.time() if now is None else now
+        upcoming = [event for event in self.events if event.arrival_time >= now]
+        return upcoming[0] if upcoming else None
+
+    def hostile(self) -> list[FleetEvent]:
+        """Hostile events currently in flight."""
+        return [event for event in self.events if event.hostile]
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+
+class EventListPoller:
+    """
+    Poll the game's event-list fragment and notify subscribers of changes.
+
+    Each poll is a single request made through the page's browser context
+    (same cookies as the game tab), so the game page itself is never reloaded.
+    """
+
+    def __init__(
+        self,
+        page: Page,
+        min_interval: float = 5.0,
+        max_interval: float = 120.0,
+        url: str | None = None,
+    ):
+        """
+        Args:
+            page: Logged-in game page (used for its session and server URL)
+            min_interval: Shortest delay between polls in seconds
+            max_interval: Longest delay between polls in seconds
+            url: Override the event-list URL (e.g., a local fixture server)
+        """
+        self.page = page
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._url = url
+        self.timeline = EventTimeline()
+        self._subscribers: list[Callable[[EventDiff], None]] = []
+
+    @property
+    def url(self) -> str:
+        if self._url:
+            return self._url
+        return game_url(self.page.url, page="componentOnly", component="eventList", ajax=1)
+
+    def subscribe(self, callback: Callable[[EventDiff], None]):
+        """Register a callback that receives every non-empty EventDiff."""
+        self._subscribers.append(callback)
+
+    def fetch(self) -> list[FleetEvent] | None:
+        """Fetch and parse the event list. Returns None if the request failed."""
+        pace("request")
+        try:
+            response = self.page.request.get(
+                self.url,
+                headers={"X-Requested-With": "XMLHttpRequest"},
+            )
+        except PlaywrightError as e:
+            log.warning(f"Event list request failed: {e}")
+            return None
+
+        if not response.ok:
+            log.warning(f"Event list request failed: HTTP {response.status}")
+            return None
+        return parse_event_list(response.text())
+
+    def poll(self) -> EventDiff:
+        """Poll once, update the timeline and notify subscribers of changes."""
+        events = self.fetch()
+        if events is None:
+            return EventDiff()
+
+        diff = self.timeline.update(events)
+        diff.observed_at = time.monotonic()
+        if diff:
+            log.info(
+                f"Event list: +{len(diff.added)} ~{len(diff.changed)} -{len(diff.removed)}"
+                f" ({len(self.timeline)} in flight)"
+            )
+            for callback in self._subscribers:
+                callback(diff)
+        return diff
+
+    def next_interval(self, now: float | None = None) -> float:
+        """
+        Seconds until the next poll.
+
+        Polls faster as the next arrival approaches, and at the minimum
+        interval while any hostile fleet is in flight.
+        """
+        now = time.time() if now is None else now
+        if self.timeline.hostile():
+            return self.min_interval
+
+        upcoming = self.timeline.next_event(now)
+        if upcoming is None:
+            return self.max_interval
+
+        # Aim to poll a few times before the event lands
+        interval = (upcoming.arrival_time - now) / 4
+        return max(self.min_interval, min(self.max_interval, interval))
+
+    def run(self, duration: float | None = None, stop: Callable[[], bool] | None = None):
+        """
+        Poll in a loop at the adaptive interval.
+
+        Args:
+            duration: Stop after this many seconds (None = run forever)
+            stop: Optional callable; the loop ends when it returns True
+        """
+        deadline = None if duration is None else time.monotonic() + duration
+        while True:
+            self.poll()
+            if stop and stop():
+                return
+            wait = self.next_interval()
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                wait = min(wait, remaining)
+            self.page.wait_for_timeout(wait * 1000)
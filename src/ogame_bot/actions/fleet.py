@@ -1,15 +1,230 @@
 """Fleet actions for OGame."""
 
-from playwright.sync_api import Page, TimeoutError as PlaywrightTimeout
+import time
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING, Callable
 
+from playwright.sync_api import Error as PlaywrightError, Page, TimeoutError as PlaywrightTimeout
+
+from ..game_data import EXPEDITION_POSITION, Mission, STATIONARY_SHIPS
+from ..journal import DispatchJournal, JournalEntry
+from ..planner import MissionPlan, MissionRequest, Origin, plan_missions
+from ..snapshot import EmpireSnapshot
 from ..utils.delay import human_delay
+from ..utils.governor import pace
+from ..utils.log import elapsed_ms, get_logger, log_context
+
+if TYPE_CHECKING:
+    from ..supervisor import Supervisor
+
+log = get_logger(__name__)
+
+# Dispatch modes: click through the wizard, or hand the whole mission to the
+# game's own fleet dispatcher in one evaluate() call
+UI = "ui"
+SCRIPT = "script"
+DISPATCH_MODES = (UI, SCRIPT)
+
+# Target types for the dispatcher
+TARGET_PLANET = 1
+TARGET_DEBRIS = 2
+TARGET_MOON = 3
+
+# Runs in the fleet page. window.fleetDispatcher is the game's own wizard
+# state; its API is undocumented, so every member is checked before use and
+# the request it would send is posted directly, with its token.
+_DISPATCH_SCRIPT = """
+async ({ships, target, mission, speed}) => {
+    const fd = window.fleetDispatcher;
+    if (!fd || typeof fd !== "object") return {ok: false, missing: true};
+
+    const ids = [];
+    for (const li of document.querySelectorAll("li.technology[data-technology]")) {
+        ids.push([(li.getAttribute("aria-label") || "").toLowerCase(), Number(li.dataset.technology)]);
+    }
+    const form = new URLSearchParams();
+    form.set("token", fd.fleetSendingToken || fd.token || "");
+    for (const [name, amount] of Object.entries(ships)) {
+        const match = ids.find(([label]) => label.includes(name.toLowerCase()));
+        if (!match) return {ok: false, error: `ship not on planet: ${name}`};
+        const onPlanet = (fd.shipsOnPlanet || []).find(ship => Number(ship.id) === match[1]);
+        if (onPlanet && Number(onPlanet.number) < amount) {
+            return {ok: false, error: `only ${onPlanet.number} ${name}`};
+        }
+        if (typeof fd.selectShip === "function") fd.selectShip(match[1], amount);
+        form.set(`am${match[1]}`, String(amount));
+    }
+
+    const home = fd.currentPlanet || fd.targetPlanet || {};
+    const [galaxy, system, position, type] = target.map((value, i) =>
+        value ?? [home.galaxy, home.system, home.position, 1][i]);
+    fd.targetPlanet = Object.assign(fd.targetPlanet || {}, {galaxy, system, position, type});
+    fd.mission = mission;
+    fd.speedPercent = speed;
+    const fields = {
+        galaxy, system, position, type, mission, speed: Math.round(speed / 10),
+        metal: 0, crystal: 0, deuterium: 0, food: 0,
+        prioMetal: 1, prioCrystal: 2, prioDeuterium: 3, prioFood: 4,
+        holdingtime: 1, expeditiontime: 1, union: 0, retreatAfterDefenderRetreat: 0,
+    };
+    for (const [key, value] of Object.entries(fields)) form.set(key, String(value));
+
+    const url = new URL(location.href);
+    url.search = "?page=ingame&component=fleetdispatch&action=sendFleet&ajax=1&asJson=1";
+    const response = await fetch(url, {
+        method: "POST", body: form, credentials: "same-origin",
+        headers: {"X-Requested-With": "XMLHttpRequest"},
+    });
+    let data;
+    try {
+        data = await response.json();
+    } catch (e) {
+        return {ok: false, error: `HTTP ${response.status}, not JSON`};
+    }
+    const token = data.fleetSendingToken || data.newAjaxToken || data.token;
+    if (token) {
+        fd.fleetSendingToken = token;
+        if ("token" in fd) fd.token = token;
+    }
+    if (!data.success) {
+        const errors = (data.errors || []).map(e => e.message).filter(Boolean);
+        return {ok: false, error: errors.join("; ") || data.message || "rejected"};
+    }
+    return {ok: true, message: data.message || ""};
+}
+"""
+
+
+@dataclass
+class DispatchStats:
+    """Result of a batch of dispatches."""
+
+    sent: int = 0
+    attempted: int = 0
+    elapsed: float = 0.0  # seconds
+
+    @property
+    def per_minute(self) -> float:
+        """Missions sent per minute of batch time."""
+        if self.elapsed <= 0:
+            return 0.0
+        return self.sent * 60 / self.elapsed
 
 
 class Fleet:
     """Handle fleet operations."""
 
-    def __init__(self, page: Page):
+    # Mission button labels on the fleet wizard
+    MISSION_LABELS = {
+        Mission.ATTACK: "Atacar",
+        Mission.TRANSPORT: "Transportar",
+        Mission.DEPLOY: "Desplegar",
+        Mission.ESPIONAGE: "Espiar",
+        Mission.RECYCLE: "Recolectar",
+        Mission.EXPEDITION: "Expedición",
+    }
+
+    def __init__(
+        self,
+        page: Page,
+        human_delays: bool = True,
+        snapshot: EmpireSnapshot | None = None,
+        journal: DispatchJournal | None = None,
+        mode: str = UI,
+        supervisor: "Supervisor | None" = None,
+    ):
+        """
+        Args:
+            page: Game page
+            human_delays: Pause like a human before each click. Disable only
+                for time-critical actions such as fleetsaves.
+            snapshot: Empire snapshot to read cached state from and keep up to date
+            journal: Dispatch journal recording every farm attack, for resuming
+            mode: UI to click through the wizard, SCRIPT to send each mission
+                through the game's fleet dispatcher in one call (falls back to
+                the wizard on pages without it)
+            supervisor: Retries failed sends after recovering the page; the
+                fleet follows it to a new page after a reattach or relaunch
+        """
+        if mode not in DISPATCH_MODES:
+            raise ValueError(f"Unknown dispatch mode {mode!r}, expected one of {DISPATCH_MODES}")
         self.page = page
+        self.human_delays = human_delays
+        self.snapshot = snapshot
+        self.journal = journal
+        self.mode = mode
+        self.supervisor = supervisor
+        # Set once a send is submitted (button clicked or request posted) and
+        # its outcome isn't known yet; the fleet may have left
+        self._send_started = False
+
+    def _navigation(self):
+        from .navigation import Navigation
+        return Navigation(self.page, snapshot=self.snapshot)
+
+    def _record_sent(self, ships: dict[str, int]):
+        """Keep the cached inventory in step with ships that just left."""
+        if self.snapshot is None:
+            return
+        planet_id = self._navigation().current_planet_id()
+        if planet_id is not None:
+            self.snapshot.consume_ships(planet_id, ships)
+
+    def _settle(self, entry: JournalEntry | None, sent: bool):
+        """Record a send's outcome in the journal; one in doubt stays pending for reconcile()."""
+        if entry is None:
+            return
+        if sent:
+            self.journal.confirm(entry)
+        elif not self._send_started:
+            self.journal.fail(entry)
+
+    def _supervised(self, step_name: str, send: Callable[[], bool], restore: Callable[[], bool]) -> bool:
+        """
+        Run a send under the supervisor, if there is one.
+
+        Only failures before the send is submitted are retried. Once the
+        button was clicked (or the request posted) the fleet has probably
+        left, and sending again would hit the target twice, so the send
+        counts as done and the supervisor only recovers the page.
+
+        Args:
+            step_name: Name for the recovery log
+            send: The send, starting from the fleet page
+            restore: Gets back to the fleet page before a repeated attempt
+        """
+        self._send_started = False
+        if self.supervisor is None:
+            return send()
+
+        first = True
+
+        def attempt() -> bool:
+            nonlocal first
+            self.page = self.supervisor.page
+            if not first and not restore():
+                return False
+            if self._send_started:
+                log.warning(
+                    f"{step_name}: failed after the fleet was submitted, not sending it again",
+                    extra={"event": "send_in_doubt", "step": step_name},
+                )
+                return True
+            first = False
+            return send()
+
+        return self.supervisor.run(step_name, attempt, ok=bool)
+
+    def _open_fleet(self, planet: str) -> bool:
+        nav = self._navigation()
+        return nav.select_planet(planet) and nav.click_menu_by_text("Flota")
+
+    def _pause(self, action: str = "click"):
+        """Wait for the action governor, then like a human if enabled."""
+        pace(action)
+        if self.human_delays:
+            human_delay()
 
     def select_ship(self, ship_name: str, amount: int = 1) -> bool:
         """
@@ -19,40 +234,70 @@ class Fleet:
             ship_name: Ship name as it appears in aria-label (e.g., "Segador")
             amount: Number of ships to select
         """
-        print(f"Looking for ship '{ship_name}'...")
+        log.debug(f"Looking for ship '{ship_name}'...")
 
         try:
             # Find ship by aria-label
             ship_li = self.page.locator(f"li.technology[aria-label*='{ship_name}' i]").first
             ship_li.wait_for(state="visible", timeout=5000)
-            print(f"Found '{ship_name}'!")
+            log.debug(f"Found '{ship_name}'!")
 
             # Find the input within this li
             ship_input = ship_li.locator("input").first
             ship_input.wait_for(state="visible", timeout=2000)
-            human_delay()
+            self._pause()
             ship_input.fill(str(amount))
-            print(f"Set {amount} x {ship_name}")
+            log.debug(f"Set {amount} x {ship_name}")
             return True
 
         except PlaywrightTimeout:
-            print(f"Ship '{ship_name}' not found!")
+            log.warning(f"Ship '{ship_name}' not found!")
             return False
 
+    def read_ship_inventory(self) -> dict[str, int]:
+        """
+        Read the ships available on the current planet's fleet page.
+
+        Returns:
+            Dictionary of ship_name -> amount for every ship with amount > 0.
+            Ships that cannot fly (e.g., solar satellites) are excluded.
+        """
+        inventory: dict[str, int] = {}
+        ships = self.page.locator("li.technology")
+        for i in range(ships.count()):
+            ship = ships.nth(i)
+            try:
+                name = ship.get_attribute("aria-label", timeout=2000)
+                amount = ship.locator("span.amount").first.get_attribute("data-value", timeout=2000)
+            except PlaywrightTimeout:
+                continue
+            if not name or not amount or not amount.isdigit():
+                continue
+            if name in STATIONARY_SHIPS or int(amount) == 0:
+                continue
+            inventory[name] = int(amount)
+        log.debug(f"Ship inventory: {inventory}")
+
+        if self.snapshot is not None:
+            planet_id = self._navigation().current_planet_id()
+            if planet_id is not None:
+                self.snapshot.set_inventory(planet_id, inventory)
+        return inventory
+
     def click_next(self) -> bool:
         """Click the 'Siguiente' (Next) button."""
-        print("Clicking 'Siguiente'...")
+        log.debug("Clicking 'Siguiente'...")
 
         try:
             next_btn = self.page.locator("a:has-text('Siguiente'), button:has-text('Siguiente')").first
             next_btn.wait_for(state="visible", timeout=5000)
-            human_delay()
+            self._pause()
             next_btn.click()
             self.page.wait_for_load_state("networkidle")
-            print("Clicked 'Siguiente'")
+            log.debug("Clicked 'Siguiente'")
             return True
         except PlaywrightTimeout:
-            print("'Siguiente' button not found!")
+            log.warning("'Siguiente' button not found!")
             return False
 
     def set_coordinates(self, galaxy: str = None, system: str = None, position: str = None) -> bool:
@@ -64,7 +309,7 @@ class Fleet:
             system: System number (2nd input)
             position: Position number (3rd input) - use "16" for expeditions
         """
-        print("Setting coordinates...")
+        log.debug("Setting coordinates...")
 
         try:
             # Find the coordinates section
@@ -78,63 +323,112 @@ class Fleet:
 
             if inputs.count() >= 3:
                 if galaxy is not None:
-                    human_delay()
+                    self._pause()
                     inputs.nth(0).click()
                     inputs.nth(0).press("Meta+a")
                     inputs.nth(0).type(str(galaxy))
-                    print(f"  Galaxy: {galaxy}")
+                    log.debug(f"  Galaxy: {galaxy}")
                 if system is not None:
-                    human_delay()
+                    self._pause()
                     inputs.nth(1).click()
                     inputs.nth(1).press("Meta+a")
                     inputs.nth(1).type(str(system))
-                    print(f"  System: {system}")
+                    log.debug(f"  System: {system}")
                 if position is not None:
-                    human_delay()
+                    self._pause()
                     inputs.nth(2).click()
                     inputs.nth(2).press("Meta+a")
                     inputs.nth(2).type(str(position))
-                    print(f"  Position: {position}")
+                    log.debug(f"  Position: {position}")
                 return True
             else:
-                print(f"Expected 3 coordinate inputs, found {inputs.count()}")
+                log.warning(f"Expected 3 coordinate inputs, found {inputs.count()}")
                 return False
 
         except PlaywrightTimeout:
-            print("Coordinates section not found!")
+            log.warning("Coordinates section not found!")
             return False
 
     def select_expedition(self) -> bool:
         """Click the 'Expedición' mission button."""
-        print("Looking for 'Expedición' button...")
+        log.debug("Looking for 'Expedición' button...")
 
         try:
             exp_btn = self.page.locator("a:has-text('Expedición'), button:has-text('Expedición')").first
             exp_btn.wait_for(state="visible", timeout=10000)
-            human_delay()
+            self._pause()
             exp_btn.click()
-            print("Clicked 'Expedición'")
+            log.debug("Clicked 'Expedición'")
             return True
         except PlaywrightTimeout:
-            print("'Expedición' button not found!")
+            log.warning("'Expedición' button not found!")
+            return False
+
+    # Destination type buttons next to the coordinates
+    TARGET_BUTTONS = {
+        TARGET_PLANET: "#pbutton",
+        TARGET_DEBRIS: "#dbutton",
+        TARGET_MOON: "#mbutton",
+    }
+
+    def select_target_type(self, target_type: int) -> bool:
+        """Click the planet / debris field / moon button of the destination."""
+        log.debug(f"Selecting target type {target_type}...")
+
+        try:
+            button = self.page.locator(self.TARGET_BUTTONS[target_type]).first
+            button.wait_for(state="visible", timeout=5000)
+            self._pause()
+            button.click()
+            return True
+        except PlaywrightTimeout:
+            log.warning(f"Target type button {self.TARGET_BUTTONS[target_type]} not found!")
+            return False
+
+    def select_mission(self, mission: Mission) -> bool:
+        """Click the button for the given mission type."""
+        label = self.MISSION_LABELS.get(mission)
+        if label is None:
+            log.warning(f"No button label known for mission {mission.name}")
+            return False
+
+        log.debug(f"Looking for '{label}' button...")
+
+        try:
+            mission_btn = self.page.locator(f"a:has-text('{label}'), button:has-text('{label}')").first
+            mission_btn.wait_for(state="visible", timeout=10000)
+            self._pause()
+            mission_btn.click()
+            log.debug(f"Clicked '{label}'")
+            return True
+        except PlaywrightTimeout:
+            log.warning(f"'{label}' button not found!")
             return False
 
     def send_fleet(self) -> bool:
         """Click the 'Enviar Flota' button to dispatch the fleet."""
-        print("Looking for 'Enviar Flota' button...")
+        log.debug("Looking for 'Enviar Flota' button...")
 
         try:
             send_btn = self.page.locator("a:has-text('Enviar Flota'), button:has-text('Enviar Flota')").first
             send_btn.wait_for(state="visible", timeout=10000)
-            human_delay()
+            self._pause("dispatch")
+            self._send_started = True
             send_btn.click()
-            self.page.wait_for_load_state("networkidle")
-            print("Fleet sent!")
-            return True
         except PlaywrightTimeout:
-            print("'Enviar Flota' button not found!")
+            # A click that times out never happened
+            self._send_started = False
+            log.warning("'Enviar Flota' button not found!")
             return False
 
+        # The fleet is on its way once the click landed; a slow page after it changes nothing
+        try:
+            self.page.wait_for_load_state("networkidle")
+        except PlaywrightTimeout:
+            log.debug("Page slow to settle after sending")
+        log.debug("Fleet sent!")
+        return True
+
     def get_expedition_slots(self) -> tuple[int, int]:
         """
         Get current and max expedition slots from the fleet page.
@@ -143,7 +437,7 @@ class Fleet:
             Tuple of (current_expeditions, max_expeditions)
             e.g., (2, 6) means 2 expeditions running, 6 max
         """
-        print("Checking expedition slots...")
+        log.debug("Checking expedition slots...")
 
         try:
             # Look for "Expediciones" text and get the sibling/following element with the counter
@@ -154,7 +448,7 @@ class Fleet:
             # Try finding the next sibling or following element
             counter = exp_element.locator("xpath=following-sibling::*[1]").first
             counter_text = counter.text_content(timeout=2000)
-            print(f"Found counter to the right: {counter_text}")
+            log.debug(f"Found counter to the right: {counter_text}")
 
             # Parse "X/Y" pattern
             import re
@@ -162,18 +456,20 @@ class Fleet:
             if match:
                 current = int(match.group(1))
                 maximum = int(match.group(2))
-                print(f"Expeditions: {current}/{maximum} (available: {maximum - current})")
+                log.info(f"Expeditions: {current}/{maximum} (available: {maximum - current})")
+                if self.snapshot is not None:
+                    self.snapshot.set_expedition_slots(current, maximum)
                 return (current, maximum)
 
         except Exception as e:
-            print(f"First method failed: {e}")
+            log.debug(f"First method failed: {e}")
 
         # Fallback: look for pattern after "Expediciones" in text
         try:
             # Get text content after "Expediciones"
             parent = self.page.locator("*:has(> *:text('Expediciones'))").first
             full_text = parent.text_content(timeout=2000)
-            print(f"Parent text: {full_text}")
+            log.debug(f"Parent text: {full_text}")
 
             import re
             # Find the pattern AFTER "Expediciones" - use [\s\S]*? to match newlines
@@ -181,12 +477,14 @@ class Fleet:
             if match:
                 current = int(match.group(1))
                 maximum = int(match.group(2))
-                print(f"Expeditions: {current}/{maximum} (available: {maximum - current})")
+                log.info(f"Expeditions: {current}/{maximum} (available: {maximum - current})")
+                if self.snapshot is not None:
+                    self.snapshot.set_expedition_slots(current, maximum)
                 return (current, maximum)
         except Exception as e:
-            print(f"Fallback failed: {e}")
+            log.warning(f"Fallback failed: {e}")
 
-        print("Could not determine expedition slots, defaulting to 0 available")
+        log.warning("Could not determine expedition slots, defaulting to 0 available")
         return (0, 0)  # Safe default: assume no slots available  # Safe default: assume no slots available  # Safe default: assume no slots available  # Safe default: assume no slots available
 
     def get_available_expeditions(self) -> int:
@@ -194,27 +492,114 @@ class Fleet:
         current, maximum = self.get_expedition_slots()
         return maximum - current
 
-    def _send_single_attack(self, ships: dict[str, int], coords: tuple[int, int, int]) -> bool:
+    def dispatch(
+        self,
+        ships: dict[str, int],
+        coords: tuple[int, int, int],
+        mission: Mission,
+        target_type: int = TARGET_PLANET,
+        speed: int = 100,
+    ) -> bool:
         """
-        Send a single attack (assumes we're already on Flota page).
+        Send one mission (assumes we're already on Flota page).
 
         Args:
             ships: Dictionary of ship_name -> amount
             coords: Tuple of (galaxy, system, position)
+            mission: Mission type to select
+            target_type: TARGET_PLANET, TARGET_DEBRIS or TARGET_MOON
+            speed: Fleet speed in percent, 10-100 (script mode only)
 
         Returns:
-            True if attack was sent successfully
+            True if the fleet was sent
         """
-        from .navigation import Navigation
-        nav = Navigation(self.page)
+        start = time.monotonic()
+        self._send_started = False
+        with log_context(mission=mission.name.lower()):
+            sent = None
+            if self.mode == SCRIPT:
+                sent = self.dispatch_script(ships, coords, mission, target_type, speed)
+            via = SCRIPT if sent is not None else UI
+            if sent is None:
+                sent = self._run_wizard(ships, coords, mission, target_type)
+            if sent:
+                self._record_sent(ships)
+            galaxy, system, position = coords
+            log.info(
+                f"{mission.name.capitalize()} to [{galaxy}:{system}:{position}] "
+                f"{'sent' if sent else 'NOT sent'} ({elapsed_ms(start) / 1000:.1f}s)",
+                extra={"event": "dispatch", "target": list(coords), "ships": ships, "sent": sent,
+                       "via": via, "duration_ms": elapsed_ms(start)},
+            )
+        return sent
+
+    def dispatch_script(
+        self,
+        ships: dict[str, int],
+        coords: tuple[int | None, int | None, int],
+        mission: Mission,
+        target_type: int = TARGET_PLANET,
+        speed: int = 100,
+    ) -> bool | None:
+        """
+        Send one mission through the game's fleet dispatcher in a single evaluate().
+
+        Ship amounts, target, mission and speed are set on the page's
+        fleetDispatcher and submitted in the same call, instead of one
+        Playwright round trip per wizard field. The page is reloaded after a
+        send so the ship list and slot counter are current again, like after
+        the wizard.
+
+        Args:
+            ships: Dictionary of ship_name -> amount
+            coords: (galaxy, system, position); None keeps the current planet's value
+            mission: Mission type
+            target_type: TARGET_PLANET, TARGET_DEBRIS or TARGET_MOON
+            speed: Fleet speed in percent, 10-100
+
+        Returns:
+            True if sent, False if the game refused it or the call broke off
+            (the request may have been posted, so the wizard isn't tried),
+            None if the page has no fleet dispatcher (use the wizard instead)
+        """
+        pace("dispatch")
+        self._send_started = True
+        try:
+            result = self.page.evaluate(_DISPATCH_SCRIPT, {
+                "ships": ships,
+                "target": [*coords, target_type],
+                "mission": int(mission),
+                "speed": max(10, min(100, speed)),
+            })
+        except PlaywrightError as e:
+            log.warning(f"Script dispatch broke off, the fleet may have left: {e}")
+            return False
+
+        # The game answered, so the outcome is known
+        self._send_started = False
+        if result.get("missing"):
+            log.debug("No fleet dispatcher on this page, using the wizard")
+            return None
+        if not result.get("ok"):
+            log.warning(f"Script dispatch refused: {result.get('error')}")
+            return False
+
+        try:
+            pace("navigate")
+            self.page.reload(wait_until="domcontentloaded")
+        except PlaywrightTimeout:
+            log.warning("Fleet page slow to reload after dispatch")
+        return True
 
+    def _run_wizard(
+        self, ships: dict[str, int], coords: tuple[int, int, int], mission: Mission, target_type: int = TARGET_PLANET
+    ) -> bool:
         galaxy, system, position = coords
-        print(f"Target: [{galaxy}:{system}:{position}]")
 
         # Select ships
         for ship_name, amount in ships.items():
             if not self.select_ship(ship_name, amount):
-                print(f"Failed to select {ship_name}")
+                log.warning(f"Failed to select {ship_name}")
                 return False
 
         # Click next
@@ -224,16 +609,41 @@ class Fleet:
         # Set full coordinates
         if not self.set_coordinates(galaxy=str(galaxy), system=str(system), position=str(position)):
             return False
+        if target_type != TARGET_PLANET and not self.select_target_type(target_type):
+            return False
 
-        # Select attack mission
-        if not self.select_attack():
+        # Select mission
+        if not self.select_mission(mission):
             return False
 
         # Send the fleet
-        if not self.send_fleet():
+        return self.send_fleet()
+
+    def _send_single_attack(
+        self, ships: dict[str, int], coords: tuple[int, int, int], entry: JournalEntry | None = None
+    ) -> bool:
+        """
+        Send a single attack (assumes we're already on Flota page).
+
+        Args:
+            ships: Dictionary of ship_name -> amount
+            coords: Tuple of (galaxy, system, position)
+            entry: Journal entry of the attack, confirmed once it is sent
+
+        Returns:
+            True if attack was sent successfully
+        """
+        nav = self._navigation()
+
+        galaxy, system, position = coords
+        log.info(f"Target: [{galaxy}:{system}:{position}]")
+
+        sent = self.dispatch(ships, coords, Mission.ATTACK)
+        if not sent:
             return False
+        self._settle(entry, sent)
 
-        print(f"Attack sent to [{galaxy}:{system}:{position}]!")
+        log.info(f"Attack sent to [{galaxy}:{system}:{position}]!")
 
         # Go back to Flota for next attack
         nav.click_menu_by_text("Flota")
@@ -242,20 +652,26 @@ class Fleet:
 
     def select_attack(self) -> bool:
         """Click the 'Atacar' mission button."""
-        print("Looking for 'Atacar' button...")
+        log.debug("Looking for 'Atacar' button...")
 
         try:
             attack_btn = self.page.locator("a:has-text('Atacar'), button:has-text('Atacar')").first
             attack_btn.wait_for(state="visible", timeout=10000)
-            human_delay()
+            self._pause()
             attack_btn.click()
-            print("Clicked 'Atacar'")
+            log.debug("Clicked 'Atacar'")
             return True
         except PlaywrightTimeout:
-            print("'Atacar' button not found!")
+            log.warning("'Atacar' button not found!")
             return False
 
-    def send_farm_attacks(self, planet: str, ships: dict[str, int], targets: list[tuple[int, int, int]]) -> int:
+    def send_farm_attacks(
+        self,
+        planet: str,
+        ships: dict[str, int],
+        targets: list[tuple[int, int, int]],
+        resume: bool = False,
+    ) -> int:
         """
         Send farm attacks to multiple coordinates.
 
@@ -263,16 +679,19 @@ class Fleet:
             planet: Name of the planet to send from
             ships: Dictionary of ship_name -> amount
             targets: List of coordinate tuples [(galaxy, system, position), ...]
+            resume: Skip targets the journal shows were hit within its cooldown
 
         Returns:
             Number of attacks successfully sent
         """
-        from .navigation import Navigation
-        nav = Navigation(self.page)
+        nav = self._navigation()
+        if resume and self.journal:
+            targets = self.journal.skip_recent(targets)
+            if not targets:
+                log.info("Every target was hit recently, nothing to resume")
+                return 0
 
-        print(f"\n{'='*50}")
-        print(f"Starting farm attacks from {planet}: {len(targets)} targets")
-        print(f"{'='*50}\n")
+        log.info(f"Starting farm attacks from {planet}: {len(targets)} targets")
 
         # Navigate to planet and fleet menu once
         if not nav.select_planet(planet):
@@ -282,15 +701,18 @@ class Fleet:
 
         sent = 0
         for i, coords in enumerate(targets):
-            print(f"\n--- Attack {i + 1} of {len(targets)} ---")
-            if self._send_single_attack(ships, coords):
+            log.info(f"Attack {i + 1} of {len(targets)}")
+            # Journal first, once per target: a crash mid-wizard leaves a pending
+            # entry to reconcile, and supervised retries reuse the same entry
+            entry = self.journal.begin(coords, Mission.ATTACK, ships, planet) if self.journal else None
+            attack = partial(self._send_single_attack, ships, coords, entry)
+            if self._supervised("attack", attack, restore=partial(self._open_fleet, planet)):
                 sent += 1
             else:
-                print(f"Failed to send attack to {coords}")
+                self._settle(entry, False)
+                log.warning(f"Failed to send attack to {coords}")
 
-        print(f"\n{'='*50}")
-        print(f"Farm attacks complete! Sent {sent}/{len(targets)}")
-        print(f"{'='*50}\n")
+        log.info(f"Farm attacks complete! Sent {sent}/{len(targets)}")
         return sent
 
     def send_expedition(self, planet: str, ships: dict[str, int]) -> bool:
@@ -304,10 +726,9 @@ class Fleet:
         Returns:
             True if expedition was sent successfully
         """
-        from .navigation import Navigation
-        nav = Navigation(self.page)
+        nav = self._navigation()
 
-        print(f"\n=== Sending Expedition from {planet} ===")
+        log.info(f"Sending expedition from {planet}")
 
         # Navigate to planet
         if not nav.select_planet(planet):
@@ -317,10 +738,27 @@ class Fleet:
         if not nav.click_menu_by_text("Flota"):
             return False
 
+        expedition = partial(self._send_single_expedition, ships)
+        if not self._supervised("expedition", expedition, restore=partial(self._open_fleet, planet)):
+            return False
+
+        log.info("Expedition sent!")
+        return True
+
+    def _send_single_expedition(self, ships: dict[str, int]) -> bool:
+        """Send one expedition (assumes we're already on Flota page)."""
+        self._send_started = False
+        if self.mode == SCRIPT:
+            sent = self.dispatch_script(ships, (None, None, EXPEDITION_POSITION), Mission.EXPEDITION)
+            if sent is not None:
+                if sent:
+                    self._record_sent(ships)
+                return sent
+
         # Select ships
         for ship_name, amount in ships.items():
             if not self.select_ship(ship_name, amount):
-                print(f"Failed to select {ship_name}")
+                log.warning(f"Failed to select {ship_name}")
                 return False
 
         # Click next
@@ -328,7 +766,7 @@ class Fleet:
             return False
 
         # Set position to 16 (expedition)
-        if not self.set_coordinates(position="16"):
+        if not self.set_coordinates(position=str(EXPEDITION_POSITION)):
             return False
 
         # Select expedition mission
@@ -338,25 +776,221 @@ class Fleet:
         # Send the fleet
         if not self.send_fleet():
             return False
-
-        print("=== Expedition Sent! ===\n")
+        self._record_sent(ships)
         return True
 
+    def send_expeditions(self, planet: str, ships: dict[str, int], count: int | None = None) -> "DispatchStats":
+        """
+        Send several expeditions from one planet without leaving the fleet page.
+
+        The planet and fleet menu are resolved once. After each send the game
+        lands back on the fleet page, so the slot counter is re-read from there
+        instead of navigating again.
+
+        Args:
+            planet: Name of the planet to send from
+            ships: Dictionary of ship_name -> amount, used for every expedition
+            count: Maximum expeditions to send (default: fill every free slot)
+
+        Returns:
+            DispatchStats with sent count and throughput
+        """
+        nav = self._navigation()
+        stats = DispatchStats()
+
+        log.info(f"Sending expeditions from {planet}")
+
+        if not nav.select_planet(planet):
+            return stats
+        if not nav.click_menu_by_text("Flota"):
+            return stats
+
+        available = self.get_available_expeditions()
+        target = available if count is None else min(count, available)
+        log.info(f"{available} expedition slots available, sending {target}")
+
+        started = time.monotonic()
+        failures = 0
+        while stats.sent < target and failures < 2:
+            stats.attempted += 1
+            log.info(f"Expedition {stats.sent + 1} of {target}")
+            expedition = partial(self._send_single_expedition, ships)
+            if self._supervised("expedition", expedition, restore=partial(self._open_fleet, planet)):
+                stats.sent += 1
+                failures = 0
+            else:
+                failures += 1
+                log.warning("Expedition failed")
+
+            if stats.sent < target:
+                if not self._ensure_on_fleet_page(self._navigation()):
+                    break
+                # Slots may have changed (fleet returned, failed send, ...)
+                target = min(target, stats.sent + self.get_available_expeditions())
+
+        stats.elapsed = time.monotonic() - started
+        log.info(f"Sent {stats.sent} expeditions ({stats.per_minute:.1f}/min)")
+        return stats
+
+    def _ensure_on_fleet_page(self, nav) -> bool:
+        """Make sure the ship list is showing, clicking Flota only if it isn't."""
+        try:
+            self.page.locator("li.technology").first.wait_for(state="visible", timeout=5000)
+            return True
+        except PlaywrightTimeout:
+            return nav.click_menu_by_text("Flota")
+
+    def collect_origins(self, planets: tuple[str, ...]) -> tuple[list[Origin], int]:
+        """
+        Read the ship inventory of each named planet.
+
+        Inventories still fresh in the snapshot are used as-is; only the
+        other planets' fleet pages are visited.
+
+        Returns:
+            Tuple of (origins, free expedition slots). Slots are account-wide,
+            so they are read once from the first fleet page visited.
+        """
+        nav = self._navigation()
+
+        known = nav.list_planets()
+        origins: list[Origin] = []
+        free_slots: int | None = None
+
+        for name in planets:
+            planet = next((p for p in known if name.lower() in p.name.lower()), None)
+            if planet is None:
+                log.warning(f"Planet '{name}' not found!")
+                continue
+
+            inventory = self.snapshot.inventory(planet.planet_id) if self.snapshot else None
+            if inventory is None:
+                if not nav.open_fleet_page(planet):
+                    continue
+                if free_slots is None:
+                    free_slots = self.get_available_expeditions()
+                inventory = self.read_ship_inventory()
+            else:
+                log.debug(f"Using cached inventory of {planet.name}")
+            origins.append(Origin(planet.name, planet.coords, inventory))
+
+        if free_slots is None:
+            cached = self.snapshot.expedition_slots() if self.snapshot else None
+            if cached is not None:
+                free_slots = cached[1] - cached[0]
+            elif origins and nav.click_menu_by_text("Flota"):
+                free_slots = self.get_available_expeditions()
+
+        return origins, free_slots or 0
+
+    def _report_plan(self, plan: MissionPlan):
+        for origin, assignments in plan.by_origin().items():
+            log.info(f"  {origin}: {len(assignments)} missions")
+        if plan.unassigned:
+            log.info(f"  {len(plan.unassigned)} missions left out (not enough ships)")
+
+    def _origin_order(self, plan: MissionPlan) -> list[str]:
+        """Origins to visit, starting with the planet the game page is showing."""
+        nav = self._navigation()
+        current = nav.current_planet_id()
+        ids = {planet.name: planet.planet_id for planet in nav.list_planets()}
+        return sorted(plan.by_origin(), key=lambda name: current is None or ids.get(name) != current)
+
+    def send_distributed_expeditions(
+        self, planets: tuple[str, ...], ships: dict[str, int], count: int | None = None
+    ) -> DispatchStats:
+        """
+        Spread expeditions over several origin planets.
+
+        Each expedition is assigned to the planet that can supply it with the
+        shortest flight, then expeditions are sent grouped by planet.
+
+        Args:
+            planets: Candidate origin planet names
+            ships: Ship config used for every expedition
+            count: Maximum expeditions to send (default: fill every free slot)
+
+        Returns:
+            Combined DispatchStats of every origin
+        """
+        origins, free_slots = self.collect_origins(planets)
+        total = DispatchStats()
+        if not origins:
+            return total
+
+        wanted = free_slots if count is None else min(count, free_slots)
+        requests = [MissionRequest(Mission.EXPEDITION, ships) for _ in range(wanted)]
+        plan = plan_missions(requests, origins)
+        log.info(f"Expedition plan ({len(plan.assignments)} of {wanted}):")
+        self._report_plan(plan)
+
+        for origin in self._origin_order(plan):
+            stats = self.send_expeditions(origin, ships, count=len(plan.by_origin()[origin]))
+            total.sent += stats.sent
+            total.attempted += stats.attempted
+            total.elapsed += stats.elapsed
+        return total
+
+    def send_distributed_farm_attacks(
+        self,
+        planets: tuple[str, ...],
+        ships: dict[str, int],
+        targets: list[tuple[int, int, int]],
+        resume: bool = False,
+    ) -> int:
+        """
+        Spread farm attacks over several origin planets.
+
+        Targets are assigned to origins so total flight time is minimised,
+        then attacks are sent grouped by planet. They are sent one after
+        another from a single tab: the game keeps the current planet and the
+        fleet send token per session, not per tab, so sends from several tabs
+        would go out from the wrong planet or be refused.
+
+        Args:
+            planets: Candidate origin planet names
+            ships: Ship config used for every attack
+            targets: Coordinates to attack
+            resume: Skip targets the journal shows were hit within its cooldown
+
+        Returns:
+            Number of attacks successfully sent
+        """
+        if resume and self.journal:
+            targets = self.journal.skip_recent(targets)
+            if not targets:
+                log.info("Every target was hit recently, nothing to resume")
+                return 0
+
+        origins, _ = self.collect_origins(planets)
+        if not origins:
+            return 0
+
+        requests = [MissionRequest(Mission.ATTACK, ships, target) for target in targets]
+        plan = plan_missions(requests, origins)
+        log.info(f"Farm plan ({len(plan.assignments)} of {len(targets)} targets):")
+        self._report_plan(plan)
+
+        groups = plan.by_origin()
+        sent = 0
+        for origin in self._origin_order(plan):
+            sent += self.send_farm_attacks(origin, ships, [a.target for a in groups[origin]])
+        return sent
+
     def debug_list_ships(self):
         """Debug: Print info about all ship slots found."""
-        print("\n=== DEBUG: Listing all ship slots ===")
+        log.info("Listing all ship slots")
 
         ships = self.page.locator("li.technology")
         count = ships.count()
-        print(f"Found {count} ships:")
+        log.info(f"Found {count} ships:")
 
         for i in range(count):
             ship = ships.nth(i)
             try:
                 label = ship.get_attribute("aria-label")
                 status = ship.get_attribute("data-status")
-                print(f"  [{i+1}]: {label} (status: {status})")
+                log.info(f"  [{i+1}]: {label} (status: {status})")
             except:
-                print(f"  [{i+1}]: (couldn't read)")
+                log.info(f"  [{i+1}]: (couldn't read)")
 
-        print("=== END DEBUG ===\n")
@@ -0,0 +1,242 @@
+"""Galaxy view data fetched straight from the game's AJAX endpoint."""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from playwright.sync_api import Page, Error as PlaywrightError
+
+from ..activity import ActivityStore
+from ..utils.governor import pace
+from ..utils.log import get_logger
+from ..utils.urls import game_url
+
+log = get_logger(__name__)
+
+# planetType values in galaxy content
+PLANET = 1
+DEBRIS = 2
+MOON = 3
+
+
+@dataclass(frozen=True)
+class GalaxyObservation:
+    """What the galaxy view shows for one position."""
+
+    coords: tuple[int, int, int]
+    player: str | None
+    # Minutes since the owner was last active: 0 for "*" (within 15 min),
+    # 15-59 for a shown idle time, None when no activity marker is shown
+    activity: int | None
+    debris: tuple[int, int, int]  # metal, crystal, deuterium
+    has_moon: bool = False
+
+    @property
+    def active(self) -> bool:
+        """Owner was active within the last 15 minutes."""
+        return self.activity is not None and self.activity < 15
+
+    @property
+    def debris_total(self) -> int:
+        return sum(self.debris)
+
+
+def _activity(planet: dict[str, Any]) -> int | None:
+    info = planet.get("activity") or {}
+    shown = info.get("showActivity")
+    if not shown:
+        return None
+    if int(shown) <= 15:
+        return 0
+    idle = info.get("idleTime")
+    return int(idle) if idle is not None else int(shown)
+
+
+def _amount(resources: dict[str, Any], name: str) -> int:
+    value = resources.get(name) or 0
+    if isinstance(value, dict):
+        value = value.get("amount") or 0
+    return int(float(value))
+
+
+def parse_galaxy_content(data: dict[str, Any]) -> list[GalaxyObservation]:
+    """
+    Turn a fetchGalaxyContent JSON response into one observation per occupied position.
+
+    Positions with nothing on them (no planet and no debris) are left out.
+    """
+    system = data.get("system") or {}
+    observations = []
+    for slot in system.get("galaxyContent") or []:
+        try:
+            coords = (int(slot["galaxy"]), int(slot["system"]), int(slot["position"]))
+        except (KeyError, TypeError, ValueError):
+            continue
+
+        player = (slot.get("player") or {}).get("playerName") or None
+        activity = None
+        debris = (0, 0, 0)
+        has_moon = False
+        found = False
+
+        for planet in slot.get("planets") or []:
+            kind = planet.get("planetType")
+            if kind == PLANET:
+                activity = _activity(planet)
+                found = True
+            elif kind == MOON:
+                has_moon = True
+                moon_activity = _activity(planet)
+                if moon_activity is not None and (activity is None or moon_activity < activity):
+                    activity = moon_activity
+            elif kind == DEBRIS:
+                resources = planet.get("resources") or {}
+                debris = (
+                    _amount(resources, "metal"),
+                    _amount(resources, "crystal"),
+                    _amount(resources, "deuterium"),
+                )
+                found = found or sum(debris) > 0
+
+        if found:
+            observations.append(GalaxyObservation(coords, player, activity, debris, has_moon))
+    return observations
+
+
+class Galaxy:
+    """Read galaxy systems without opening the galaxy page."""
+
+    def __init__(self, page: Page):
+        self.page = page
+
+    def fetch_system(self, galaxy: int, system: int) -> list[GalaxyObservation] | None:
+        """
+        Fetch one solar system's galaxy view.
+
+        Returns:
+            Observations for occupied positions, or None if the request failed
+        """
+        url = game_url(
+            self.page.url, page="ingame", component="galaxy", action="fetchGalaxyContent", ajax=1, asJson=1
+        )
+        pace("request")
+        try:
+            response = self.page.request.post(
+                url,
+                form={"galaxy": str(galaxy), "system": str(system)},
+                headers={"X-Requested-With": "XMLHttpRequest"},
+            )
+        except PlaywrightError as e:
+            log.warning(f"Galaxy request for {galaxy}:{system} failed: {e}")
+            return None
+
+        if not response.ok:
+            log.warning(f"Galaxy request for {galaxy}:{system} failed: HTTP {response.status}")
+            return None
+        try:
+            return parse_galaxy_content(response.json())
+        except ValueError:
+            log.warning(f"Galaxy response for {galaxy}:{system} is not JSON (session expired?)")
+            return None
+
+
+class ActivitySampler:
+    """
+    Periodically record activity and debris of a set of targets.
+
+    Targets are grouped by solar system, so each sample costs one request
+    per system rather than one per target.
+    """
+
+    def __init__(
+        self,
+        page: Page,
+        store: ActivityStore,
+        targets: list[tuple[int, int, int]],
+        interval: float = 900,
+        fold_every: float = 6 * 3600,
+    ):
+        """
+        Args:
+            page: Logged-in game page
+            store: Where samples are appended
+            targets: Coordinates to watch
+            interval: Seconds between samples
+            fold_every: Seconds between folding old raw samples into hourly counts
+        """
+        self.galaxy = Galaxy(page)
+        self.page = page
+        self.store = store
+        self.targets = [tuple(target) for target in targets]
+        self.interval = interval
+        self.fold_every = fold_every
+        self.last_sample: float | None = None
+        self.last_fold: float | None = None
+
+    def sample(self) -> int:
+        """
+        Fetch every watched system once and record its targets.
+
+        Returns:
+            Number of targets recorded
+        """
+        systems: dict[tuple[int, int], list[tuple[int, int, int]]] = {}
+        for target in self.targets:
+            systems.setdefault(target[:2], []).append(target)
+
+        at = time.time()
+        recorded = 0
+        for (galaxy, system), targets in systems.items():
+            observations = self.galaxy.fetch_system(galaxy, system)
+            if observations is None:
+                continue
+            seen = {obs.coords: obs for obs in observations}
+            samples = []
+            for target in targets:
+                obs = seen.get(target)
+                # Nothing at the position: no activity and no debris to see
+                samples.append((target, obs.activity if obs else None, obs.debris_total if obs else 0))
+            self.store.record(samples, at=at)
+            recorded += len(samples)
+
+        self.last_sample = time.monotonic()
+        log.info(f"Activity sample: {recorded}/{len(self.targets)} targets in {len(systems)} systems")
+        self._fold_if_due()
+        return recorded
+
+    def _fold_if_due(self):
+        """Fold old raw samples on the first sample and every `fold_every` after it, however long we run."""
+        if self.last_fold is not None and time.monotonic() - self.last_fold < self.fold_every:
+            return
+        self.last_fold = time.monotonic()
+        folded = self.store.downsample()
+        if folded:
+            log.info(f"Folded {folded} old activity samples into hourly counts")
+
+    def sample_if_due(self) -> bool:
+        """Take a sample if the interval has passed; for calling from other loops."""
+        if self.last_sample is not None and time.monotonic() - self.last_sample < self.interval:
+            return False
+        self.sample()
+        return True
+
+    def run(self, duration: float | None = None, stop: Callable[[], bool] | None = None):
+        """
+        Sample at the configured interval.
+
+        Args:
+            duration: Stop after this many seconds (None = run forever)
+            stop: Optional callable; the loop ends when it returns True
+        """
+        deadline = None if duration is None else time.monotonic() + duration
+        while True:
+            self.sample()
+            if stop and stop():
+                return
+            wait = self.interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                wait = min(wait, remaining)
+            self.page.wait_for_timeout(wait * 1000)
@@ -0,0 +1,159 @@
+"""Send collectors to the debris fields of a HarvestQueue."""
+
+import time
+from typing import Callable
+
+from playwright.sync_api import Page
+
+from ..game_data import EXPEDITION_HOLD, Mission
+from ..harvest import HarvestQueue, HarvestStats, debris_fields, nearby_systems
+from ..mission_config import HarvestConfig
+from ..snapshot import EmpireSnapshot
+from ..utils.log import get_logger
+from .events import EventListPoller, FleetEvent, fleet_landings
+from .fleet import TARGET_DEBRIS, Fleet
+from .galaxy import Galaxy
+from .navigation import Navigation
+
+log = get_logger(__name__)
+
+
+class Harvester:
+    """
+    Keep a debris queue current from the galaxy view and harvest it.
+
+    The systems around each origin are watched; each cycle fetches only the
+    systems that are due, plus the position 16 of systems our expeditions
+    are finishing in, then sends collectors down the ranked queue.
+    """
+
+    def __init__(
+        self,
+        page: Page,
+        config: HarvestConfig,
+        snapshot: EmpireSnapshot | None = None,
+        fleet: Fleet | None = None,
+        refresh: float = 1800,
+        universe_speed: float = 1.0,
+    ):
+        """
+        Args:
+            page: Logged-in game page
+            config: Origins, watch radius and smallest field worth a trip
+            snapshot: Empire snapshot for cached planets and inventories
+            fleet: Fleet used to send (default: a UI fleet on the page)
+            refresh: Seconds between scans of a watched system
+            universe_speed: Fleet speed multiplier of the universe
+        """
+        self.page = page
+        self.config = config
+        self.snapshot = snapshot
+        self.fleet = fleet or Fleet(page, snapshot=snapshot)
+        self.galaxy = Galaxy(page)
+        self.queue = HarvestQueue(min_total=config.min_debris, refresh=refresh)
+        self.stats = HarvestStats()
+        self.universe_speed = universe_speed
+
+    def watch_expeditions(self, events: list[FleetEvent]):
+        """Rescan position 16 where our expeditions finish, when they finish."""
+        now = time.time()
+        for event in events:
+            if event.hostile or event.mission != Mission.EXPEDITION or event.destination is None:
+                continue
+            # The hold is over once the fleet is on its way back
+            at = now if event.is_return else event.arrival_time + EXPEDITION_HOLD
+            self.queue.schedule(event.destination[:2], at)
+
+    def refresh(self) -> int:
+        """
+        Fetch the systems that are due.
+
+        Returns:
+            Number of fields that are new or changed size
+        """
+        changed = 0
+        for galaxy, system in self.queue.due():
+            observations = self.galaxy.fetch_system(galaxy, system)
+            if observations is None:
+                continue
+            changed += self.queue.update((galaxy, system), debris_fields(observations))
+        return changed
+
+    def harvest(self) -> int:
+        """
+        Send collectors down the ranked queue from every origin.
+
+        Returns:
+            Number of fields collectors were sent to
+        """
+        origins, _ = self.fleet.collect_origins(self.config.planets)
+        for origin in origins:
+            self.queue.watch(
+                system for system in nearby_systems(origin.coords, self.config.radius)
+                if system not in self.queue.next_scan
+            )
+        self.refresh()
+
+        jobs = self.queue.rank(origins, universe_speed=self.universe_speed)
+        if not jobs:
+            return 0
+        log.info(f"Harvest queue: {len(jobs)} fields to collect")
+
+        nav = Navigation(self.fleet.page, snapshot=self.snapshot)
+        known = {planet.name: planet for planet in nav.list_planets()}
+        sent = 0
+        for job in jobs:
+            planet = known.get(job.origin.name)
+            if planet is None or not nav.open_fleet_page(planet):
+                continue
+            if not self.fleet.dispatch(job.ships, job.field.coords, Mission.RECYCLE, target_type=TARGET_DEBRIS):
+                continue
+            self.queue.claim(job.field.coords, time.time() + job.flight_time)
+            self.stats.record(job)
+            sent += 1
+            galaxy, system, position = job.field.coords
+            log.info(
+                f"Collectors to [{galaxy}:{system}:{position}]: {job.load} of {job.field.total} resources "
+                f"({job.rate * 3600:.0f}/h of round trip)",
+                extra={"event": "harvest", "target": list(job.field.coords), "ships": job.ships,
+                       "load": job.load, "flight_time": round(job.flight_time)},
+            )
+        return sent
+
+    def run(self, interval: float = 600, duration: float | None = None, stop: Callable[[], bool] | None = None):
+        """
+        Harvest every `interval` seconds.
+
+        Args:
+            interval: Seconds between cycles
+            duration: Stop after this many seconds (None = run forever)
+            stop: Optional callable; the loop ends when it returns True
+        """
+        poller = EventListPoller(self.page)
+        deadline = None if duration is None else time.monotonic() + duration
+        while True:
+            events = poller.fetch()
+            if events is not None:
+                self.watch_expeditions(events)
+                if self.snapshot is not None:
+                    # Collectors that are back by the next cycle are counted again
+                    self.snapshot.expect_landings(fleet_landings(events))
+            self.harvest()
+            self.report()
+            if stop and stop():
+                return
+            wait = interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                wait = min(wait, remaining)
+            self.page.wait_for_timeout(wait * 1000)
+
+    def report(self):
+        expected = self.stats.expected()
+        if expected or self.stats.loads:
+            log.info(
+                f"Expected harvest so far: {expected} resources ({self.stats.per_hour():.0f}/h, from scanned field sizes)",
+                extra={"event": "harvest_rate", "expected": expected, "per_hour": round(self.stats.per_hour())},
+            )
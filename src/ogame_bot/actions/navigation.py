@@ -1,8 +1,17 @@
 """Navigation actions for OGame."""
 
+import re
+
 from playwright.sync_api import Page, TimeoutError as PlaywrightTimeout
 
+from ..game_data import PlanetInfo
+from ..snapshot import EmpireSnapshot
 from ..utils.delay import human_delay
+from ..utils.governor import pace
+from ..utils.urls import game_url
+from ..utils.log import get_logger
+
+log = get_logger(__name__)
 
 
 class Navigation:
@@ -12,22 +21,27 @@ class Navigation:
     PLANET_LIST = "#planetList"
     PLANET_ITEM = ".smallplanet"
     PLANET_NAME = ".planet-name"
+    PLANET_COORDS = ".planet-koords"
 
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, snapshot: EmpireSnapshot | None = None):
         self.page = page
+        self.snapshot = snapshot
 
     def select_planet(self, name: str) -> bool:
         """
         Select a planet by name.
         Returns True if successful.
         """
-        print(f"Looking for planet '{name}'...")
+        log.debug(f"Looking for planet '{name}'...")
+
+        if self._select_cached_planet(name):
+            return True
 
         # Find all planets in the list
         planets = self.page.locator(f"{self.PLANET_LIST} {self.PLANET_ITEM}")
 
         count = planets.count()
-        print(f"Found {count} planets")
+        log.debug(f"Found {count} planets")
 
         for i in range(count):
             planet = planets.nth(i)
@@ -35,21 +49,104 @@ class Navigation:
 
             try:
                 planet_name = planet_name_el.text_content(timeout=2000)
-                print(f"  Planet {i+1}: {planet_name}")
+                log.debug(f"  Planet {i+1}: {planet_name}")
 
                 if planet_name and name.lower() in planet_name.lower():
-                    print(f"Found '{name}'! Clicking...")
+                    log.debug(f"Found '{name}'! Clicking...")
+                    pace("navigate")
                     human_delay()
                     planet.click()
                     self.page.wait_for_load_state("networkidle")
-                    print(f"Selected planet: {name}")
+                    log.debug(f"Selected planet: {name}")
                     return True
             except PlaywrightTimeout:
                 continue
 
-        print(f"Planet '{name}' not found!")
+        log.warning(f"Planet '{name}' not found!")
         return False
 
+    def _select_cached_planet(self, name: str) -> bool:
+        """Click a planet straight by its cached id (unless it is showing), skipping the name scan."""
+        cached = self.snapshot.planets() if self.snapshot else None
+        planet = next((p for p in cached or [] if name.lower() in p.name.lower()), None)
+        if planet is None:
+            return False
+        if planet.planet_id == self.current_planet_id():
+            log.debug(f"{planet.name} is already selected")
+            return True
+
+        try:
+            item = self.page.locator(f"#planet-{planet.planet_id}")
+            item.wait_for(state="visible", timeout=2000)
+            pace("navigate")
+            human_delay()
+            item.click()
+            self.page.wait_for_load_state("networkidle")
+            log.debug(f"Selected planet: {planet.name} (cached)")
+            return True
+        except PlaywrightTimeout:
+            # Planet list changed since the snapshot; rediscover it
+            self.snapshot.invalidate("planets")
+            return False
+
+    def current_planet_id(self) -> int | None:
+        """Id of the planet the game page is showing."""
+        try:
+            raw = self.page.locator("meta[name='ogame-planet-id']").get_attribute("content", timeout=2000)
+        except PlaywrightTimeout:
+            return None
+        return int(raw) if raw and raw.isdigit() else None
+
+    def list_planets(self) -> list[PlanetInfo]:
+        """Read every planet's name, id and coordinates from the planet list."""
+        cached = self.snapshot.planets() if self.snapshot else None
+        if cached:
+            return cached
+
+        planets = self.page.locator(f"{self.PLANET_LIST} {self.PLANET_ITEM}")
+        found = []
+
+        for i in range(planets.count()):
+            planet = planets.nth(i)
+            try:
+                element_id = planet.get_attribute("id", timeout=2000) or ""
+                name = planet.locator(self.PLANET_NAME).text_content(timeout=2000) or ""
+                coords_text = planet.locator(self.PLANET_COORDS).text_content(timeout=2000) or ""
+            except PlaywrightTimeout:
+                continue
+
+            match = re.search(r"(\d+):(\d+):(\d+)", coords_text)
+            planet_id = element_id.removeprefix("planet-")
+            if not match or not planet_id.isdigit():
+                continue
+            coords = (int(match.group(1)), int(match.group(2)), int(match.group(3)))
+            found.append(PlanetInfo(name=name.strip(), planet_id=int(planet_id), coords=coords))
+
+        log.debug(f"Found {len(found)} planets: {[p.name for p in found]}")
+        if self.snapshot and found:
+            self.snapshot.set_planets(found)
+        return found
+
+    def open_fleet_page(self, planet: PlanetInfo) -> bool:
+        """
+        Load the fleet dispatch page of a planet directly by its id.
+
+        One navigation instead of selecting the planet and clicking the menu.
+        """
+        return self.open_component(planet, "fleetdispatch")
+
+    def open_component(self, planet: PlanetInfo, component: str) -> bool:
+        """Load a game page (e.g., "supplies", "research") of a planet by its id."""
+        url = game_url(self.page.url, page="ingame", component=component, cp=planet.planet_id)
+        log.debug(f"Opening {component} of {planet.name}...")
+        try:
+            pace("navigate")
+            self.page.goto(url, wait_until="domcontentloaded")
+            return True
+        except PlaywrightTimeout:
+            log.warning(f"Failed to open {component} of {planet.name}")
+            return False
+
     def go_to_menu(self, menu: str) -> bool:
         """
         Navigate to a menu item (e.g., 'fleet', 'overview', 'resources').
@@ -67,20 +164,21 @@ class Navigation:
 
         menu_id = menu_map.get(menu.lower())
         if not menu_id:
-            print(f"Unknown menu: {menu}")
+            log.warning(f"Unknown menu: {menu}")
             return False
 
-        print(f"Navigating to {menu}...")
+        log.debug(f"Navigating to {menu}...")
         menu_link = self.page.locator(f"#menuTable a[data-component='{menu_id}']")
 
         try:
+            pace("navigate")
             human_delay()
             menu_link.click()
             self.page.wait_for_load_state("networkidle")
-            print(f"Now in: {menu}")
+            log.debug(f"Now in: {menu}")
             return True
         except PlaywrightTimeout:
-            print(f"Failed to navigate to {menu}")
+            log.warning(f"Failed to navigate to {menu}")
             return False
 
     def get_current_planet(self) -> str | None:
@@ -99,17 +197,18 @@ class Navigation:
         """
         Click on a menu item by its visible text.
         """
-        print(f"Looking for menu '{text}'...")
+        log.debug(f"Looking for menu '{text}'...")
 
         try:
             # Look for the text in the menu area
             menu_item = self.page.locator(f"#menuTable >> text='{text}'").first
             menu_item.wait_for(state="visible", timeout=5000)
+            pace("navigate")
             human_delay()
             menu_item.click()
             self.page.wait_for_load_state("networkidle")
-            print(f"Clicked on '{text}'")
+            log.debug(f"Clicked on '{text}'")
             return True
         except PlaywrightTimeout:
-            print(f"Menu '{text}' not found!")
+            log.warning(f"Menu '{text}' not found!")
             return False
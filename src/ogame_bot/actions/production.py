@@ -0,0 +1,166 @@
+"""Building and research actions for OGame."""
+
+import re
+import time
+from dataclasses import dataclass
+
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeout
+
+from ..economy import RESOURCES, Tech
+from ..utils.delay import human_delay
+from ..utils.governor import pace
+from ..utils.log import get_logger
+
+log = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class ResourceState:
+    """Resources of a planet at one moment, with what is needed to project them."""
+
+    amounts: tuple[float, float, float]  # metal, crystal, deuterium
+    rates: tuple[float, float, float]  # per second; 0 when unknown
+    storage: tuple[float, float, float]
+    observed_at: float  # unix time
+
+    def projected(self, at: float) -> tuple[float, float, float]:
+        """Resources expected at a later time (production stops at the storage cap)."""
+        elapsed = max(0.0, at - self.observed_at)
+        return tuple(
+            amount if amount >= cap else min(cap, amount + rate * elapsed)
+            for amount, rate, cap in zip(self.amounts, self.rates, self.storage)
+        )
+
+    def affordable_at(self, cost: tuple[int, int, int]) -> float | None:
+        """
+        Earliest unix time at which cost is covered.
+
+        Returns None if it never will be (over storage cap, or no production).
+        """
+        wait = 0.0
+        for amount, rate, cap, needed in zip(self.amounts, self.rates, self.storage, cost):
+            if needed <= amount:
+                continue
+            if needed > cap or rate <= 0:
+                return None
+            wait = max(wait, (needed - amount) / rate)
+        return self.observed_at + wait
+
+
+# Reads the game's own resource bar state: amounts, storage and production per second
+_RESOURCES_SCRIPT = """
+() => {
+    const bar = window.resourcesBar && window.resourcesBar.resources;
+    if (!bar) return null;
+    const pick = name => bar[name] && {
+        amount: bar[name].amount,
+        storage: bar[name].storage,
+        production: bar[name].production,
+    };
+    return {metal: pick("metal"), crystal: pick("crystal"), deuterium: pick("deuterium")};
+}
+"""
+
+
+class Production:
+    """Handle buildings and research on the current planet."""
+
+    def __init__(self, page: Page):
+        self.page = page
+
+    def read_resources(self) -> ResourceState:
+        """Read resources, storage and production from the current page."""
+        now = time.time()
+        data = self.page.evaluate(_RESOURCES_SCRIPT)
+        if data and all(data.get(name) for name in RESOURCES):
+            state = ResourceState(
+                amounts=tuple(float(data[name]["amount"]) for name in RESOURCES),
+                rates=tuple(float(data[name]["production"] or 0) for name in RESOURCES),
+                storage=tuple(float(data[name]["storage"]) for name in RESOURCES),
+                observed_at=now,
+            )
+        else:
+            # Older markup: amounts only, so nothing can be projected
+            log.warning("Resource bar data not found, reading amounts only")
+            amounts = []
+            for name in RESOURCES:
+                raw = self.page.locator(f"#resources_{name}").get_attribute("data-raw", timeout=5000)
+                amounts.append(float(raw or 0))
+            state = ResourceState(
+                amounts=tuple(amounts),
+                rates=(0.0, 0.0, 0.0),
+                storage=(float("inf"),) * 3,
+                observed_at=now,
+            )
+        log.debug(f"Resources: {[int(a) for a in state.amounts]} (+{[round(r * 3600) for r in state.rates]}/h)")
+        return state
+
+    def read_levels(self) -> dict[int, int]:
+        """Read tech id -> level for every tech on the current page."""
+        levels: dict[int, int] = {}
+        techs = self.page.locator("li.technology[data-technology]")
+        for i in range(techs.count()):
+            tech = techs.nth(i)
+            try:
+                tech_id = tech.get_attribute("data-technology", timeout=2000)
+                level = tech.locator("span.level").first.get_attribute("data-value", timeout=2000)
+            except PlaywrightTimeout:
+                continue
+            if tech_id and tech_id.isdigit() and level and level.isdigit():
+                levels[int(tech_id)] = int(level)
+        return levels
+
+    # Sidebar boxes showing each queue's running item, on every game page
+    PRODUCTION_BOXES = {
+        "building": "#productionboxbuildingcomponent",
+        "research": "#productionboxresearchcomponent",
+    }
+
+    def read_queue_end(self, kind: str = "building") -> float | None:
+        """
+        When a queue frees up, read from the current page.
+
+        The queue's production box is read first, since it shows the running
+        item from any page (a facilities build seen from the supplies page,
+        say); the active tech on the page is the fallback.
+
+        Args:
+            kind: "building" or "research"
+
+        Returns:
+            Unix time the running build/research ends, now if the queue is
+            busy but the end time can't be read, or None if the queue is free.
+        """
+        box = self.PRODUCTION_BOXES[kind]
+        active = "li.technology[data-status='active']"
+        ends = self.page.locator(f"{box} [data-end], {active} [data-end]")
+        for i in range(ends.count()):
+            raw = ends.nth(i).get_attribute("data-end")
+            if raw and raw.isdigit():
+                return float(raw)
+
+        # Fall back to a countdown like "1h 20m 5s"
+        running = self.page.locator(f"{box} .countdown, {active}")
+        if running.count() == 0:
+            return None
+        text = running.first.text_content() or ""
+        units = {"d": 86400, "h": 3600, "m": 60, "s": 1}
+        seconds = sum(int(n) * units[u] for n, u in re.findall(r"(\d+)\s*([dhms])", text))
+        return time.time() + seconds
+
+    def upgrade(self, tech: Tech) -> bool:
+        """Click the upgrade button of a tech on the current page."""
+        log.info(f"Upgrading {tech.key}...")
+
+        try:
+            button = self.page.locator(f"li.technology[data-technology='{tech.tech_id}'] button.upgrade").first
+            button.wait_for(state="visible", timeout=5000)
+            pace("click")
+            human_delay()
+            button.click()
+            self.page.wait_for_load_state("networkidle")
+            log.info(f"Queued {tech.key}")
+            return True
+        except PlaywrightTimeout:
+            log.warning(f"Upgrade button for {tech.key} not found (not affordable or queue busy?)")
+            return False
@@ -0,0 +1,277 @@
+"""Append-only columnar store of galaxy samples and activity-by-hour queries."""
+
+import json
+import os
+import time
+from array import array
+from pathlib import Path
+from typing import Iterable
+
+Coords = tuple[int, int, int]
+
+# Column name -> array typecode. Rows are aligned by index across columns.
+RAW_COLUMNS = {
+    "time": "I",  # unix seconds
+    "target": "H",  # index into the target list
+    "activity": "b",  # minutes since last activity, -1 = no marker
+    "debris": "I",  # total debris resources, clipped to uint32
+}
+HOURLY_COLUMNS = {
+    "hour": "I",  # unix time of the start of the hour
+    "target": "H",
+    "samples": "H",
+    "active": "H",  # samples with the owner active within 15 minutes
+}
+ACTIVE_MINUTES = 15
+NO_ACTIVITY = -1
+UINT32_MAX = 2**32 - 1
+
+
+class _Columns:
+    """
+    A set of aligned append-only column files in one directory.
+
+    A crash mid-append can leave columns of different lengths, or a file
+    ending in part of a value; the shortest column marks the last complete
+    row. Reads ignore anything past it, and the files are cut back to it
+    before the next append so new rows line up again.
+    """
+
+    def __init__(self, directory: Path, prefix: str, columns: dict[str, str]):
+        self.paths = {name: directory / f"{prefix}.{name}" for name in columns}
+        self.codes = columns
+        self.sizes = {name: array(code).itemsize for name, code in columns.items()}
+
+    def _rows(self) -> int:
+        """Complete rows on disk."""
+        return min(
+            (path.stat().st_size if path.exists() else 0) // self.sizes[name]
+            for name, path in self.paths.items()
+        )
+
+    def read(self) -> dict[str, array]:
+        rows = self._rows()
+        data = {}
+        for name, code in self.codes.items():
+            column = array(code)
+            path = self.paths[name]
+            if path.exists():
+                with path.open("rb") as handle:
+                    column.frombytes(handle.read(rows * self.sizes[name]))
+            data[name] = column
+        return data
+
+    def repair(self):
+        """Cut every column file back to the last complete row."""
+        rows = self._rows()
+        for name, path in self.paths.items():
+            if path.exists() and path.stat().st_size != rows * self.sizes[name]:
+                with path.open("r+b") as handle:
+                    handle.truncate(rows * self.sizes[name])
+
+    def append(self, rows: dict[str, Iterable[int]]):
+        self.repair()
+        for name, code in self.codes.items():
+            with self.paths[name].open("ab") as handle:
+                array(code, rows[name]).tofile(handle)
+
+    def rewrite(self, data: dict[str, array]):
+        for name in self.codes:
+            path = self.paths[name]
+            tmp = path.with_suffix(path.suffix + ".tmp")
+            with tmp.open("wb") as handle:
+                data[name].tofile(handle)
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(tmp, path)
+
+
+class ActivityStore:
+    """
+    Activity and debris samples per target, kept compact on disk.
+
+    Raw samples take 11 bytes each, one file per column, and are only ever
+    appended. downsample() folds raw samples older than `raw_days` into
+    per-hour counts (samples, active), which is all the hour-of-day
+    queries need, so the store stays small however long it runs.
+    """
+
+    SCHEMA_VERSION = 1
+
+    def __init__(self, directory: Path, raw_days: float = 14):
+        """
+        Args:
+            directory: Folder holding the column files
+            raw_days: Days of raw samples to keep before folding them into hourly counts
+        """
+        self.directory = directory
+        self.raw_days = raw_days
+        self.raw = _Columns(directory, "raw", RAW_COLUMNS)
+        self.hourly = _Columns(directory, "hourly", HOURLY_COLUMNS)
+        self.targets: list[Coords] = []
+        self._index: dict[Coords, int] = {}
+        self._load_meta()
+
+    @property
+    def _meta_path(self) -> Path:
+        return self.directory / "meta.json"
+
+    def _load_meta(self):
+        if not self._meta_path.exists():
+            return
+        with self._meta_path.open("r", encoding="utf-8") as handle:
+            meta = json.load(handle)
+        if meta.get("schema") != self.SCHEMA_VERSION:
+            raise ValueError(f"Activity store {self.directory} is from another version")
+        self.targets = [tuple(coords) for coords in meta["targets"]]
+        self._index = {coords: index for index, coords in enumerate(self.targets)}
+
+    def _save_meta(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = self._meta_path.with_suffix(".tmp")
+        with tmp.open("w", encoding="utf-8") as handle:
+            json.dump({"schema": self.SCHEMA_VERSION, "targets": [list(c) for c in self.targets]}, handle)
+        os.replace(tmp, self._meta_path)
+
+    def _target_index(self, coords: Coords) -> int:
+        coords = tuple(coords)
+        if coords not in self._index:
+            self._index[coords] = len(self.targets)
+            self.targets.append(coords)
+            self._save_meta()
+        return self._index[coords]
+
+    # === Writing ===
+
+    def record(self, samples: Iterable[tuple[Coords, int | None, int]], at: float | None = None):
+        """
+        Append one sample per target.
+
+        Args:
+            samples: (coords, minutes since activity or None, debris total) tuples
+            at: Unix time of the samples (default: now)
+        """
+        at = int(time.time() if at is None else at)
+        rows = {name: [] for name in RAW_COLUMNS}
+        for coords, activity, debris in samples:
+            rows["time"].append(at)
+            rows["target"].append(self._target_index(coords))
+            rows["activity"].append(NO_ACTIVITY if activity is None else min(int(activity), 127))
+            rows["debris"].append(min(int(debris), UINT32_MAX))
+        if rows["time"]:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self.raw.append(rows)
+
+    def downsample(self, now: float | None = None) -> int:
+        """
+        Fold raw samples older than raw_days into hourly counts.
+
+        Returns:
+            Number of raw samples folded
+        """
+        now = time.time() if now is None else now
+        cutoff = now - self.raw_days * 86400
+        raw = self.raw.read()
+        old = [i for i, t in enumerate(raw["time"]) if t < cutoff]
+        if not old:
+            return 0
+
+        buckets: dict[tuple[int, int], list[int]] = {}
+        for i in old:
+            key = (raw["time"][i] - raw["time"][i] % 3600, raw["target"][i])
+            counts = buckets.setdefault(key, [0, 0])
+            counts[0] += 1
+            counts[1] += 0 <= raw["activity"][i] < ACTIVE_MINUTES
+        self.hourly.append({
+            "hour": [hour for hour, _ in buckets],
+            "target": [target for _, target in buckets],
+            "samples": [min(counts[0], 65535) for counts in buckets.values()],
+            "active": [min(counts[1], 65535) for counts in buckets.values()],
+        })
+
+        # Hourly counts go first: a crash before the rewrite below double counts
+        # a few hours rather than losing them
+        old_set = set(old)
+        keep = [i for i in range(len(raw["time"])) if i not in old_set]
+        self.raw.rewrite({
+            name: array(code, (raw[name][i] for i in keep)) for name, code in RAW_COLUMNS.items()
+        })
+        return len(old)
+
+    # === Queries ===
+
+    def _hour_counts(self) -> dict[int, tuple[list[int], list[int]]]:
+        """(samples, active) per local hour of day for every target, in one pass."""
+        counts: dict[int, tuple[list[int], list[int]]] = {}
+
+        def add(target: int, t: int, samples: int, active: int):
+            if target not in counts:
+                counts[target] = ([0] * 24, [0] * 24)
+            hour = time.localtime(t).tm_hour
+            counts[target][0][hour] += samples
+            counts[target][1][hour] += active
+
+        raw = self.raw.read()
+        for t, target, activity in zip(raw["time"], raw["target"], raw["activity"]):
+            add(target, t, 1, 0 <= activity < ACTIVE_MINUTES)
+        hourly = self.hourly.read()
+        for t, target, samples, active in zip(
+            hourly["hour"], hourly["target"], hourly["samples"], hourly["active"]
+        ):
+            add(target, t, samples, active)
+        return counts
+
+    def activity_by_hour(self, coords: Coords) -> list[float | None]:
+        """
+        Probability that a target's owner is active, per local hour of day.
+
+        Returns:
+            24 values (index = hour 0-23); None for hours with no samples
+        """
+        return self._profile(self._hour_counts(), coords)
+
+    def _profile(self, counts: dict, coords: Coords) -> list[float | None]:
+        index = self._index.get(tuple(coords))
+        if index not in counts:
+            return [None] * 24
+        samples, active = counts[index]
+        return [active[h] / samples[h] if samples[h] else None for h in range(24)]
+
+    def activity_at(self, coords: Coords, at: float) -> float | None:
+        """Probability the owner is active at the local hour of a unix time."""
+        return self.activity_by_hour(coords)[time.localtime(at).tm_hour]
+
+    def last_debris(self, coords: Coords) -> int | None:
+        """Debris seen at a target in its most recent sample."""
+        index = self._index.get(tuple(coords))
+        if index is None:
+            return None
+        raw = self.raw.read()
+        for i in range(len(raw["time"]) - 1, -1, -1):
+            if raw["target"][i] == index:
+                return raw["debris"][i]
+        return None
+
+    def rank_targets(
+        self, targets: list[Coords], arrival: dict[Coords, float] | None = None, unknown: float = 0.5
+    ) -> list[tuple[Coords, float]]:
+        """
+        Order targets from least to most likely to be active when the fleet lands.
+
+        Args:
+            targets: Target coordinates
+            arrival: Unix arrival time per target (default: now)
+            unknown: Probability assumed for hours with no samples
+
+        Returns:
+            (coords, activity probability) pairs, least active first; ties keep
+            the original order
+        """
+        now = time.time()
+        counts = self._hour_counts()
+        ranked = []
+        for coords in targets:
+            at = (arrival or {}).get(tuple(coords), now)
+            probability = self._profile(counts, coords)[time.localtime(at).tm_hour]
+            ranked.append((tuple(coords), unknown if probability is None else probability))
+        return sorted(ranked, key=lambda item: item[1])
@@ -1,19 +1,52 @@
 """Main OGame bot class."""
 
-from playwright.sync_api import Page
+import time
+from pathlib import Path
+
+from playwright.sync_api import Error as PlaywrightError, Page
 
 from .config import OGameConfig
 from .browser import BrowserManager
 from .login import LoginHandler, LoginError
+from .activity import ActivityStore
+from .actions.events import EventListPoller, FleetEvent, fleet_landings
+from .actions.fleet import Fleet
+from .actions.galaxy import ActivitySampler
+from .actions.harvest import Harvester
+from .actions.navigation import Navigation
+from .actions.production import Production
+from .build_queue import BuildQueueExecutor
+from .economy import get_tech
+from .game_data import flight_time
+from .journal import DispatchJournal
+from .mission_config import BuildPlan, HarvestConfig
+from .snapshot import EmpireSnapshot
+from .fleetsave import FleetsaveEngine
+from .profiling import RunProfiler
+from .supervisor import Supervisor
+from .utils.governor import ActionGovernor, get_governor, pace, set_governor
+from .utils.log import current_account, get_logger
+
+log = get_logger(__name__)
 
 
 class OGameBot:
     """Main bot orchestrator."""
 
-    def __init__(self, config: OGameConfig | None = None):
+    def __init__(self, config: OGameConfig | None = None, profiler: RunProfiler | None = None):
         self.config = config or OGameConfig.from_env()
+        self.profiler = profiler
+        self.snapshot = EmpireSnapshot.load(Path(self.config.snapshot_path).expanduser())
+        # Every page action of this process shares one governor; the account
+        # key keeps each account's budget separate
+        set_governor(ActionGovernor.per_minute(self.config.actions_per_minute))
+        current_account.set(self.config.account)
         self.browser_manager = BrowserManager(self.config)
         self._game_page: Page | None = None
+        self._fleetsave: FleetsaveEngine | None = None
+        self._journal: DispatchJournal | None = None
+        self.activity = ActivityStore(Path(self.config.activity_dir).expanduser())
+        self.supervisor = Supervisor(self)
 
     def __enter__(self) -> "OGameBot":
         self.start()
@@ -25,12 +58,18 @@ class OGameBot:
     def start(self):
         """Start the bot - launch browser and login."""
         if self.config.is_first_run:
-            print("First run detected! You'll need to log in with Google once.")
-            print("Your session will be saved for future runs.\n")
+            log.info("First run detected! You'll need to log in with Google once.")
+            log.info("Your session will be saved for future runs.")
+
+        self._launch(manual_login=True)
+        log.info("Bot ready!")
 
-        print(f"Opening Chrome and navigating to {self.config.lobby_url}...")
+    def _launch(self, manual_login: bool):
+        log.info(f"Opening Chrome and navigating to {self.config.lobby_url}...")
 
         self.browser_manager.start()
+        if self.profiler:
+            self.profiler.attach(self.browser_manager.context)
         lobby_page = self.browser_manager.goto_lobby()
 
         login_handler = LoginHandler(lobby_page, self.browser_manager.context)
@@ -39,12 +78,12 @@ class OGameBot:
             # Try automatic login (just clicking Play buttons)
             self._game_page = login_handler.login()
         except LoginError as e:
-            print(f"\nAutomatic login failed: {e}")
+            if not manual_login:
+                raise
+            log.warning(f"Automatic login failed: {e}")
             # Fall back to manual login
             self._game_page = login_handler.wait_for_manual_login()
 
-        print("Bot ready!")
-
     @property
     def page(self) -> Page:
         """Get the game page."""
@@ -54,7 +93,68 @@ class OGameBot:
 
     def stop(self):
         """Stop the bot."""
+        if self.profiler:
+            self.profiler.detach()
         self.browser_manager.stop()
+        self.snapshot.save()
+        if self._journal:
+            self._journal.close()
+        waited = get_governor().waited
+        if waited:
+            log.info(f"Action governor held actions back for {waited:.0f}s in total")
+        self.supervisor.stats.report()
+
+    # === Recovery (used by the supervisor) ===
+
+    def reload_page(self):
+        """Reload the game page where it is."""
+        pace("navigate")
+        self.page.reload(wait_until="domcontentloaded")
+
+    def reattach(self) -> bool:
+        """
+        Find the game tab again, logging in automatically if there is none.
+
+        Returns:
+            True if a game page is attached
+        """
+        login_handler = LoginHandler(self.browser_manager.page, self.browser_manager.context)
+        page = login_handler.find_game_page()
+        if page is None:
+            try:
+                page = login_handler.login()
+            except LoginError as e:
+                log.warning(f"Couldn't get back into the game: {e}")
+                return False
+        self._set_game_page(page)
+        return True
+
+    def relaunch(self) -> bool:
+        """
+        Close the browser and start a new one, logging in automatically.
+
+        Returns:
+            True if the new browser is in the game
+        """
+        if self.profiler:
+            self.profiler.detach()
+        try:
+            self.browser_manager.stop()
+        except PlaywrightError as e:
+            log.debug(f"Closing the old browser failed: {e}")
+        self._game_page = None
+        try:
+            self._launch(manual_login=False)
+        except LoginError as e:
+            log.warning(f"Relaunched browser couldn't log in: {e}")
+            return False
+        self._set_game_page(self._game_page)
+        return True
+
+    def _set_game_page(self, page: Page):
+        self._game_page = page
+        # The fleetsave engine holds the old page; it's rebuilt on next use
+        self._fleetsave = None
 
     # === Actions (to be implemented) ===
 
@@ -63,17 +163,205 @@ class OGameBot:
         # TODO: Parse resource bar
         raise NotImplementedError("Resource parsing not yet implemented")
 
-    def build(self, building: str):
-        """Queue a building upgrade."""
-        # TODO: Navigate to building and click upgrade
-        raise NotImplementedError("Building not yet implemented")
+    def build(self, building: str, planet: str | None = None) -> bool:
+        """
+        Queue a building upgrade.
+
+        Args:
+            building: Building key (e.g., "metal_mine")
+            planet: Planet to build on (default: the current planet)
+        """
+        tech = get_tech(building)
+        if tech.kind != "building":
+            raise ValueError(f"'{building}' is not a building")
+        return self._upgrade(tech, planet)
+
+    def research(self, tech: str, planet: str | None = None) -> bool:
+        """
+        Queue a research.
+
+        Args:
+            tech: Research key (e.g., "energy_technology")
+            planet: Planet whose lab runs the research (default: the current planet)
+        """
+        research = get_tech(tech)
+        if research.kind != "research":
+            raise ValueError(f"'{tech}' is not a research")
+        return self._upgrade(research, planet)
+
+    def _upgrade(self, tech, planet: str | None) -> bool:
+        nav = Navigation(self.page, snapshot=self.snapshot)
+        if planet is None:
+            menu = "resources" if tech.component == "supplies" else tech.component
+            if not nav.go_to_menu(menu):
+                return False
+        else:
+            target = next((p for p in nav.list_planets() if planet.lower() in p.name.lower()), None)
+            if target is None or not nav.open_component(target, tech.component):
+                log.warning(f"Planet '{planet}' not found!")
+                return False
+        return Production(self.page).upgrade(tech)
+
+    def run_build_plan(self, plan: BuildPlan, until: float | None = None) -> int:
+        """
+        Work through a build/research plan, sleeping until each item is feasible.
+
+        Returns:
+            Number of items queued
+        """
+        return BuildQueueExecutor(self.page, plan, snapshot=self.snapshot).run(until=until)
+
+    @property
+    def journal(self) -> DispatchJournal:
+        """Dispatch journal of farm attacks (opened on first use)."""
+        if self._journal is None:
+            self._journal = DispatchJournal.open(
+                Path(self.config.journal_path).expanduser(),
+                cooldown=self.config.farm_cooldown * 60,
+            )
+        return self._journal
+
+    def reconcile_journal(self) -> int:
+        """
+        Settle journal entries a crashed run left unconfirmed, using the event list.
+
+        Returns:
+            Number of pending entries that turned out to be in flight
+        """
+        pending = self.journal.pending()
+        if not pending:
+            return 0
+        events = EventListPoller(self.page).fetch()
+        if events is None:
+            log.warning(f"Couldn't read the event list; {len(pending)} journal entries stay unconfirmed")
+            return 0
+        confirmed, failed = self.journal.reconcile(events)
+        log.info(f"Journal: {confirmed} unconfirmed missions found in flight, {failed} never left")
+        self.note_fleet_landings(events)
+        return confirmed
+
+    def note_fleet_landings(self, events: list[FleetEvent] | None = None):
+        """
+        Stop trusting cached ship inventories once our fleets land on those planets.
+
+        Ships that left were subtracted from the cache; this makes the next run
+        read the planet again once they are back.
+
+        Args:
+            events: Event list already fetched (default: fetch it now)
+        """
+        if events is None:
+            events = EventListPoller(self.page).fetch()
+            if events is None:
+                return
+        landed = self.snapshot.expect_landings(fleet_landings(events))
+        log.debug(f"Fleets landing on {landed} planets", extra={"event": "fleet_landings", "planets": landed})
+
+    def track_activity(
+        self, targets: list[tuple[int, int, int]], interval: float = 900, duration: float | None = None
+    ) -> ActivitySampler:
+        """
+        Sample the activity and debris of targets from the galaxy view.
+
+        Args:
+            targets: Coordinates to watch
+            interval: Seconds between samples
+            duration: Seconds to run (None = until interrupted)
+        """
+        sampler = ActivitySampler(self.page, self.activity, targets, interval=interval)
+        sampler.run(duration=duration)
+        return sampler
+
+    def harvest(
+        self, config: HarvestConfig, interval: float = 600, duration: float | None = None
+    ) -> Harvester:
+        """
+        Keep sending recyclers (and pathfinders, to position 16) to the debris fields around the origins.
+
+        Args:
+            config: Origins, watch radius and smallest field worth a trip
+            interval: Seconds between harvest cycles
+            duration: Seconds to run (None = until interrupted)
+        """
+        fleet = Fleet(self.page, snapshot=self.snapshot, mode=self.config.dispatch_mode)
+        harvester = Harvester(self.page, config, snapshot=self.snapshot, fleet=fleet)
+        try:
+            harvester.run(interval=interval, duration=duration)
+        finally:
+            harvester.report()
+        return harvester
+
+    def order_farm_targets(
+        self, planets: tuple[str, ...], ships: dict[str, int], targets: list[tuple[int, int, int]]
+    ) -> list[tuple[int, int, int]]:
+        """
+        Order farm targets so the ones least likely to be online when the fleet lands go first.
 
-    def research(self, tech: str):
-        """Queue a research."""
-        # TODO: Navigate to research and click
-        raise NotImplementedError("Research not yet implemented")
+        Arrival hours are estimated from the first origin planet. Targets with
+        no activity samples keep their place among equally likely ones.
+        """
+        if not self.activity.targets:
+            return targets
 
-    def fleetsave(self):
-        """Send fleet on expedition to protect from raids."""
-        # TODO: Implement fleetsave
-        raise NotImplementedError("Fleetsave not yet implemented")
+        known = Navigation(self.page, snapshot=self.snapshot).list_planets()
+        origin = next((p for p in known if planets[0].lower() in p.name.lower()), None)
+        arrival = {}
+        if origin is not None:
+            now = time.time()
+            arrival = {tuple(t): now + flight_time(origin.coords, t, ships) for t in targets}
+
+        ranked = self.activity.rank_targets(targets, arrival)
+        likely_online = sum(probability >= 0.5 for _, probability in ranked)
+        if likely_online:
+            log.info(f"{likely_online} farm targets are likely online at arrival; sending them last")
+        return [coords for coords, _ in ranked]
+
+    @property
+    def fleetsave_engine(self) -> FleetsaveEngine:
+        """Fleetsave engine with a save plan for every planet (built on first use)."""
+        if self._fleetsave is None:
+            self._fleetsave = FleetsaveEngine(self.page, snapshot=self.snapshot)
+            self._fleetsave.refresh_all()
+        return self._fleetsave
+
+    def fleetsave(self, planet: str | None = None) -> int:
+        """
+        Send planets' fleets away on their save plans right now.
+
+        Each planet's plan is picked by the fleetsave engine ahead of time
+        (by default, every ship on an expedition to position 16 of its system).
+
+        Args:
+            planet: Name of the planet to save (default: every planet)
+
+        Returns:
+            Number of planets whose fleet was sent
+        """
+        engine = self.fleetsave_engine
+        plans = [
+            plan for plan in engine.plans.values()
+            if planet is None or planet.lower() in plan.planet.name.lower()
+        ]
+        if not plans:
+            log.warning(f"No save plan for {planet or 'any planet'}")
+            return 0
+
+        saved = sum(engine.fire(plan) for plan in plans)
+        engine.latency.report()
+        return saved
+
+    def watch_fleetsave(self, duration: float | None = None) -> FleetsaveEngine:
+        """
+        Poll the event list and fleetsave any planet with a hostile fleet inbound.
+
+        Args:
+            duration: Seconds to watch (None = until interrupted)
+        """
+        engine = self.fleetsave_engine
+        poller = EventListPoller(self.page)
+        engine.watch(poller)
+        try:
+            poller.run(duration=duration)
+        finally:
+            engine.latency.report()
+        return engine
@@ -1,8 +1,14 @@
 """Browser management using Playwright."""
 
+from pathlib import Path
+
 from playwright.sync_api import sync_playwright, BrowserContext, Page
 
 from .config import OGameConfig
+from .har import scrub_har
+from .utils.log import get_logger
+
+log = get_logger(__name__)
 
 
 class BrowserManager:
@@ -13,6 +19,8 @@ class BrowserManager:
         self._playwright = None
         self._context: BrowserContext | None = None
         self._page: Page | None = None
+        self._launches = 0
+        self._har_path: str | None = None  # HAR archive of the current browser
 
     def __enter__(self) -> "BrowserManager":
         self.start()
@@ -25,6 +33,19 @@ class BrowserManager:
         """Start Chrome with existing user profile and return page."""
         self._playwright = sync_playwright().start()
 
+        if self.config.record_har and self.config.replay_har:
+            raise ValueError("Cannot record and replay a HAR archive at the same time")
+
+        self._launches += 1
+        record_options = {}
+        if self.config.record_har:
+            self._har_path = self._numbered_har(self.config.record_har, self._launches)
+            log.info(f"Recording traffic to {self._har_path}")
+            record_options = {
+                "record_har_path": self._har_path,
+                "record_har_content": "embed",
+            }
+
         # Use persistent context to access existing Chrome profile with Google login
         self._context = self._playwright.chromium.launch_persistent_context(
             user_data_dir=self.config.chrome_user_data_dir,
@@ -33,19 +54,41 @@ class BrowserManager:
             slow_mo=self.config.slow_mo,
             viewport={"width": 1920, "height": 1080},
             args=["--start-maximized", "--disable-blink-features=AutomationControlled"],
+            **record_options,
         )
 
+        if self.config.replay_har:
+            # Requests missing from the archive fail instead of reaching the real server
+            log.info(f"Replaying traffic from {self.config.replay_har} (offline)")
+            self._context.route_from_har(self.config.replay_har, not_found="abort")
+
         # Always create a fresh page for navigation
         self._page = self._context.new_page()
 
         return self._page
 
+    @staticmethod
+    def _numbered_har(path: str, launch: int) -> str:
+        """HAR path of a launch; a relaunched browser records beside the first (session.2.har, ...)."""
+        if launch == 1:
+            return path
+        path = Path(path)
+        return str(path.with_name(f"{path.stem}.{launch}{path.suffix}"))
+
     def stop(self):
         """Close browser and cleanup."""
-        if self._context:
-            self._context.close()
-        if self._playwright:
-            self._playwright.stop()
+        context, playwright = self._context, self._playwright
+        self._context = self._playwright = self._page = None
+        try:
+            if context:
+                # The HAR archive is only written when the context closes
+                context.close()
+        finally:
+            if playwright:
+                playwright.stop()
+        if context and self._har_path and Path(self._har_path).exists():
+            scrubbed = scrub_har(self._har_path)
+            log.info(f"Saved {self._har_path} ({scrubbed} secrets scrubbed)")
 
     @property
     def page(self) -> Page:
@@ -66,9 +109,9 @@ class BrowserManager:
         url = self.config.lobby_url
 
         # Debug: show all tabs before
-        print(f"Tabs before navigation: {[p.url for p in self._context.pages]}")
+        log.debug(f"Tabs before navigation: {[p.url for p in self._context.pages]}")
 
-        print(f"Navigating to {url}...")
+        log.debug(f"Navigating to {url}...")
         self.page.goto(url, wait_until="domcontentloaded")
         self.page.wait_for_load_state("networkidle")
 
@@ -76,15 +119,15 @@ class BrowserManager:
         self.page.wait_for_timeout(2000)
 
         # Debug: show all tabs after
-        print(f"Tabs after navigation: {[p.url for p in self._context.pages]}")
+        log.debug(f"Tabs after navigation: {[p.url for p in self._context.pages]}")
 
         # Check if lobby opened in a different tab
         for page in self._context.pages:
             if "lobby.ogame" in page.url:
-                print(f"Found lobby at: {page.url}")
+                log.debug(f"Found lobby at: {page.url}")
                 self._page = page
                 page.bring_to_front()
                 return page
 
-        print(f"Current URL: {self.page.url}")
+        log.debug(f"Current URL: {self.page.url}")
         return self.page
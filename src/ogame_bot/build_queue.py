@@ -0,0 +1,200 @@
+"""Build and research queue executor that sleeps until the next item is feasible."""
+
+import time
+from dataclasses import dataclass, field
+
+from playwright.sync_api import Page
+
+from .actions.navigation import Navigation, PlanetInfo
+from .actions.production import Production, ResourceState
+from .economy import TECHS, Tech, get_tech
+from .mission_config import BuildPlan
+from .snapshot import EmpireSnapshot
+from .utils.log import get_logger
+
+log = get_logger(__name__)
+
+
+@dataclass
+class QueueState:
+    """What we know about one queue: a planet's buildings, or the research queue."""
+
+    label: str
+    planet: PlanetInfo
+    items: list[tuple[Tech, int]]  # (tech, target level), in plan order
+    levels: dict[int, int] = field(default_factory=dict)
+    resources: ResourceState | None = None
+    free_at: float | None = None  # unix time the queue frees up; None = free now
+    blocked_until: float = 0.0  # after a failed attempt, don't retry before this
+
+    def next_item(self) -> tuple[Tech, int] | None:
+        """The first plan item not reached yet, as (tech, next level to build)."""
+        for tech, target in self.items:
+            level = self.levels.get(tech.tech_id, 0)
+            if level < target:
+                return tech, level + 1
+        return None
+
+
+class BuildQueueExecutor:
+    """
+    Work through a build/research plan, waking up only when something can be queued.
+
+    For every queue the executor projects resources forward from the last
+    reading and computes the moment the next item is both affordable and the
+    queue is free. It then sleeps until the earliest of those moments across
+    all planets and handles every item that is due in a single pass, instead
+    of polling each planet's pages on a fixed interval.
+    """
+
+    def __init__(
+        self,
+        page: Page,
+        plan: BuildPlan,
+        max_sleep: float = 3600,
+        retry_after: float = 900,
+        snapshot: EmpireSnapshot | None = None,
+    ):
+        """
+        Args:
+            page: Logged-in game page
+            plan: Target levels per planet and for research
+            max_sleep: Longest single sleep in seconds (bounds projection drift)
+            retry_after: Seconds before re-checking a queue whose projection
+                can't be computed or whose upgrade failed
+            snapshot: Empire snapshot for the planet list and research levels
+        """
+        self.page = page
+        self.plan = plan
+        self.max_sleep = max_sleep
+        self.retry_after = retry_after
+        self.snapshot = snapshot
+        self.nav = Navigation(page, snapshot=snapshot)
+        self.production = Production(page)
+        self.queued = 0
+
+    def _build_queues(self) -> list[QueueState]:
+        planets = self.nav.list_planets()
+
+        def find(name: str) -> PlanetInfo | None:
+            match = next((p for p in planets if name.lower() in p.name.lower()), None)
+            if match is None:
+                log.warning(f"Planet '{name}' not found, skipping its plan")
+            return match
+
+        queues = []
+        for name, items in self.plan.planets.items():
+            planet = find(name)
+            if planet:
+                techs = [(get_tech(key), level) for key, level in items]
+                queues.append(QueueState(label=planet.name, planet=planet, items=techs))
+
+        if self.plan.research and self.plan.research_planet:
+            planet = find(self.plan.research_planet)
+            if planet:
+                techs = [(get_tech(key), level) for key, level in self.plan.research]
+                queues.append(QueueState(label="research", planet=planet, items=techs))
+        return queues
+
+    def refresh(self, queue: QueueState):
+        """Read levels, resources and queue state from the page of the next item."""
+        item = queue.next_item()
+        if item is None:
+            return
+        tech, _ = item
+        if not self.nav.open_component(queue.planet, tech.component):
+            queue.blocked_until = time.time() + self.retry_after
+            return
+        queue.levels.update(self.production.read_levels())
+        queue.resources = self.production.read_resources()
+        queue.free_at = self.production.read_queue_end(tech.kind)
+        if tech.kind == "research":
+            self._store_research(queue)
+
+    def _store_research(self, queue: QueueState):
+        if self.snapshot is None:
+            return
+        self.snapshot.set_research_levels({
+            tech.key: queue.levels[tech.tech_id]
+            for tech in TECHS.values()
+            if tech.kind == "research" and tech.tech_id in queue.levels
+        })
+
+    def due_at(self, queue: QueueState) -> float | None:
+        """When the next item can be queued (None if the plan is done)."""
+        item = queue.next_item()
+        if item is None:
+            return None
+        tech, level = item
+
+        affordable = None
+        if queue.resources is not None:
+            affordable = queue.resources.affordable_at(tech.cost(level))
+        if affordable is None:
+            # Can't project (no production data, or cost above storage): check back later
+            affordable = time.time() + self.retry_after
+        return max(affordable, queue.free_at or 0.0, queue.blocked_until)
+
+    def _try_queue(self, queue: QueueState) -> bool:
+        """Refresh a due queue and queue its next item if it really is possible now."""
+        self.refresh(queue)
+        item = queue.next_item()
+        if item is None or queue.resources is None:
+            return False
+        tech, level = item
+        now = time.time()
+
+        if queue.free_at is not None and queue.free_at > now:
+            return False
+        if any(have < need for have, need in zip(queue.resources.amounts, tech.cost(level))):
+            return False
+
+        if not self.production.upgrade(tech):
+            queue.blocked_until = now + self.retry_after
+            return False
+
+        log.info(f"[{queue.label}] {tech.key} -> level {level} queued")
+        queue.levels[tech.tech_id] = level
+        queue.resources = self.production.read_resources()
+        queue.free_at = self.production.read_queue_end(tech.kind) or now + self.retry_after
+        self.queued += 1
+        return True
+
+    def run(self, until: float | None = None) -> int:
+        """
+        Execute the plan until every item is queued (or until the given unix time).
+
+        Returns:
+            Number of items queued
+        """
+        queues = self._build_queues()
+        for queue in queues:
+            self.refresh(queue)
+
+        while True:
+            due = {id(queue): self.due_at(queue) for queue in queues}
+            pending = [queue for queue in queues if due[id(queue)] is not None]
+            if not pending:
+                log.info("Build plan complete!")
+                return self.queued
+
+            wake = min(due[id(queue)] for queue in pending)
+            if until is not None and wake > until:
+                log.info("Next item is due after the deadline, stopping")
+                return self.queued
+
+            wait = wake - time.time()
+            if wait > 0:
+                nap = min(wait, self.max_sleep)
+                log.info(f"Next item due in {wait / 60:.1f} min, sleeping {nap / 60:.1f} min")
+                self.page.wait_for_timeout(nap * 1000)
+                if nap < wait:
+                    continue
+
+            # Handle everything that is due in one pass
+            now = time.time()
+            for queue in pending:
+                if due[id(queue)] <= now + 1:
+                    if not self._try_queue(queue) and queue.blocked_until <= now:
+                        # Projection was off; the fresh reading gives a new due time
+                        queue.blocked_until = max(queue.blocked_until, now + 5)
@@ -10,6 +10,18 @@ load_dotenv()
 # Bot's own profile directory (separate from your main Chrome)
 BOT_PROFILE_DIR = Path.home() / ".ogame-bot" / "chrome-profile"
 
+# Empire state cached between runs
+EMPIRE_SNAPSHOT_PATH = Path.home() / ".ogame-bot" / "empire.json"
+
+# Every dispatched farm attack, for resuming interrupted runs
+DISPATCH_JOURNAL_PATH = Path.home() / ".ogame-bot" / "dispatch.jsonl"
+
+# Activity samples of farm targets
+ACTIVITY_STORE_DIR = Path.home() / ".ogame-bot" / "activity"
+
+# Event log and crash dumps
+LOG_DIR = Path.home() / ".ogame-bot" / "logs"
+
 
 @dataclass
 class OGameConfig:
@@ -19,6 +31,17 @@ class OGameConfig:
     language: str = "es_ES"
     headless: bool = False
     slow_mo: int = 50  # ms delay between actions
+    record_har: str | None = None  # record traffic to this HAR file
+    replay_har: str | None = None  # serve traffic from this HAR file, offline
+    snapshot_path: str = str(EMPIRE_SNAPSHOT_PATH)
+    account: str = "default"  # key for per-account action limits
+    actions_per_minute: float = 60  # ceiling across all action classes
+    dispatch_mode: str = "ui"  # "ui" clicks the wizard, "script" uses the game's fleet dispatcher
+    journal_path: str = str(DISPATCH_JOURNAL_PATH)
+    farm_cooldown: float = 60  # minutes a hit target is skipped when resuming
+    activity_dir: str = str(ACTIVITY_STORE_DIR)
+    log_dir: str = str(LOG_DIR)
+    log_level: str = "INFO"  # lowest level shown on the console
 
     @classmethod
     def from_env(cls) -> "OGameConfig":
@@ -34,6 +57,17 @@ class OGameConfig:
             language=os.getenv("OGAME_LANGUAGE", "es_ES"),
             headless=os.getenv("HEADLESS", "false").lower() == "true",
             slow_mo=int(os.getenv("SLOW_MO", "50")),
+            record_har=os.getenv("RECORD_HAR") or None,
+            replay_har=os.getenv("REPLAY_HAR") or None,
+            snapshot_path=os.getenv("EMPIRE_SNAPSHOT", str(EMPIRE_SNAPSHOT_PATH)),
+            account=os.getenv("OGAME_ACCOUNT", "default"),
+            actions_per_minute=float(os.getenv("ACTIONS_PER_MINUTE", "60")),
+            dispatch_mode=os.getenv("DISPATCH_MODE", "ui").lower(),
+            journal_path=os.getenv("DISPATCH_JOURNAL", str(DISPATCH_JOURNAL_PATH)),
+            farm_cooldown=float(os.getenv("FARM_COOLDOWN", "60")),
+            activity_dir=os.getenv("ACTIVITY_STORE", str(ACTIVITY_STORE_DIR)),
+            log_dir=os.getenv("LOG_DIR", str(LOG_DIR)),
+            log_level=os.getenv("LOG_LEVEL", "INFO"),
         )
 
     @property
@@ -0,0 +1,242 @@
+"""Plan a run from cached empire state, without a browser."""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from .game_data import EXPEDITION_HOLD, Mission
+from .journal import DispatchJournal
+from .mission_config import ExpeditionConfig, FarmingConfig
+from .planner import MissionPlan, MissionRequest, Origin, plan_missions
+from .snapshot import EmpireSnapshot
+
+
+@dataclass(frozen=True)
+class PlannedMission:
+    mission: Mission
+    origin: str
+    target: tuple[int, int, int]
+    ships: dict[str, int]
+    flight_time: float  # seconds, one way
+
+    @property
+    def round_trip(self) -> float:
+        """Seconds until the fleet is back home."""
+        hold = EXPEDITION_HOLD if self.mission == Mission.EXPEDITION else 0
+        return 2 * self.flight_time + hold
+
+
+@dataclass
+class DryRunPlan:
+    """What a run would send, worked out from the last known empire state."""
+
+    missions: list[PlannedMission] = field(default_factory=list)
+    expedition_slots: tuple[int, int] | None = None  # (in use, max)
+    expeditions_wanted: int = 0
+    skipped_targets: list[tuple[int, int, int]] = field(default_factory=list)  # hit recently
+    unassigned_targets: list[tuple[int, int, int]] = field(default_factory=list)  # not enough ships
+    # Config names or state the snapshot doesn't have (or only past its TTL);
+    # the plan may be wrong, so it is not complete
+    unknown: list[str] = field(default_factory=list)
+    state_age: float | None = None  # seconds since the oldest state used was read
+
+    def note_unknown(self, what: str):
+        if what not in self.unknown:
+            self.unknown.append(what)
+
+    @property
+    def complete(self) -> bool:
+        return not self.unknown
+
+    @property
+    def would_send(self) -> bool:
+        return bool(self.missions)
+
+    def count(self, mission: Mission) -> int:
+        return sum(planned.mission == mission for planned in self.missions)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "would_send": self.would_send,
+            "complete": self.complete,
+            "state_age": None if self.state_age is None else round(self.state_age),
+            "expedition_slots": list(self.expedition_slots) if self.expedition_slots else None,
+            "expeditions": {"wanted": self.expeditions_wanted, "planned": self.count(Mission.EXPEDITION)},
+            "attacks": {
+                "planned": self.count(Mission.ATTACK),
+                "skipped_recent": [list(t) for t in self.skipped_targets],
+                "unassigned": [list(t) for t in self.unassigned_targets],
+            },
+            "missions": [
+                {
+                    "mission": planned.mission.name.lower(),
+                    "origin": planned.origin,
+                    "target": list(planned.target),
+                    "ships": planned.ships,
+                    "flight_time": round(planned.flight_time),
+                    "round_trip": round(planned.round_trip),
+                }
+                for planned in self.missions
+            ],
+            "unknown": self.unknown,
+        }
+
+
+def _check_fresh(name: str, what: str, snapshot: EmpireSnapshot, result: DryRunPlan):
+    """Note a field used past its TTL: fleets may have returned or left since."""
+    if snapshot.is_stale(name):
+        result.note_unknown(f"{what} (out of date)")
+
+
+def _origins(names: tuple[str, ...], snapshot: EmpireSnapshot, result: DryRunPlan) -> list[Origin]:
+    planets = snapshot.planets(stale_ok=True)
+    if planets is None:
+        result.note_unknown("planet list")
+        return []
+    _check_fresh("planets", "planet list", snapshot, result)
+
+    origins = []
+    for name in names:
+        planet = next((p for p in planets if name.lower() in p.name.lower()), None)
+        if planet is None:
+            result.note_unknown(f"planet '{name}'")
+            continue
+        inventory = snapshot.inventory(planet.planet_id, stale_ok=True)
+        if inventory is None:
+            result.note_unknown(f"ships on {planet.name}")
+            continue
+        _check_fresh(f"inventory.{planet.planet_id}", f"ships on {planet.name}", snapshot, result)
+        age = snapshot.age(f"inventory.{planet.planet_id}")
+        result.state_age = max(result.state_age or 0.0, age or 0.0)
+        origins.append(Origin(planet.name, planet.coords, dict(inventory)))
+    return origins
+
+
+def _consume(origins: list[Origin], plan: MissionPlan) -> list[Origin]:
+    """Origins with the ships of a plan's assignments taken out."""
+    remaining = {origin.name: dict(origin.inventory) for origin in origins}
+    for assignment in plan.assignments:
+        inventory = remaining[assignment.origin.name]
+        for name, amount in assignment.request.ships.items():
+            own = next((key for key in inventory if key.lower() == name.lower()), None)
+            if own is not None:
+                inventory[own] -= amount
+    return [Origin(origin.name, origin.coords, remaining[origin.name]) for origin in origins]
+
+
+def _add(result: DryRunPlan, plan: MissionPlan):
+    for assignment in plan.assignments:
+        result.missions.append(PlannedMission(
+            mission=assignment.request.mission,
+            origin=assignment.origin.name,
+            target=assignment.target,
+            ships=dict(assignment.request.ships),
+            flight_time=assignment.flight_time,
+        ))
+
+
+def build_plan(
+    expeditions: ExpeditionConfig,
+    farming: FarmingConfig | None,
+    snapshot: EmpireSnapshot,
+    journal: DispatchJournal | None = None,
+    universe_speed: float = 1.0,
+) -> DryRunPlan:
+    """
+    Work out every mission a run would send, in the order the run sends them.
+
+    Expeditions fill the free expedition slots first; farm attacks are then
+    planned with the ships left over, skipping targets the journal shows
+    were hit within its cooldown.
+
+    Args:
+        expeditions: Expedition config
+        farming: Farming config (None when farming is skipped)
+        snapshot: Last known empire state; values past their TTL are still
+            planned with, but noted as unknown so the plan is not complete
+        journal: Dispatch journal, to skip recently hit targets (resume)
+        universe_speed: Fleet speed multiplier of the universe
+
+    Returns:
+        The planned run
+    """
+    result = DryRunPlan()
+
+    origins = _origins(expeditions.planets, snapshot, result)
+    slots = snapshot.expedition_slots(stale_ok=True)
+    if slots is None:
+        result.note_unknown("expedition slots")
+        free = expeditions.max_expeditions or 0
+    else:
+        result.expedition_slots = slots
+        _check_fresh("slots", "expedition slots", snapshot, result)
+        result.state_age = max(result.state_age or 0.0, snapshot.age("slots") or 0.0)
+        free = max(0, slots[1] - slots[0])
+        if expeditions.max_expeditions is not None:
+            free = min(free, expeditions.max_expeditions)
+    result.expeditions_wanted = free
+
+    requests = [MissionRequest(Mission.EXPEDITION, expeditions.ships) for _ in range(free)]
+    expedition_plan = plan_missions(requests, origins, universe_speed=universe_speed)
+    _add(result, expedition_plan)
+
+    if farming is None:
+        return result
+
+    targets = list(farming.targets)
+    if journal is not None:
+        recent = journal.recent_targets(Mission.ATTACK)
+        result.skipped_targets = [target for target in targets if target in recent]
+        targets = [target for target in targets if target not in recent]
+
+    # Farming runs after expeditions, with whatever ships they left behind
+    left = {origin.name: origin for origin in _consume(origins, expedition_plan)}
+    farm_origins = [
+        left.get(origin.name, origin) for origin in _origins(farming.planets, snapshot, result)
+    ]
+    requests = [MissionRequest(Mission.ATTACK, farming.ships, target) for target in targets]
+    farm_plan = plan_missions(requests, farm_origins, universe_speed=universe_speed)
+    _add(result, farm_plan)
+    if farm_origins:
+        result.unassigned_targets = [request.target for request in farm_plan.unassigned]
+    return result
+
+
+def _duration(seconds: float) -> str:
+    minutes, _ = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m" if hours else f"{minutes}m"
+
+
+def format_plan(plan: DryRunPlan) -> str:
+    """Human-readable summary of a DryRunPlan."""
+    lines = []
+    if plan.state_age is not None:
+        lines.append(f"Planned from state up to {_duration(plan.state_age)} old")
+
+    if plan.expedition_slots:
+        used, maximum = plan.expedition_slots
+        lines.append(f"Expedition slots: {used}/{maximum} in use")
+    lines.append(f"Expeditions: {plan.count(Mission.EXPEDITION)} of {plan.expeditions_wanted} wanted")
+    lines.append(f"Farm attacks: {plan.count(Mission.ATTACK)}")
+    if plan.skipped_targets:
+        lines.append(f"  {len(plan.skipped_targets)} targets skipped (hit recently)")
+    if plan.unassigned_targets:
+        lines.append(f"  {len(plan.unassigned_targets)} targets left out (not enough ships)")
+
+    if plan.missions:
+        lines.append("")
+        for planned in plan.missions:
+            galaxy, system, position = planned.target
+            ships = ", ".join(f"{amount} {name}" for name, amount in planned.ships.items())
+            lines.append(
+                f"  {planned.mission.name.lower():<10} {planned.origin} -> [{galaxy}:{system}:{position}]"
+                f"  {ships}  (flight {_duration(planned.flight_time)}, back in {_duration(planned.round_trip)})"
+            )
+        last_back = max(planned.round_trip for planned in plan.missions)
+        lines.append(f"\nLast fleet back in {_duration(last_back)}")
+
+    if plan.unknown:
+        lines.append("\nNot in the cached state or out of date (a real run will read it): " + ", ".join(plan.unknown))
+    if not plan.would_send:
+        lines.append("\nNothing would be sent.")
+    return "\n".join(lines)
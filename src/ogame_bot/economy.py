@@ -0,0 +1,85 @@
+"""Buildings, research and their cost formulas."""
+
+import math
+from dataclasses import dataclass
+
+RESOURCES = ("metal", "crystal", "deuterium")
+
+
+@dataclass(frozen=True)
+class Tech:
+    """A building or research, with the data needed to price any level."""
+
+    key: str
+    tech_id: int  # data-technology id in the game's pages
+    kind: str  # "building" or "research"
+    component: str  # page it is built from: "supplies", "facilities" or "research"
+    base_cost: tuple[int, int, int]  # metal, crystal, deuterium for level 1
+    factor: float
+
+    def cost(self, level: int) -> tuple[int, int, int]:
+        """Cost of upgrading to the given level."""
+        scale = self.factor ** (level - 1)
+        return tuple(int(base * scale) for base in self.base_cost)
+
+
+TECHS = {tech.key: tech for tech in (
+    # Resource buildings
+    Tech("metal_mine", 1, "building", "supplies", (60, 15, 0), 1.5),
+    Tech("crystal_mine", 2, "building", "supplies", (48, 24, 0), 1.6),
+    Tech("deuterium_synthesizer", 3, "building", "supplies", (225, 75, 0), 1.5),
+    Tech("solar_plant", 4, "building", "supplies", (75, 30, 0), 1.5),
+    Tech("fusion_reactor", 12, "building", "supplies", (900, 360, 180), 1.8),
+    Tech("metal_storage", 22, "building", "supplies", (1000, 0, 0), 2),
+    Tech("crystal_storage", 23, "building", "supplies", (1000, 500, 0), 2),
+    Tech("deuterium_tank", 24, "building", "supplies", (1000, 1000, 0), 2),
+    # Facilities
+    Tech("robotics_factory", 14, "building", "facilities", (400, 120, 200), 2),
+    Tech("shipyard", 21, "building", "facilities", (400, 200, 100), 2),
+    Tech("research_lab", 31, "building", "facilities", (200, 400, 200), 2),
+    Tech("alliance_depot", 34, "building", "facilities", (20000, 40000, 0), 2),
+    Tech("missile_silo", 44, "building", "facilities", (20000, 20000, 1000), 2),
+    Tech("nanite_factory", 15, "building", "facilities", (1_000_000, 500_000, 100_000), 2),
+    Tech("terraformer", 33, "building", "facilities", (0, 50_000, 100_000), 2),
+    Tech("space_dock", 36, "building", "facilities", (200, 0, 50), 5),
+    # Research
+    Tech("energy_technology", 113, "research", "research", (0, 800, 400), 2),
+    Tech("laser_technology", 120, "research", "research", (200, 100, 0), 2),
+    Tech("ion_technology", 121, "research", "research", (1000, 300, 100), 2),
+    Tech("hyperspace_technology", 114, "research", "research", (0, 4000, 2000), 2),
+    Tech("plasma_technology", 122, "research", "research", (2000, 4000, 1000), 2),
+    Tech("combustion_drive", 115, "research", "research", (400, 0, 600), 2),
+    Tech("impulse_drive", 117, "research", "research", (2000, 4000, 600), 2),
+    Tech("hyperspace_drive", 118, "research", "research", (10000, 20000, 6000), 2),
+    Tech("espionage_technology", 106, "research", "research", (200, 1000, 200), 2),
+    Tech("computer_technology", 108, "research", "research", (0, 400, 600), 2),
+    Tech("astrophysics", 124, "research", "research", (4000, 8000, 4000), 1.75),
+    Tech("intergalactic_research_network", 123, "research", "research", (240_000, 400_000, 160_000), 2),
+    Tech("weapons_technology", 109, "research", "research", (800, 200, 0), 2),
+    Tech("shielding_technology", 110, "research", "research", (200, 600, 0), 2),
+    Tech("armour_technology", 111, "research", "research", (1000, 0, 0), 2),
+)}
+
+
+def get_tech(key: str) -> Tech:
+    """Look up a tech by key, with a helpful error for typos."""
+    try:
+        return TECHS[key]
+    except KeyError:
+        raise ValueError(f"Unknown building or research: '{key}'") from None
+
+
+def build_time(tech: Tech, level: int, robotics: int = 0, nanite: int = 0,
+               research_lab: int = 0, universe_speed: float = 1.0) -> float:
+    """Seconds needed to build (or research) the given level."""
+    metal, crystal, _ = tech.cost(level)
+    if tech.kind == "research":
+        hours = (metal + crystal) / (1000 * (1 + research_lab))
+    else:
+        hours = (metal + crystal) / (2500 * (1 + robotics) * 2 ** nanite)
+    return hours * 3600 / universe_speed
+
+
+def storage_capacity(level: int) -> int:
+    """Capacity of a metal/crystal/deuterium storage at the given level."""
+    return 5000 * math.floor(2.5 * math.exp(20 * level / 33))
@@ -0,0 +1,227 @@
+"""Fleetsave engine: pre-computed save plans fired on hostile arrivals."""
+
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from playwright.sync_api import Page
+
+from .actions.events import EventDiff, EventListPoller, FleetEvent
+from .actions.fleet import SCRIPT, Fleet
+from .actions.navigation import Navigation, PlanetInfo
+from .game_data import EXPEDITION_POSITION, Mission
+from .snapshot import EmpireSnapshot
+from .utils.log import get_logger
+
+log = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class SavePlan:
+    """Everything needed to send a planet's fleet away, decided ahead of time."""
+
+    planet: PlanetInfo
+    destination: tuple[int, int, int]
+    mission: Mission
+    ships: dict[str, int]
+
+
+def expedition_save(planet: PlanetInfo, inventory: dict[str, int]) -> SavePlan:
+    """Default save: every ship on an expedition to position 16 of the same system."""
+    galaxy, system, _ = planet.coords
+    return SavePlan(
+        planet=planet,
+        destination=(galaxy, system, EXPEDITION_POSITION),
+        mission=Mission.EXPEDITION,
+        ships=dict(inventory),
+    )
+
+
+class LatencyTracker:
+    """Detection-to-dispatch latency samples, in seconds."""
+
+    def __init__(self):
+        self.samples: list[float] = []
+
+    def record(self, seconds: float):
+        self.samples.append(seconds)
+
+    def summary(self) -> dict[str, float]:
+        """Count, mean, median, p95 and max of the recorded samples."""
+        if not self.samples:
+            return {"count": 0}
+        ordered = sorted(self.samples)
+        p95 = ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))]
+        return {
+            "count": len(ordered),
+            "mean": statistics.fmean(ordered),
+            "p50": statistics.median(ordered),
+            "p95": p95,
+            "max": ordered[-1],
+        }
+
+    def report(self):
+        summary = self.summary()
+        if not summary["count"]:
+            log.info("Fleetsave latency: no dispatches yet")
+            return
+        log.info(
+            f"Fleetsave latency over {summary['count']} dispatches: "
+            f"mean {summary['mean']:.2f}s, p50 {summary['p50']:.2f}s, "
+            f"p95 {summary['p95']:.2f}s, max {summary['max']:.2f}s"
+        )
+
+
+# A dispatcher sends a plan and reports success; engines try them in order.
+Dispatcher = Callable[[SavePlan], bool]
+
+
+class FleetsaveEngine:
+    """
+    Keep a save plan ready for every planet and fire it when a hostile fleet shows up.
+
+    Plans are computed from the planet's ship inventory ahead of time, so the
+    reaction path only has to open the fleet page and send. Hook the engine to
+    an EventListPoller with watch() to react to incoming attacks.
+    """
+
+    def __init__(
+        self,
+        page: Page,
+        planner: Callable[[PlanetInfo, dict[str, int]], SavePlan] = expedition_save,
+        snapshot: EmpireSnapshot | None = None,
+    ):
+        """
+        Args:
+            page: Logged-in game page
+            planner: Builds a SavePlan from a planet and its ship inventory
+            snapshot: Empire snapshot for cached planets and inventories
+        """
+        self.page = page
+        self.planner = planner
+        self.snapshot = snapshot
+        self.nav = Navigation(page, snapshot=snapshot)
+        # No human delays and no wizard here: this is the one action where seconds matter
+        self.fleet = Fleet(page, human_delays=False, snapshot=snapshot, mode=SCRIPT)
+        self.latency = LatencyTracker()
+        self.plans: dict[tuple[int, int, int], SavePlan] = {}
+        self.dispatchers: list[Dispatcher] = [self._dispatch_ui]
+        self._inventories: dict[tuple[int, int, int], dict[str, int]] = {}
+        self._stale: set[tuple[int, int, int]] = set()
+        self._saved_events: set[int] = set()
+
+    # === Plans ===
+
+    def update_inventory(self, planet: PlanetInfo, inventory: dict[str, int]) -> SavePlan | None:
+        """Store a planet's inventory and rebuild its plan if the inventory changed."""
+        self._stale.discard(planet.coords)
+        if self._inventories.get(planet.coords) == inventory and planet.coords in self.plans:
+            return self.plans[planet.coords]
+
+        self._inventories[planet.coords] = dict(inventory)
+        if not inventory:
+            self.plans.pop(planet.coords, None)
+            log.info(f"No ships on {planet.name}, nothing to save")
+            return None
+
+        plan = self.planner(planet, inventory)
+        self.plans[planet.coords] = plan
+        log.info(f"Save plan for {planet.name}: {plan.mission.name.lower()} to {plan.destination}")
+        return plan
+
+    def refresh_plan(self, planet: PlanetInfo, use_cache: bool = False) -> SavePlan | None:
+        """Read a planet's inventory from its fleet page and update its plan."""
+        cached = self.snapshot.inventory(planet.planet_id) if self.snapshot and use_cache else None
+        if cached is not None:
+            return self.update_inventory(planet, cached)
+        if not self.nav.open_fleet_page(planet):
+            return self.plans.get(planet.coords)
+        return self.update_inventory(planet, self.fleet.read_ship_inventory())
+
+    def refresh_all(self, planets: list[PlanetInfo] | None = None):
+        """
+        Build the plan of every planet (defaults to the whole planet list).
+
+        Fresh inventories from the snapshot are used without visiting the planet.
+        """
+        for planet in planets or self.nav.list_planets():
+            self.refresh_plan(planet, use_cache=True)
+
+    def refresh_stale(self):
+        """Refresh plans of planets whose inventory may have changed."""
+        for coords in list(self._stale):
+            plan = self.plans.get(coords)
+            if plan:
+                self.refresh_plan(plan.planet)
+            else:
+                self._stale.discard(coords)
+
+    # === Reaction path ===
+
+    def watch(self, poller: EventListPoller):
+        """React to every poll of the given poller."""
+        poller.subscribe(self.on_events)
+
+    def on_events(self, diff: EventDiff):
+        """Fire saves for new hostile arrivals, then catch up on stale plans."""
+        for event in diff.new_hostile:
+            self._react(event, diff.observed_at)
+
+        # Own fleets leaving or landing change what is on the planet
+        for event in diff.added + diff.removed:
+            if event.hostile:
+                continue
+            for coords in (event.origin, event.destination):
+                if coords in self.plans:
+                    self._stale.add(coords)
+
+        if not diff.new_hostile:
+            self.refresh_stale()
+
+    def _react(self, event: FleetEvent, detected_at: float):
+        if event.event_id in self._saved_events or event.is_return:
+            return
+        plan = self.plans.get(event.destination)
+        if plan is None:
+            log.warning(f"Hostile fleet to {event.destination} but no save plan for it")
+            return
+        log.warning(
+            f"!!! Hostile {event.mission_name} arriving at {plan.planet.name} !!!",
+            extra={"event": "hostile", "event_id": event.event_id, "target": list(event.destination),
+                   "arrival_time": event.arrival_time},
+        )
+        if self.fire(plan, detected_at=detected_at):
+            self._saved_events.add(event.event_id)
+
+    def fire(self, plan: SavePlan, detected_at: float | None = None) -> bool:
+        """
+        Send a save plan through the first dispatcher that succeeds.
+
+        Args:
+            plan: Plan to execute
+            detected_at: time.monotonic() of the detection; defaults to now
+
+        Returns:
+            True if the fleet was sent
+        """
+        detected_at = time.monotonic() if detected_at is None else detected_at
+
+        for dispatcher in self.dispatchers:
+            if dispatcher(plan):
+                latency = time.monotonic() - detected_at
+                self.latency.record(latency)
+                log.info(
+                    f"Fleetsave from {plan.planet.name} sent in {latency:.2f}s",
+                    extra={"event": "fleetsave", "planet": plan.planet.name, "latency_s": round(latency, 3)},
+                )
+                self._stale.add(plan.planet.coords)
+                return True
+
+        log.warning(f"Fleetsave from {plan.planet.name} FAILED")
+        return False
+
+    def _dispatch_ui(self, plan: SavePlan) -> bool:
+        if not self.nav.open_fleet_page(plan.planet):
+            return False
+        return self.fleet.dispatch(plan.ships, plan.destination, plan.mission)
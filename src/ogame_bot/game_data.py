@@ -0,0 +1,102 @@
+"""Static OGame game data shared across modules."""
+
+from dataclasses import dataclass
+from enum import IntEnum
+
+
+class Mission(IntEnum):
+    """Fleet mission type ids as used by the game."""
+
+    ATTACK = 1
+    ACS_ATTACK = 2
+    TRANSPORT = 3
+    DEPLOY = 4
+    ACS_DEFEND = 5
+    ESPIONAGE = 6
+    COLONIZE = 7
+    RECYCLE = 8
+    DESTROY_MOON = 9
+    MISSILE_ATTACK = 10
+    EXPEDITION = 15
+
+
+@dataclass(frozen=True)
+class PlanetInfo:
+    """A planet from the planet list."""
+
+    name: str
+    planet_id: int
+    coords: tuple[int, int, int]
+
+
+# Position used for expedition targets in every system
+EXPEDITION_POSITION = 16
+
+# Expeditions hold at position 16 for an hour by default
+EXPEDITION_HOLD = 3600
+
+# Ships that show up on the fleet page but can never leave the planet
+STATIONARY_SHIPS = frozenset({"Satélite solar", "Taladrador"})
+
+# Base speed of each ship (before drive research), keyed by lowercase name
+SHIP_SPEEDS = {
+    "cazador ligero": 12500,
+    "cazador pesado": 10000,
+    "crucero": 15000,
+    "nave de batalla": 10000,
+    "acorazado": 10000,
+    "bombardero": 4000,
+    "destructor": 5000,
+    "estrella de la muerte": 100,
+    "segador": 7000,
+    "explorador": 12000,
+    "nave pequeña de carga": 5000,
+    "nave grande de carga": 7500,
+    "colonizador": 2500,
+    "reciclador": 2000,
+    "sonda de espionaje": 100_000_000,
+}
+
+DEFAULT_SHIP_SPEED = 10000
+
+# Base cargo capacity (before hyperspace research), keyed by lowercase name
+SHIP_CARGO = {
+    "nave pequeña de carga": 5000,
+    "nave grande de carga": 25000,
+    "reciclador": 20000,
+    "explorador": 10000,
+}
+
+# Ships that can collect debris: recyclers anywhere, but only pathfinders
+# in the deep-space fields expeditions leave at position 16
+RECYCLER = "Reciclador"
+PATHFINDER = "Explorador"
+
+
+def distance(origin: tuple[int, int, int], target: tuple[int, int, int]) -> int:
+    """Flight distance between two coordinates, using the game's formula."""
+    if origin[0] != target[0]:
+        return 20000 * abs(origin[0] - target[0])
+    if origin[1] != target[1]:
+        return 2700 + 95 * abs(origin[1] - target[1])
+    if origin[2] != target[2]:
+        return 1000 + 5 * abs(origin[2] - target[2])
+    return 5
+
+
+def fleet_speed(ships: dict[str, int]) -> int:
+    """Speed of a fleet: its slowest ship."""
+    speeds = [SHIP_SPEEDS.get(name.lower(), DEFAULT_SHIP_SPEED) for name in ships]
+    return min(speeds, default=DEFAULT_SHIP_SPEED)
+
+
+def flight_time(
+    origin: tuple[int, int, int],
+    target: tuple[int, int, int],
+    ships: dict[str, int],
+    speed_percent: int = 100,
+    universe_speed: float = 1.0,
+) -> float:
+    """One-way flight time in seconds."""
+    seconds = 10 + 35000 / speed_percent * (10 * distance(origin, target) / fleet_speed(ships)) ** 0.5
+    return seconds / universe_speed
@@ -0,0 +1,174 @@
+"""Scrub session secrets from recorded HAR archives."""
+
+import base64
+import binascii
+import json
+import re
+from pathlib import Path
+from urllib.parse import quote, unquote_plus
+
+# Header values that are always secret
+SECRET_HEADERS = {"cookie", "set-cookie", "authorization", "proxy-authorization", "x-csrf-token"}
+
+# Query/form/JSON field names whose values are secret (matched whole, any case),
+# plus any field whose name ends in "token" (ajaxToken, fleetSendingToken, ...)
+SECRET_FIELDS = {
+    "session", "sessionid", "phpsessid", "sid", "auth", "password", "passwd", "secret", "key", "apikey", "api_key",
+}
+
+# Secrets embedded in page markup or scripts, e.g. var token = "..."; "newAjaxToken":"..."
+SECRET_IN_TEXT = re.compile(
+    r"""((?<![\w-])(?:token|ajaxToken|newAjaxToken|fleetSendingToken)["']?\s*[:=]\s*["'])([^"']+)(["'])""",
+    re.IGNORECASE,
+)
+SECRET_INPUT = re.compile(
+    r"""(name=["'](?:token|[^"']*Token)["'][^>]*value=["'])([^"']+)(["'])""",
+    re.IGNORECASE,
+)
+
+# name=value pairs of a query string or form body
+QUERY_PAIR = re.compile(r"(^|[?&])([^=&#?]+)=([^&#]*)")
+
+COOKIE_ATTRIBUTES = {"path", "domain", "expires", "max-age", "samesite"}
+
+
+def _is_secret_field(name: str | None) -> bool:
+    name = (name or "").lower()
+    return name in SECRET_FIELDS or name.endswith("token")
+
+
+class _Scrubber:
+    """Replace secrets in their own fields, the same value always by the same placeholder."""
+
+    def __init__(self):
+        self.placeholders: dict[str, str] = {}
+
+    def placeholder(self, value: str) -> str:
+        if not value:
+            return value
+        if value not in self.placeholders:
+            self.placeholders[value] = f"SCRUBBED{len(self.placeholders):04d}"
+        return self.placeholders[value]
+
+    def query(self, text: str) -> str:
+        """Scrub secret parameters of a URL, query string or form body."""
+        def replace(match: re.Match) -> str:
+            separator, name, value = match.groups()
+            if not _is_secret_field(unquote_plus(name)):
+                return match.group(0)
+            return f"{separator}{name}={quote(self.placeholder(unquote_plus(value)), safe='')}"
+
+        return QUERY_PAIR.sub(replace, text)
+
+    def cookies(self, header: str) -> str:
+        parts = []
+        for part in header.split(";"):
+            name, sep, value = part.partition("=")
+            if sep and value and name.strip().lower() not in COOKIE_ATTRIBUTES:
+                value = self.placeholder(value)
+            parts.append(f"{name}{sep}{value}")
+        return ";".join(parts)
+
+    def json(self, data):
+        if isinstance(data, dict):
+            return {
+                name: self.placeholder(value) if isinstance(value, str) and _is_secret_field(name) else self.json(value)
+                for name, value in data.items()
+            }
+        if isinstance(data, list):
+            return [self.json(value) for value in data]
+        return data
+
+    def text(self, body: str) -> str:
+        """Scrub a response body: JSON by field, markup and scripts by pattern."""
+        try:
+            data = json.loads(body)
+        except ValueError:
+            data = None
+        if isinstance(data, (dict, list)):
+            scrubbed = self.json(data)
+            return body if scrubbed == data else json.dumps(scrubbed, ensure_ascii=False)
+        for pattern in (SECRET_IN_TEXT, SECRET_INPUT):
+            body = pattern.sub(lambda m: m.group(1) + self.placeholder(m.group(2)) + m.group(3), body)
+        return body
+
+    def headers(self, headers: list[dict]):
+        for header in headers:
+            name = header.get("name", "").lower()
+            value = header.get("value", "")
+            if name in ("cookie", "set-cookie"):
+                header["value"] = self.cookies(value)
+            elif name in SECRET_HEADERS:
+                header["value"] = self.placeholder(value)
+            elif "=" in value:
+                # Referer, Location, ... may carry a token in their query
+                header["value"] = self.query(value)
+
+    def entry(self, entry: dict):
+        request = entry.get("request", {})
+        response = entry.get("response", {})
+
+        for message in (request, response):
+            self.headers(message.get("headers", []))
+            for cookie in message.get("cookies", []):
+                cookie["value"] = self.placeholder(cookie.get("value", ""))
+
+        if "url" in request:
+            request["url"] = self.query(request["url"])
+        for pair in request.get("queryString", []):
+            if _is_secret_field(pair.get("name")):
+                pair["value"] = self.placeholder(pair.get("value", ""))
+
+        post = request.get("postData") or {}
+        for pair in post.get("params", []):
+            if _is_secret_field(pair.get("name")):
+                pair["value"] = self.placeholder(pair.get("value", ""))
+        if post.get("text"):
+            try:
+                data = json.loads(post["text"])
+            except ValueError:
+                post["text"] = self.query(post["text"])
+            else:
+                scrubbed = self.json(data)
+                if scrubbed != data:
+                    post["text"] = json.dumps(scrubbed, ensure_ascii=False)
+
+        if "redirectURL" in response:
+            response["redirectURL"] = self.query(response["redirectURL"])
+        content = response.get("content", {})
+        if not content.get("text"):
+            return
+        if content.get("encoding") != "base64":
+            content["text"] = self.text(content["text"])
+            return
+        try:
+            body = base64.b64decode(content["text"]).decode("utf-8")
+        except (binascii.Error, UnicodeDecodeError):
+            return  # images, fonts and other binary bodies hold no tokens
+        content["text"] = base64.b64encode(self.text(body).encode("utf-8")).decode("ascii")
+
+
+def scrub_har(path: str | Path) -> int:
+    """
+    Replace session secrets in a HAR file with stable placeholders.
+
+    Secrets are replaced only where they sit: cookies, auth headers, secret
+    query and form fields, secret JSON fields, and token assignments in page
+    markup and scripts (base64-encoded bodies included). The same value
+    always gets the same placeholder, so a token handed out in one response
+    still matches the request that sends it back, which keeps the archive
+    usable for replay.
+
+    Returns:
+        Number of distinct secrets scrubbed
+    """
+    path = Path(path)
+    har = json.loads(path.read_text(encoding="utf-8"))
+    scrubber = _Scrubber()
+    for entry in har.get("log", {}).get("entries", []):
+        scrubber.entry(entry)
+
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(json.dumps(har, ensure_ascii=False), encoding="utf-8")
+    tmp_path.replace(path)
+    return len(scrubber.placeholders)
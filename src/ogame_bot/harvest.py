@@ -0,0 +1,240 @@
+"""Ranked queue of debris fields to harvest, kept current from galaxy data."""
+
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from .game_data import EXPEDITION_POSITION, PATHFINDER, RECYCLER, SHIP_CARGO, flight_time
+from .planner import Origin
+
+Coords = tuple[int, int, int]
+System = tuple[int, int]
+
+
+@dataclass(frozen=True)
+class DebrisField:
+    """A debris field as last seen in the galaxy view."""
+
+    coords: Coords
+    metal: int
+    crystal: int
+    deuterium: int
+    seen_at: float  # unix time
+
+    @property
+    def total(self) -> int:
+        return self.metal + self.crystal + self.deuterium
+
+    @property
+    def deep_space(self) -> bool:
+        """Left by an expedition at position 16; only pathfinders can collect it."""
+        return self.coords[2] == EXPEDITION_POSITION
+
+    @property
+    def collector(self) -> str:
+        return PATHFINDER if self.deep_space else RECYCLER
+
+    def collectors_needed(self) -> int:
+        return math.ceil(self.total / SHIP_CARGO[self.collector.lower()])
+
+
+@dataclass(frozen=True)
+class HarvestJob:
+    """Collectors from one origin sent to one field."""
+
+    field: DebrisField
+    origin: Origin
+    ships: dict[str, int]
+    flight_time: float  # seconds, one way
+
+    @property
+    def load(self) -> int:
+        """Resources the collectors bring back (the field, or what fits in their holds)."""
+        capacity = sum(SHIP_CARGO[name.lower()] * amount for name, amount in self.ships.items())
+        return min(self.field.total, capacity)
+
+    @property
+    def rate(self) -> float:
+        """Resources per second of round trip; the queue is ordered by it."""
+        return self.load / (2 * self.flight_time)
+
+
+@dataclass
+class HarvestStats:
+    """
+    Resources expected from the collectors sent, credited when they reach the field.
+
+    Each job counts the load it was planned with (the field as last scanned,
+    or what fits in the holds). What the collectors actually bring back is
+    not read from the game, so a field shrunk by someone else since the scan
+    is overcounted.
+    """
+
+    started: float = field(default_factory=time.time)
+    loads: list[tuple[float, int]] = field(default_factory=list)  # (arrival, expected resources)
+
+    def record(self, job: HarvestJob, sent_at: float | None = None):
+        sent_at = time.time() if sent_at is None else sent_at
+        self.loads.append((sent_at + job.flight_time, job.load))
+
+    def expected(self, now: float | None = None) -> int:
+        now = time.time() if now is None else now
+        return sum(load for arrival, load in self.loads if arrival <= now)
+
+    def per_hour(self, now: float | None = None) -> float:
+        now = time.time() if now is None else now
+        hours = (now - self.started) / 3600
+        return self.expected(now) / hours if hours > 0 else 0.0
+
+
+class HarvestQueue:
+    """
+    Debris fields in a set of watched systems, ranked for harvesting.
+
+    Each system has its own next-scan time, so a refresh fetches only the
+    systems that are due instead of rescanning everything. A system whose
+    position 16 is about to get expedition debris can be scheduled for the
+    moment the expedition finishes. Fields with collectors on the way are
+    claimed until they land and left out of the ranking; their system is
+    rescanned when the collectors land, to see what they left behind.
+    """
+
+    def __init__(self, min_total: int = 0, refresh: float = 1800):
+        """
+        Args:
+            min_total: Smallest field worth a trip, in total resources
+            refresh: Seconds between scans of a watched system
+        """
+        self.min_total = min_total
+        self.refresh = refresh
+        self.fields: dict[Coords, DebrisField] = {}
+        self.next_scan: dict[System, float] = {}
+        self.claimed: dict[Coords, float] = {}  # coords -> unix time our collectors land
+
+    # === Scanning ===
+
+    def watch(self, systems: Iterable[System], at: float | None = None):
+        """Add systems to scan, the first time at `at` (default: now)."""
+        at = time.time() if at is None else at
+        for system in systems:
+            self.schedule(system, at)
+
+    def schedule(self, system: System, at: float):
+        """Scan a system no later than `at`."""
+        system = tuple(system)
+        self.next_scan[system] = min(self.next_scan.get(system, at), at)
+
+    def due(self, now: float | None = None) -> list[System]:
+        now = time.time() if now is None else now
+        return sorted(system for system, at in self.next_scan.items() if at <= now)
+
+    def update(self, system: System, fields: Iterable[DebrisField], at: float | None = None) -> int:
+        """
+        Replace what is known about one system with a fresh scan of it.
+
+        Returns:
+            Number of fields that are new or changed size
+        """
+        at = time.time() if at is None else at
+        system = tuple(system)
+        old = {coords: known for coords, known in self.fields.items() if coords[:2] == system}
+        for coords in old:
+            del self.fields[coords]
+        changed = 0
+        for debris in fields:
+            if debris.total <= 0:
+                continue
+            self.fields[debris.coords] = debris
+            previous = old.get(debris.coords)
+            changed += previous is None or previous.total != debris.total
+        # Keep the rescan for when our collectors land, if that comes first
+        landing = [until for coords, until in self.claimed.items() if coords[:2] == system and until > at]
+        self.next_scan[system] = min([at + self.refresh, *landing])
+        return changed
+
+    # === Ranking ===
+
+    def claim(self, coords: Coords, until: float):
+        """
+        Mark a field as being collected until our collectors land.
+
+        The field's last scan is out of date from then on, so it is dropped
+        and its system rescanned at `until`; only a scan after the landing
+        can put it (what is left of it) back in the ranking.
+        """
+        coords = tuple(coords)
+        self.claimed[coords] = until
+        self.fields.pop(coords, None)
+        self.schedule(coords[:2], until)
+
+    def open_fields(self, now: float | None = None) -> list[DebrisField]:
+        """Fields big enough to harvest that nobody is on the way to, largest first."""
+        now = time.time() if now is None else now
+        self.claimed = {coords: until for coords, until in self.claimed.items() if until > now}
+        fields = [
+            debris for debris in self.fields.values()
+            if debris.total >= self.min_total and debris.coords not in self.claimed
+        ]
+        return sorted(fields, key=lambda debris: debris.total, reverse=True)
+
+    def rank(self, origins: list[Origin], universe_speed: float = 1.0) -> list[HarvestJob]:
+        """
+        Match open fields with the collectors of each origin.
+
+        Jobs are picked greedily by resources per second of round trip, so a
+        big field far away can lose to a smaller one next door. Each field
+        gets as many collectors as it needs (or the origin has left).
+
+        Args:
+            origins: Origin planets with their ship inventories
+            universe_speed: Fleet speed multiplier of the universe
+
+        Returns:
+            Jobs in the order to send them
+        """
+        left = {origin.name: dict(origin.inventory) for origin in origins}
+        candidates = self.open_fields()
+        jobs: list[HarvestJob] = []
+
+        while candidates:
+            best: HarvestJob | None = None
+            for debris in candidates:
+                for origin in origins:
+                    own = next(
+                        (name for name in left[origin.name] if name.lower() == debris.collector.lower()), None
+                    )
+                    have = left[origin.name].get(own, 0) if own else 0
+                    amount = min(debris.collectors_needed(), have)
+                    if amount <= 0:
+                        continue
+                    ships = {own: amount}
+                    job = HarvestJob(
+                        debris, origin, ships,
+                        flight_time(origin.coords, debris.coords, ships, universe_speed=universe_speed),
+                    )
+                    if best is None or job.rate > best.rate:
+                        best = job
+            if best is None:
+                break
+            jobs.append(best)
+            candidates.remove(best.field)
+            for name, amount in best.ships.items():
+                left[best.origin.name][name] -= amount
+        return jobs
+
+
+def debris_fields(observations, at: float | None = None) -> list[DebrisField]:
+    """DebrisFields from GalaxyObservations, leaving out positions without debris."""
+    at = time.time() if at is None else at
+    return [
+        DebrisField(obs.coords, *obs.debris, seen_at=at)
+        for obs in observations
+        if obs.debris_total > 0
+    ]
+
+
+def nearby_systems(center: Coords, radius: int, max_system: int = 499) -> list[System]:
+    """Systems within `radius` of a planet's system, in its galaxy."""
+    galaxy, system, _ = center
+    return [(galaxy, s) for s in range(max(1, system - radius), min(max_system, system + radius) + 1)]
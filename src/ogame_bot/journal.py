@@ -0,0 +1,251 @@
+"""Append-only journal of dispatched missions, used to resume interrupted runs."""
+
+import json
+import os
+import tempfile
+import time
+import uuid
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Iterable
+
+from .game_data import Mission
+from .utils.log import get_logger
+
+log = get_logger(__name__)
+
+# Entry states; later lines for the same id override earlier ones
+PENDING = "pending"  # about to send, outcome unknown (crash between click and confirm)
+CONFIRMED = "confirmed"
+FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class JournalEntry:
+    """One mission as recorded in the journal."""
+
+    entry_id: str
+    target: tuple[int, int, int]
+    mission: Mission
+    ships: dict[str, int]
+    sent_at: float  # unix time
+    origin: str = ""
+    status: str = PENDING
+
+
+class DispatchJournal:
+    """
+    Journal every dispatch so a crashed run can resume where it stopped.
+
+    Each state change is one JSON line appended to the file. Lines are flushed
+    to the OS immediately, so a crash of the bot or browser loses nothing; the
+    much more expensive fsync runs only every `fsync_every` records or
+    `fsync_interval` seconds, so hundreds of missions per cycle stay cheap and
+    at most one batch is lost on power failure.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        cooldown: float = 3600,
+        fsync_every: int = 25,
+        fsync_interval: float = 5.0,
+        retention: float = 7 * 24 * 3600,
+    ):
+        """
+        Args:
+            path: JSON-lines journal file
+            cooldown: Seconds during which a hit target is skipped on resume
+            fsync_every: Records written between fsyncs
+            fsync_interval: Longest time in seconds between fsyncs
+            retention: Entries older than this are dropped when the journal is opened
+        """
+        self.path = path
+        self.cooldown = cooldown
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.retention = retention
+        self.entries: dict[str, JournalEntry] = {}
+        self._handle = None
+        self._lines = 0  # lines in the file, including superseded states
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    @classmethod
+    def read(cls, path: Path, **kwargs) -> "DispatchJournal":
+        """Load a journal for queries only, without touching the file."""
+        journal = cls(path, **kwargs)
+        journal._load()
+        return journal
+
+    @classmethod
+    def open(cls, path: Path, **kwargs) -> "DispatchJournal":
+        """Load an existing journal (compacting old entries) and open it for appending."""
+        journal = cls(path, **kwargs)
+        journal._load()
+        journal._compact()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        journal._handle = path.open("a", encoding="utf-8")
+        return journal
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        with self.path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                self._lines += 1
+                try:
+                    record = json.loads(line)
+                    entry = JournalEntry(
+                        entry_id=record["id"],
+                        target=tuple(record["target"]),
+                        mission=Mission(record["mission"]),
+                        ships=record["ships"],
+                        sent_at=record["at"],
+                        origin=record.get("origin", ""),
+                        status=record["status"],
+                    )
+                except (ValueError, KeyError, TypeError):
+                    # A torn last line from a crash; everything before it is intact
+                    continue
+                self.entries[entry.entry_id] = entry
+
+    def _compact(self):
+        """Rewrite the file with only the latest state of entries still in retention."""
+        cutoff = time.time() - self.retention
+        kept = {key: entry for key, entry in self.entries.items() if entry.sent_at >= cutoff}
+        self.entries = kept
+        if self._lines <= len(kept):
+            return
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                for entry in kept.values():
+                    handle.write(self._line(entry))
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self._lines = len(kept)
+
+    @staticmethod
+    def _line(entry: JournalEntry) -> str:
+        record = {
+            "id": entry.entry_id,
+            "target": list(entry.target),
+            "mission": int(entry.mission),
+            "ships": entry.ships,
+            "at": entry.sent_at,
+            "origin": entry.origin,
+            "status": entry.status,
+        }
+        return json.dumps(record, ensure_ascii=False) + "\n"
+
+    def _append(self, entry: JournalEntry):
+        self.entries[entry.entry_id] = entry
+        if self._handle is None:
+            return
+        self._handle.write(self._line(entry))
+        self._handle.flush()
+        self._unsynced += 1
+        if (
+            self._unsynced >= self.fsync_every
+            or time.monotonic() - self._last_sync >= self.fsync_interval
+        ):
+            self.sync()
+
+    def sync(self):
+        """Force everything written so far to disk."""
+        if self._handle is None or not self._unsynced:
+            return
+        os.fsync(self._handle.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        if self._handle is not None:
+            self.sync()
+            self._handle.close()
+            self._handle = None
+
+    # === Recording ===
+
+    def begin(
+        self, target: tuple[int, int, int], mission: Mission, ships: dict[str, int], origin: str = ""
+    ) -> JournalEntry:
+        """Record a mission that is about to be sent."""
+        entry = JournalEntry(
+            entry_id=uuid.uuid4().hex[:12],
+            target=tuple(target),
+            mission=mission,
+            ships=dict(ships),
+            sent_at=time.time(),
+            origin=origin,
+        )
+        self._append(entry)
+        return entry
+
+    def confirm(self, entry: JournalEntry):
+        self._append(replace(entry, status=CONFIRMED))
+
+    def fail(self, entry: JournalEntry):
+        self._append(replace(entry, status=FAILED))
+
+    # === Resuming ===
+
+    def recent_targets(self, mission: Mission = Mission.ATTACK, now: float | None = None) -> set:
+        """Targets hit (or possibly hit) by this mission within the cooldown."""
+        now = time.time() if now is None else now
+        return {
+            entry.target
+            for entry in self.entries.values()
+            if entry.mission == mission and entry.status != FAILED and now - entry.sent_at < self.cooldown
+        }
+
+    def skip_recent(
+        self, targets: Iterable[tuple[int, int, int]], mission: Mission = Mission.ATTACK
+    ) -> list[tuple[int, int, int]]:
+        """Drop targets already hit within the cooldown, keeping the order of the rest."""
+        targets = [tuple(target) for target in targets]
+        recent = self.recent_targets(mission)
+        remaining = [target for target in targets if target not in recent]
+        if len(remaining) < len(targets):
+            log.info(
+                f"Resuming: skipping {len(targets) - len(remaining)} targets hit in the last "
+                f"{self.cooldown / 60:.0f} min"
+            )
+        return remaining
+
+    def pending(self) -> list[JournalEntry]:
+        return [entry for entry in self.entries.values() if entry.status == PENDING]
+
+    def reconcile(self, events) -> tuple[int, int]:
+        """
+        Settle pending entries left by a crash against the live event list.
+
+        A pending entry whose target has one of our fleets on the same
+        mission in flight was sent; any other is marked failed so a resume
+        tries it again. (A fleet that already came back looks unsent too;
+        with cooldowns shorter than the round trip that doesn't happen.)
+
+        Args:
+            events: FleetEvents from the event list
+
+        Returns:
+            Tuple of (confirmed, failed) counts
+        """
+        in_flight = {
+            (event.destination, event.mission) for event in events if not event.hostile
+        }
+        confirmed = failed = 0
+        for entry in self.pending():
+            if (entry.target, entry.mission) in in_flight:
+                self.confirm(entry)
+                confirmed += 1
+            else:
+                self.fail(entry)
+                failed += 1
+        self.sync()
+        return confirmed, failed
@@ -2,6 +2,11 @@
 
 from playwright.sync_api import Page, BrowserContext, TimeoutError as PlaywrightTimeout
 
+from .utils.governor import pace
+from .utils.log import get_logger
+
+log = get_logger(__name__)
+
 
 class LoginError(Exception):
     """Raised when automatic login fails."""
@@ -37,36 +42,38 @@ class LoginHandler:
         """
         try:
             # Step 1: Click "Jugar" on lobby page
-            print("Looking for Play button on lobby...")
+            log.debug("Looking for Play button on lobby...")
 
             # Navigate directly to accounts page
             accounts_url = "https://lobby.ogame.gameforge.com/es_ES/accounts"
-            print(f"Navigating to {accounts_url}...")
+            log.debug(f"Navigating to {accounts_url}...")
+            pace("navigate")
             self.page.goto(accounts_url, wait_until="domcontentloaded")
             self.page.wait_for_load_state("networkidle")
             self.page.wait_for_timeout(2000)
 
             # Find and click "Jugar" button
-            print("Looking for Jugar button...")
+            log.debug("Looking for Jugar button...")
             play_btn = self.page.locator("button:has-text('Jugar')").first
             play_btn.wait_for(state="visible", timeout=10000)
-            print("Found Jugar button, clicking...")
+            log.debug("Found Jugar button, clicking...")
 
             # Listen for new page (game opens in new tab)
+            pace("click")
             with self.context.expect_page(timeout=timeout) as new_page_info:
                 play_btn.click()
 
             # Get the new game page
             self._game_page = new_page_info.value
             self._game_page.wait_for_load_state("domcontentloaded")
-            print("New tab opened, waiting for game to load...")
+            log.debug("New tab opened, waiting for game to load...")
             self._game_page.wait_for_timeout(3000)
 
             # Step 3: Verify we're in the game
             self._game_page.wait_for_load_state("networkidle")
 
             if self._verify_game_loaded(self._game_page):
-                print("Game loaded successfully!")
+                log.info("Game loaded successfully!")
                 return self._game_page
             else:
                 raise LoginError("Game page loaded but couldn't verify login")
@@ -99,19 +106,19 @@ class LoginHandler:
         input("\nPress Enter when you're in the game... ")
 
         # Find the game page among all open tabs
-        game_page = self._find_game_page()
+        game_page = self.find_game_page()
         if game_page:
             self._game_page = game_page
-            print("Game page found!")
+            log.debug("Game page found!")
             return game_page
 
         raise LoginError("Couldn't find game page. Make sure you're logged in and try again.")
 
-    def _find_game_page(self) -> Page | None:
+    def find_game_page(self) -> Page | None:
         """Find the game page among open tabs."""
         for page in self.context.pages:
             url = page.url
-            print(f"  Checking tab: {url[:60]}...")
+            log.debug(f"  Checking tab: {url[:60]}...")
 
             # Look for OGame game URLs (contain server ID like s123-es.ogame.gameforge.com)
             if "ogame.gameforge.com" in url and "/game/" in url:
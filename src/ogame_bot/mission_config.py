@@ -7,38 +7,144 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from .economy import get_tech
+
 
 @dataclass(frozen=True)
 class ExpeditionConfig:
-    planet: str
+    planets: tuple[str, ...]
     ships: dict[str, int]
     max_expeditions: int | None = None
 
+    @property
+    def planet(self) -> str:
+        return self.planets[0]
+
 
 @dataclass(frozen=True)
 class FarmingConfig:
-    planet: str
+    planets: tuple[str, ...]
     ships: dict[str, int]
     targets: list[tuple[int, int, int]]
 
+    @property
+    def planet(self) -> str:
+        return self.planets[0]
+
+
+@dataclass(frozen=True)
+class HarvestConfig:
+    planets: tuple[str, ...]
+    radius: int = 5  # systems either side of each origin to watch for debris
+    min_debris: int = 20000  # smallest field worth sending collectors to
+
+    @property
+    def planet(self) -> str:
+        return self.planets[0]
+
+
+@dataclass(frozen=True)
+class BuildPlan:
+    """Target levels to reach, in order, per planet (buildings) and for research."""
+
+    planets: dict[str, list[tuple[str, int]]]
+    research: list[tuple[str, int]]
+    research_planet: str | None = None
+
 
 def load_expeditions(path: Path) -> ExpeditionConfig:
     data = _load_json(path)
-    planet = _require_str(data, "planet", path)
+    planets = _require_planets(data, path)
     ships = _require_ships(data, path)
     max_expeditions = data.get("max_expeditions")
     if max_expeditions is not None:
         if not isinstance(max_expeditions, int) or max_expeditions < 0:
             raise ValueError(f"{path}: max_expeditions must be a non-negative integer")
-    return ExpeditionConfig(planet=planet, ships=ships, max_expeditions=max_expeditions)
+    return ExpeditionConfig(planets=planets, ships=ships, max_expeditions=max_expeditions)
 
 
 def load_farming(path: Path) -> FarmingConfig:
     data = _load_json(path)
-    planet = _require_str(data, "planet", path)
+    planets = _require_planets(data, path)
     ships = _require_ships(data, path)
     targets = _require_targets(data, path)
-    return FarmingConfig(planet=planet, ships=ships, targets=targets)
+    return FarmingConfig(planets=planets, ships=ships, targets=targets)
+
+
+def load_harvest(path: Path) -> HarvestConfig:
+    data = _load_json(path)
+    planets = _require_planets(data, path)
+    values = {}
+    for key in ("radius", "min_debris"):
+        if key in data:
+            value = data[key]
+            if not isinstance(value, int) or value < 0:
+                raise ValueError(f"{path}: {key} must be a non-negative integer")
+            values[key] = value
+    return HarvestConfig(planets=planets, **values)
+
+
+def load_build_plan(path: Path) -> BuildPlan:
+    data = _load_json(path)
+
+    planets_data = data.get("planets", {})
+    if not isinstance(planets_data, dict):
+        raise ValueError(f"{path}: 'planets' must be an object of planet -> items")
+    planets = {
+        name: _require_plan_items(items, "building", f"planets.{name}", path)
+        for name, items in planets_data.items()
+    }
+
+    research: list[tuple[str, int]] = []
+    research_planet = None
+    if "research" in data:
+        research_data = data["research"]
+        if not isinstance(research_data, dict):
+            raise ValueError(f"{path}: 'research' must be an object with 'planet' and 'items'")
+        research_planet = _require_str(research_data, "planet", path)
+        research = _require_plan_items(research_data.get("items"), "research", "research.items", path)
+
+    if not planets and not research:
+        raise ValueError(f"{path}: plan has nothing to build or research")
+    return BuildPlan(planets=planets, research=research, research_planet=research_planet)
+
+
+def save_build_plan(plan: BuildPlan, path: Path):
+    """Write a plan in the format load_build_plan reads."""
+    data: dict[str, Any] = {
+        "planets": {
+            name: [f"{key}:{level}" for key, level in items]
+            for name, items in plan.planets.items()
+        }
+    }
+    if plan.research and plan.research_planet:
+        data["research"] = {
+            "planet": plan.research_planet,
+            "items": [f"{key}:{level}" for key, level in plan.research],
+        }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as handle:
+        json.dump(data, handle, indent=2, ensure_ascii=False)
+        handle.write("\n")
+
+
+def _require_plan_items(items: Any, kind: str, where: str, path: Path) -> list[tuple[str, int]]:
+    """Parse ["metal_mine:12", ...] into [(key, target level), ...]."""
+    if not isinstance(items, list):
+        raise ValueError(f"{path}: '{where}' must be an array of \"name:level\" strings")
+    parsed: list[tuple[str, int]] = []
+    for item in items:
+        key, _, level = item.partition(":") if isinstance(item, str) else ("", "", "")
+        if not key or not level.isdigit() or int(level) <= 0:
+            raise ValueError(f"{path}: '{where}' items must look like \"metal_mine:12\", got {item!r}")
+        try:
+            tech = get_tech(key)
+        except ValueError as exc:
+            raise ValueError(f"{path}: {exc}") from None
+        if tech.kind != kind:
+            raise ValueError(f"{path}: '{key}' is a {tech.kind}, not allowed in '{where}'")
+        parsed.append((key, int(level)))
+    return parsed
 
 
 def _load_json(path: Path) -> dict[str, Any]:
@@ -58,6 +164,22 @@ def _require_str(data: dict[str, Any], key: str, path: Path) -> str:
     return value
 
 
+def _require_planets(data: dict[str, Any], path: Path) -> tuple[str, ...]:
+    """Accept either a single 'planet' or a list of origin 'planets'."""
+    if "planets" not in data:
+        return (_require_str(data, "planet", path),)
+    if "planet" in data:
+        raise ValueError(f"{path}: use either 'planet' or 'planets', not both")
+    planets = data["planets"]
+    if not isinstance(planets, list) or not planets:
+        raise ValueError(f"{path}: 'planets' must be a non-empty array")
+    if not all(isinstance(name, str) and name.strip() for name in planets):
+        raise ValueError(f"{path}: planet names must be non-empty strings")
+    if len(set(planets)) != len(planets):
+        raise ValueError(f"{path}: 'planets' contains duplicates")
+    return tuple(planets)
+
+
 def _require_ships(data: dict[str, Any], path: Path) -> dict[str, int]:
     ships = data.get("ships")
     if not isinstance(ships, dict) or not ships:
@@ -0,0 +1,191 @@
+"""Assign missions to origin planets so total flight time is minimised."""
+
+import heapq
+from dataclasses import dataclass, field
+
+from .game_data import EXPEDITION_POSITION, Mission, flight_time
+
+
+@dataclass(frozen=True)
+class Origin:
+    """A planet that can send missions."""
+
+    name: str
+    coords: tuple[int, int, int]
+    inventory: dict[str, int]
+
+
+@dataclass(frozen=True)
+class MissionRequest:
+    """A mission to send. target=None means an expedition from the origin's own system."""
+
+    mission: Mission
+    ships: dict[str, int]
+    target: tuple[int, int, int] | None = None
+
+    def target_from(self, origin: Origin) -> tuple[int, int, int]:
+        if self.target is not None:
+            return self.target
+        galaxy, system, _ = origin.coords
+        return (galaxy, system, EXPEDITION_POSITION)
+
+
+@dataclass(frozen=True)
+class Assignment:
+    origin: Origin
+    request: MissionRequest
+    flight_time: float  # seconds, one way
+
+    @property
+    def target(self) -> tuple[int, int, int]:
+        return self.request.target_from(self.origin)
+
+
+@dataclass
+class MissionPlan:
+    """Missions assigned to origins, plus those no origin could supply."""
+
+    assignments: list[Assignment] = field(default_factory=list)
+    unassigned: list[MissionRequest] = field(default_factory=list)
+
+    @property
+    def total_flight_time(self) -> float:
+        return sum(assignment.flight_time for assignment in self.assignments)
+
+    def by_origin(self) -> dict[str, list[Assignment]]:
+        """Assignments grouped by origin name, so each planet switch is paid once."""
+        groups: dict[str, list[Assignment]] = {}
+        for assignment in self.assignments:
+            groups.setdefault(assignment.origin.name, []).append(assignment)
+        return groups
+
+
+def capacity(inventory: dict[str, int], ships: dict[str, int]) -> int:
+    """How many times a ship config can be sent from an inventory."""
+    counts = []
+    for name, amount in ships.items():
+        available = next((have for own, have in inventory.items() if own.lower() == name.lower()), 0)
+        counts.append(available // amount)
+    return min(counts, default=0)
+
+
+def plan_missions(
+    requests: list[MissionRequest],
+    origins: list[Origin],
+    max_missions: int | None = None,
+    universe_speed: float = 1.0,
+) -> MissionPlan:
+    """
+    Assign each mission to an origin, minimising total flight time.
+
+    Every origin can supply as many missions as its inventory covers, so this
+    is an assignment problem with capacities (a transportation problem). It is
+    solved exactly with min-cost flow: each augmentation adds one more mission
+    along the cheapest path, so the result sends as many missions as possible
+    and, among those, has the least total flight time.
+
+    Args:
+        requests: Missions to send
+        origins: Candidate origin planets with their ship inventories
+        max_missions: Send at most this many (e.g., free fleet slots)
+        universe_speed: Fleet speed multiplier of the universe
+
+    Returns:
+        MissionPlan with the chosen assignments and the missions left out
+    """
+    limit = len(requests) if max_missions is None else min(max_missions, len(requests))
+
+    # Node layout: 0 = source, 1..n = requests, n+1..n+k = origins, n+k+1 = sink
+    n, k = len(requests), len(origins)
+    source, sink = 0, n + k + 1
+    graph = _FlowGraph(n + k + 2)
+
+    times: dict[tuple[int, int], float] = {}
+    for i, request in enumerate(requests):
+        graph.add_edge(source, 1 + i, 1, 0.0)
+        for j, origin in enumerate(origins):
+            if capacity(origin.inventory, request.ships) == 0:
+                continue
+            seconds = flight_time(
+                origin.coords, request.target_from(origin), request.ships,
+                universe_speed=universe_speed,
+            )
+            times[(i, j)] = seconds
+            graph.add_edge(1 + i, 1 + n + j, 1, seconds)
+
+    for j, origin in enumerate(origins):
+        # Requests may use different ship configs; cap by the most generous one
+        supply = max((capacity(origin.inventory, request.ships) for request in requests), default=0)
+        graph.add_edge(1 + n + j, sink, supply, 0.0)
+
+    graph.min_cost_flow(source, sink, limit)
+
+    plan = MissionPlan()
+    for i, request in enumerate(requests):
+        j = graph.flow_target(1 + i, first=1 + n, last=n + k)
+        if j is None:
+            plan.unassigned.append(request)
+        else:
+            origin = origins[j - 1 - n]
+            plan.assignments.append(Assignment(origin, request, times[(i, j - 1 - n)]))
+    return plan
+
+
+class _FlowGraph:
+    """Residual graph for successive-shortest-path min-cost flow."""
+
+    def __init__(self, size: int):
+        self.size = size
+        # Each edge: [to, capacity, cost, index of reverse edge]
+        self.edges: list[list[list]] = [[] for _ in range(size)]
+
+    def add_edge(self, frm: int, to: int, cap: int, cost: float):
+        self.edges[frm].append([to, cap, cost, len(self.edges[to])])
+        self.edges[to].append([frm, 0, -cost, len(self.edges[frm]) - 1])
+
+    def min_cost_flow(self, source: int, sink: int, limit: int) -> int:
+        """Push up to limit units of flow at minimum cost. Returns the flow pushed."""
+        potential = [0.0] * self.size
+        flow = 0
+        while flow < limit:
+            # Dijkstra with potentials (all reduced costs are non-negative)
+            dist = [float("inf")] * self.size
+            parent: list[tuple[int, int] | None] = [None] * self.size
+            dist[source] = 0.0
+            heap = [(0.0, source)]
+            while heap:
+                d, node = heapq.heappop(heap)
+                if d > dist[node]:
+                    continue
+                for index, (to, cap, cost, _) in enumerate(self.edges[node]):
+                    if cap <= 0:
+                        continue
+                    nd = d + cost + potential[node] - potential[to]
+                    if nd < dist[to] - 1e-9:
+                        dist[to] = nd
+                        parent[to] = (node, index)
+                        heapq.heappush(heap, (nd, to))
+
+            if dist[sink] == float("inf"):
+                break
+            for node in range(self.size):
+                if dist[node] < float("inf"):
+                    potential[node] += dist[node]
+
+            # Every source edge has capacity 1, so each path carries one unit
+            node = sink
+            while node != source:
+                prev, index = parent[node]
+                edge = self.edges[prev][index]
+                edge[1] -= 1
+                self.edges[node][edge[3]][1] += 1
+                node = prev
+            flow += 1
+        return flow
+
+    def flow_target(self, node: int, first: int, last: int) -> int | None:
+        """The node in [first, last] that node sends flow to, if any."""
+        for to, cap, cost, _ in self.edges[node]:
+            if first <= to <= last and cap == 0 and cost >= 0:
+                return to
+        return None
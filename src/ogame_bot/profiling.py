@@ -0,0 +1,317 @@
+"""Profiling mode: cProfile + Playwright trace, merged into one report."""
+
+import cProfile
+import io
+import json
+import pstats
+import time
+import zipfile
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+from .utils.log import get_logger
+
+log = get_logger(__name__)
+
+if TYPE_CHECKING:
+    # Only for annotations: main.py imports this module before deciding to launch a browser
+    from playwright.sync_api import BrowserContext
+
+PHASES = ("all", "expeditions", "farming")
+
+# Classes whose methods get a line in the report, by source file
+PROFILED_CLASSES = {
+    "fleet.py": "Fleet",
+    "navigation.py": "Navigation",
+    "login.py": "LoginHandler",
+}
+
+# Functions in these files are counted as Playwright time (IPC + browser + server)
+PLAYWRIGHT_MARKER = "/playwright/"
+DELAY_FUNCTION = ("delay.py", "human_delay")
+# Waiting for the action governor's tokens
+PACING_FUNCTION = ("governor.py", "acquire")
+
+FuncKey = tuple[str, int, str]
+
+
+class RunProfiler:
+    """
+    Collect a cProfile dump and a Playwright trace for a run (or one phase of it).
+
+    Everything goes into a single directory per run:
+        profile.pstats  cProfile data (open with `python -m pstats` or snakeviz)
+        trace.zip       Playwright trace (open with `playwright show-trace`);
+                        a relaunched browser traces to trace.2.zip, ...
+        report.txt      wall time per Fleet/Navigation/LoginHandler method
+        report.json     same report, machine readable
+    """
+
+    def __init__(self, root: Path, phase: str = "all"):
+        """
+        Args:
+            root: Directory under which the run's artifact directory is created
+            phase: "all" for the whole run, or "expeditions"/"farming" for one phase
+        """
+        if phase not in PHASES:
+            raise ValueError(f"Unknown profiling phase: {phase}")
+        self.phase_filter = phase
+        self.directory = Path(root) / datetime.now().strftime("%Y%m%d-%H%M%S")
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._profile = cProfile.Profile()
+        self._context: "BrowserContext | None" = None
+        self._tracing = False
+        self._traces = 0
+        self._in_phase = False
+        self._wall = 0.0
+        self._started: float | None = None
+
+    @property
+    def whole_run(self) -> bool:
+        return self.phase_filter == "all"
+
+    # === Lifecycle ===
+
+    def start(self):
+        """Start Python profiling (whole-run mode only)."""
+        if self.whole_run:
+            self._enable()
+
+    def attach(self, context: "BrowserContext"):
+        """Called once the browser is up; starts the trace if its phase is running."""
+        self._context = context
+        if self.whole_run or self._in_phase:
+            self._start_tracing()
+
+    def detach(self):
+        """Called before the browser closes; the trace must be saved first."""
+        self._stop_tracing()
+        self._context = None
+
+    @contextmanager
+    def phase(self, name: str):
+        """Profile a phase of the run if it is the one selected."""
+        if self.phase_filter != name:
+            yield
+            return
+        self._in_phase = True
+        self._start_tracing()
+        self._enable()
+        try:
+            yield
+        finally:
+            self._in_phase = False
+            self._disable()
+            self._stop_tracing()
+
+    def finish(self) -> Path:
+        """Stop profiling, write every artifact and return the run directory."""
+        self._disable()
+        self._stop_tracing()
+
+        self._profile.dump_stats(self.directory / "profile.pstats")
+        report = self.build_report()
+        (self.directory / "report.json").write_text(json.dumps(report, indent=2), encoding="utf-8")
+        (self.directory / "report.txt").write_text(format_report(report), encoding="utf-8")
+        log.info(f"Profile written to {self.directory}")
+        return self.directory
+
+    def _enable(self):
+        if self._started is None:
+            self._started = time.perf_counter()
+            self._profile.enable()
+
+    def _disable(self):
+        if self._started is not None:
+            self._profile.disable()
+            self._wall += time.perf_counter() - self._started
+            self._started = None
+
+    def _start_tracing(self):
+        if self._context is None or self._tracing:
+            return
+        self._context.tracing.start(screenshots=True, snapshots=True)
+        self._tracing = True
+        self._traces += 1
+
+    def _stop_tracing(self):
+        if self._context is None or not self._tracing:
+            return
+        self._context.tracing.stop(path=self.trace_path(self._traces))
+        self._tracing = False
+
+    def trace_path(self, number: int) -> Path:
+        """Path of the n-th trace; each browser (after a relaunch) gets its own."""
+        if number == 1:
+            return self.directory / "trace.zip"
+        return self.directory / f"trace.{number}.zip"
+
+    # === Report ===
+
+    def build_report(self) -> dict:
+        """Attribute wall time to each profiled method and summarise the run."""
+        stats = pstats.Stats(self._profile, stream=io.StringIO())
+        breakdown = _Breakdown(stats.stats)
+
+        methods = []
+        for func, (_, calls, _, cumulative, _) in stats.stats.items():
+            filename, _, name = func
+            owner = PROFILED_CLASSES.get(Path(filename).name)
+            # Skip module and class bodies
+            if owner is None or name.startswith("<") or name == owner:
+                continue
+            delay = breakdown.delay(func)
+            pacing = breakdown.pacing(func)
+            playwright = breakdown.playwright(func)
+            methods.append({
+                "method": f"{owner}.{name}",
+                "calls": calls,
+                "wall": cumulative,
+                "human_delay": delay,
+                "pacing": pacing,
+                "playwright": playwright,
+                "python": max(0.0, cumulative - delay - pacing - playwright),
+            })
+        methods.sort(key=lambda row: row["wall"], reverse=True)
+
+        total_delay = sum(ct for func, (_, _, _, ct, _) in stats.stats.items() if _is_delay(func))
+        total_pacing = sum(ct for func, (_, _, _, ct, _) in stats.stats.items() if _is_pacing(func))
+        total_playwright = breakdown.playwright_total()
+        traces = [self.trace_path(number) for number in range(1, self._traces + 1)]
+        return {
+            "phase": self.phase_filter,
+            "wall": self._wall,
+            "human_delay": total_delay,
+            "pacing": total_pacing,
+            "playwright": total_playwright,
+            "python": max(0.0, self._wall - total_delay - total_pacing - total_playwright),
+            "network": _trace_network(traces),
+            "methods": methods,
+        }
+
+
+def _is_delay(func: FuncKey) -> bool:
+    return Path(func[0]).name == DELAY_FUNCTION[0] and func[2] == DELAY_FUNCTION[1]
+
+
+def _is_pacing(func: FuncKey) -> bool:
+    return Path(func[0]).name == PACING_FUNCTION[0] and func[2] == PACING_FUNCTION[1]
+
+
+def _is_playwright(func: FuncKey) -> bool:
+    return PLAYWRIGHT_MARKER in func[0].replace("\\", "/")
+
+
+class _Breakdown:
+    """
+    Split a function's cumulative time into human_delay, pacing and Playwright time.
+
+    Time spent in an intermediate callee is attributed back to each caller in
+    proportion to how much of the callee's cumulative time that caller caused.
+    """
+
+    def __init__(self, raw: dict):
+        self.raw = raw
+        self.callees: dict[FuncKey, dict[FuncKey, float]] = {}
+        for callee, (_, _, _, _, callers) in raw.items():
+            for caller, (_, _, _, cumulative) in callers.items():
+                self.callees.setdefault(caller, {})[callee] = cumulative
+        self._memo: dict[tuple[str, FuncKey], float] = {}
+
+    def delay(self, func: FuncKey) -> float:
+        return self._share("delay", func, set())
+
+    def pacing(self, func: FuncKey) -> float:
+        return self._share("pacing", func, set())
+
+    def playwright(self, func: FuncKey) -> float:
+        return self._share("playwright", func, set())
+
+    def playwright_total(self) -> float:
+        """Time in Playwright entry points called from outside Playwright."""
+        total = 0.0
+        for callee, (_, _, _, _, callers) in self.raw.items():
+            if not _is_playwright(callee):
+                continue
+            for caller, (_, _, _, cumulative) in callers.items():
+                if not _is_playwright(caller):
+                    total += cumulative
+        return total
+
+    def _share(self, kind: str, func: FuncKey, visiting: set) -> float:
+        key = (kind, func)
+        if key in self._memo:
+            return self._memo[key]
+        if func in visiting:
+            return 0.0
+        visiting.add(func)
+
+        total = 0.0
+        for callee, cumulative in self.callees.get(func, {}).items():
+            if _is_delay(callee):
+                total += cumulative if kind == "delay" else 0.0
+            elif _is_pacing(callee):
+                total += cumulative if kind == "pacing" else 0.0
+            elif _is_playwright(callee):
+                total += cumulative if kind == "playwright" else 0.0
+            else:
+                callee_total = self.raw[callee][3]
+                if callee_total > 0:
+                    fraction = min(1.0, cumulative / callee_total)
+                    total += fraction * self._share(kind, callee, visiting)
+
+        visiting.discard(func)
+        self._memo[key] = total
+        return total
+
+
+def _trace_network(trace_paths: list[Path]) -> dict:
+    """Sum request count, server wait and bytes over Playwright traces."""
+    summary = {"requests": 0, "server_wait": 0.0, "transfer": 0.0, "bytes": 0}
+    for trace_path in trace_paths:
+        if trace_path.exists():
+            _add_trace_network(trace_path, summary)
+    return summary
+
+
+def _add_trace_network(trace_path: Path, summary: dict):
+    try:
+        with zipfile.ZipFile(trace_path) as archive:
+            names = [name for name in archive.namelist() if name.endswith(".network")]
+            for name in names:
+                for line in archive.read(name).decode("utf-8", "replace").splitlines():
+                    record = json.loads(line)
+                    if record.get("type") != "resource-snapshot":
+                        continue
+                    snapshot = record.get("snapshot", {})
+                    timings = snapshot.get("timings", {})
+                    summary["requests"] += 1
+                    summary["server_wait"] += max(0.0, timings.get("wait", 0)) / 1000
+                    summary["transfer"] += max(0.0, timings.get("receive", 0)) / 1000
+                    summary["bytes"] += max(0, snapshot.get("response", {}).get("bodySize", 0))
+    except (zipfile.BadZipFile, ValueError) as e:
+        log.warning(f"Could not read network data from {trace_path.name}: {e}")
+
+
+def format_report(report: dict) -> str:
+    """Render the report as a plain-text table."""
+    network = report["network"]
+    lines = [
+        f"Profiled phase: {report['phase']}",
+        f"Wall time:      {report['wall']:8.2f}s",
+        f"  human_delay:  {report['human_delay']:8.2f}s",
+        f"  pacing:       {report['pacing']:8.2f}s  (waiting for the action governor)",
+        f"  Playwright:   {report['playwright']:8.2f}s"
+        f"  (server wait {network['server_wait']:.2f}s over {network['requests']} requests,"
+        f" {network['bytes'] / 1024:.0f} KiB)",
+        f"  Python:       {report['python']:8.2f}s",
+        "",
+        f"{'method':<42}{'calls':>7}{'wall':>10}{'delay':>10}{'pacing':>10}{'playwright':>12}{'python':>10}",
+    ]
+    for row in report["methods"]:
+        lines.append(
+            f"{row['method']:<42}{row['calls']:>7}{row['wall']:>10.2f}"
+            f"{row['human_delay']:>10.2f}{row['pacing']:>10.2f}{row['playwright']:>12.2f}{row['python']:>10.2f}"
+        )
+    return "\n".join(lines) + "\n"
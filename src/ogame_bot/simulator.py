@@ -0,0 +1,308 @@
+"""Vectorized economy simulator and build-order optimizer (requires NumPy)."""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - optional dependency
+    raise ImportError(
+        "The build-order simulator needs NumPy. Install it with: uv sync --extra sim"
+    ) from exc
+
+from .economy import TECHS
+from .mission_config import BuildPlan
+
+# Buildings the simulator models, in array order
+SIM_TECHS = (
+    "metal_mine",
+    "crystal_mine",
+    "deuterium_synthesizer",
+    "solar_plant",
+    "metal_storage",
+    "crystal_storage",
+    "deuterium_tank",
+    "robotics_factory",
+)
+METAL, CRYSTAL, DEUTERIUM, SOLAR, METAL_STORE, CRYSTAL_STORE, DEUTERIUM_STORE, ROBOTICS = range(len(SIM_TECHS))
+
+MAX_LEVEL = 60
+
+# Default value of each resource when comparing plans (usual 3:2:1 trade ratio)
+DEFAULT_WEIGHTS = (1.0, 1.5, 3.0)
+
+
+@dataclass
+class PlanetEconomy:
+    """Starting state of one planet."""
+
+    name: str
+    levels: dict[str, int] = field(default_factory=dict)
+    resources: tuple[float, float, float] = (0.0, 0.0, 0.0)
+    max_temperature: int = 40  # affects deuterium production
+    nanite: int = 0
+
+
+def load_economy(path: Path) -> list[PlanetEconomy]:
+    """
+    Load starting planet states from JSON:
+
+        {"planets": {"Homeworld": {"levels": {"metal_mine": 10, ...},
+                                   "resources": [1000, 500, 0],
+                                   "max_temperature": 40}}}
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"Economy file not found: {path}")
+    with path.open("r", encoding="utf-8") as handle:
+        data = json.load(handle)
+    planets_data = data.get("planets") if isinstance(data, dict) else None
+    if not isinstance(planets_data, dict) or not planets_data:
+        raise ValueError(f"{path}: 'planets' must be a non-empty object")
+
+    planets = []
+    for name, state in planets_data.items():
+        levels = state.get("levels", {})
+        unknown = set(levels) - set(SIM_TECHS) - {"nanite_factory"}
+        if unknown:
+            raise ValueError(f"{path}: {name}: buildings not simulated: {sorted(unknown)}")
+        resources = state.get("resources", [0, 0, 0])
+        if not isinstance(resources, list) or len(resources) != 3:
+            raise ValueError(f"{path}: {name}: 'resources' must be [metal, crystal, deuterium]")
+        planets.append(PlanetEconomy(
+            name=name,
+            levels={key: int(level) for key, level in levels.items() if key in SIM_TECHS},
+            resources=tuple(float(amount) for amount in resources),
+            max_temperature=int(state.get("max_temperature", 40)),
+            nanite=int(levels.get("nanite_factory", 0)),
+        ))
+    return planets
+
+
+def _cost_table() -> "np.ndarray":
+    """cost[tech, level] = (metal, crystal, deuterium) to reach that level."""
+    table = np.zeros((len(SIM_TECHS), MAX_LEVEL + 2, 3))
+    for index, key in enumerate(SIM_TECHS):
+        tech = TECHS[key]
+        for level in range(1, MAX_LEVEL + 2):
+            table[index, level] = tech.cost(level)
+    return table
+
+
+COSTS = _cost_table()
+
+
+def _growth(level: "np.ndarray") -> "np.ndarray":
+    return level * 1.1 ** level
+
+
+def production(levels: "np.ndarray", temperature: "np.ndarray", universe_speed: float = 1.0) -> "np.ndarray":
+    """
+    Hourly production for arrays of planets.
+
+    Args:
+        levels: (..., len(SIM_TECHS)) building levels
+        temperature: (...) max planet temperature, broadcastable to levels[..., 0]
+        universe_speed: Economy speed of the universe
+
+    Returns:
+        (..., 3) metal, crystal, deuterium per hour
+    """
+    levels = levels.astype(float)
+    metal, crystal, deut, solar = (levels[..., i] for i in (METAL, CRYSTAL, DEUTERIUM, SOLAR))
+
+    energy = 20 * _growth(solar)
+    consumption = 10 * _growth(metal) + 10 * _growth(crystal) + 20 * _growth(deut)
+    factor = np.where(consumption > 0, np.minimum(1.0, energy / np.maximum(consumption, 1e-9)), 1.0)
+
+    out = np.empty(levels.shape[:-1] + (3,))
+    out[..., 0] = 30 + 30 * _growth(metal) * factor
+    out[..., 1] = 15 + 20 * _growth(crystal) * factor
+    out[..., 2] = 10 * _growth(deut) * (1.44 - 0.004 * temperature) * factor
+    return out * universe_speed
+
+
+def storage(levels: "np.ndarray") -> "np.ndarray":
+    """(..., 3) storage caps from storage building levels."""
+    stores = levels[..., [METAL_STORE, CRYSTAL_STORE, DEUTERIUM_STORE]].astype(float)
+    return 5000 * np.floor(2.5 * np.exp(20 * stores / 33))
+
+
+@dataclass
+class SimulationResult:
+    levels: "np.ndarray"  # (B, N, T) levels at the horizon
+    resources: "np.ndarray"  # (B, N, 3) resources at the horizon
+    started: "np.ndarray"  # (B, N) plan items started before the horizon
+    production: "np.ndarray"  # (B, N, 3) hourly production at the horizon
+
+
+def simulate(
+    items: "np.ndarray",
+    levels: "np.ndarray",
+    resources: "np.ndarray",
+    temperature: "np.ndarray",
+    nanite: "np.ndarray",
+    horizon_hours: float,
+    steps: int = 480,
+    universe_speed: float = 1.0,
+) -> SimulationResult:
+    """
+    Simulate B candidate plans on N planets at once.
+
+    Each planet has one build queue that works through its plan in order:
+    an item starts as soon as it is affordable, pays its cost up front and
+    completes after its build time. Resources grow with production and stop
+    at the storage cap. Time advances in fixed steps of horizon/steps.
+
+    Args:
+        items: (B, N, K) tech indices into SIM_TECHS, -1 for padding
+        levels: (N, T) or (B, N, T) starting levels
+        resources: (N, 3) or (B, N, 3) starting resources
+        temperature: (N,) max temperatures
+        nanite: (N,) nanite factory levels
+        horizon_hours: Simulated time span
+        steps: Number of time steps
+        universe_speed: Economy speed of the universe
+
+    Returns:
+        SimulationResult with state at the horizon
+    """
+    batch, planets, length = items.shape
+    levels = np.broadcast_to(levels, (batch, planets, len(SIM_TECHS))).astype(np.int64).copy()
+    resources = np.broadcast_to(resources, (batch, planets, 3)).astype(float).copy()
+    temperature = np.broadcast_to(temperature, (batch, planets))
+    speed_up = np.broadcast_to(2.0 ** nanite, (batch, planets))
+
+    pointer = np.zeros((batch, planets), dtype=np.int64)
+    pending = np.full((batch, planets), -1, dtype=np.int64)
+    busy_until = np.zeros((batch, planets))
+    b_index, n_index = np.indices((batch, planets))
+
+    dt = horizon_hours / steps
+    for step in range(steps):
+        now = step * dt
+
+        # Finish builds that are due
+        done = (pending >= 0) & (busy_until <= now)
+        if done.any():
+            levels[b_index[done], n_index[done], pending[done]] += 1
+            pending[done] = -1
+
+        # Start the next item on idle queues that can afford it
+        has_next = pointer < length
+        next_tech = np.where(
+            has_next,
+            np.take_along_axis(items, np.minimum(pointer, length - 1)[..., None], axis=2)[..., 0],
+            -1,
+        )
+        candidate = (pending < 0) & (next_tech >= 0)
+        if candidate.any():
+            tech = np.maximum(next_tech, 0)
+            next_level = np.minimum(np.take_along_axis(levels, tech[..., None], axis=2)[..., 0] + 1, MAX_LEVEL + 1)
+            cost = COSTS[tech, next_level]
+            start = candidate & np.all(resources >= cost, axis=-1)
+            if start.any():
+                resources -= np.where(start[..., None], cost, 0.0)
+                robotics = levels[..., ROBOTICS]
+                hours = (cost[..., 0] + cost[..., 1]) / (2500 * (1 + robotics) * speed_up) / universe_speed
+                busy_until = np.where(start, now + hours, busy_until)
+                pending = np.where(start, next_tech, pending)
+                pointer = pointer + start
+
+        # Produce, up to the storage cap (resources already above it stay put)
+        caps = storage(levels)
+        grown = np.minimum(resources + production(levels, temperature, universe_speed) * dt, caps)
+        resources = np.where(resources >= caps, resources, grown)
+
+    done = (pending >= 0) & (busy_until <= horizon_hours)
+    levels[b_index[done], n_index[done], pending[done]] += 1
+
+    return SimulationResult(
+        levels=levels,
+        resources=resources,
+        started=pointer,
+        production=production(levels, temperature, universe_speed),
+    )
+
+
+def optimize_build_order(
+    planets: list[PlanetEconomy],
+    horizon_hours: float = 72,
+    depth: int = 20,
+    beam_width: int = 32,
+    steps: int = 480,
+    universe_speed: float = 1.0,
+    weights: tuple[float, float, float] = DEFAULT_WEIGHTS,
+) -> BuildPlan:
+    """
+    Find the build order per planet that maximises production at the horizon.
+
+    Beam search: starting from empty plans, every plan in the beam is
+    extended by each building in SIM_TECHS, all extensions of all planets are
+    simulated together in one batch, and the best beam_width per planet are
+    kept. beam_width=1 is a plain greedy search. Planets don't share
+    resources, so each planet's order is optimised independently, but they
+    are evaluated in the same arrays.
+
+    Args:
+        planets: Starting state of each planet
+        horizon_hours: Time at which production is compared
+        depth: Maximum number of upgrades per planet
+        beam_width: Plans kept per planet at each depth
+        steps: Simulation time steps over the horizon
+        universe_speed: Economy speed of the universe
+        weights: Value of metal, crystal and deuterium when comparing plans
+
+    Returns:
+        BuildPlan (target levels in order) that OGameBot.run_build_plan can execute
+    """
+    n_planets = len(planets)
+    n_techs = len(SIM_TECHS)
+    start_levels = np.array([[p.levels.get(key, 0) for key in SIM_TECHS] for p in planets])
+    start_resources = np.array([p.resources for p in planets], dtype=float)
+    temperature = np.array([p.max_temperature for p in planets], dtype=float)
+    nanite = np.array([p.nanite for p in planets], dtype=float)
+    value = np.asarray(weights)
+
+    # beams[n] = list of item sequences for planet n
+    beams: list[list[list[int]]] = [[[]] for _ in range(n_planets)]
+    best: list[tuple[float, list[int]]] = [(-np.inf, []) for _ in range(n_planets)]
+
+    for d in range(1, depth + 1):
+        expansions = [[seq + [tech] for seq in beam for tech in range(n_techs)] for beam in beams]
+        batch = max(len(e) for e in expansions)
+
+        items = np.full((batch, n_planets, d), -1, dtype=np.int64)
+        for n, candidates in enumerate(expansions):
+            items[:len(candidates), n] = np.array(candidates)
+
+        result = simulate(
+            items, start_levels, start_resources, temperature, nanite,
+            horizon_hours, steps=steps, universe_speed=universe_speed,
+        )
+        score = result.production @ value  # (B, N)
+
+        for n, candidates in enumerate(expansions):
+            scores = score[:len(candidates), n]
+            order = np.argsort(-scores, kind="stable")[:beam_width]
+            beams[n] = [candidates[i] for i in order]
+            top = order[0]
+            if scores[top] > best[n][0] + 1e-9:
+                # Drop items that would not even start before the horizon
+                best[n] = (float(scores[top]), candidates[top][:int(result.started[top, n])])
+
+    plan = {}
+    for planet, (_, sequence) in zip(planets, best):
+        plan[planet.name] = _to_targets(sequence, planet.levels)
+    return BuildPlan(planets=plan, research=[])
+
+
+def _to_targets(sequence: list[int], levels: dict[str, int]) -> list[tuple[str, int]]:
+    """Turn a sequence of single upgrades into (key, target level) items."""
+    current = {key: levels.get(key, 0) for key in SIM_TECHS}
+    targets = []
+    for tech in sequence:
+        key = SIM_TECHS[tech]
+        current[key] += 1
+        targets.append((key, current[key]))
+    return targets
@@ -0,0 +1,200 @@
+"""On-disk snapshot of empire state, reused across runs."""
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from .game_data import PlanetInfo
+from .utils.log import get_logger
+
+log = get_logger(__name__)
+
+# How long each kind of field can be trusted, in seconds
+DEFAULT_TTLS = {
+    "planets": 7 * 24 * 3600,  # only changes when colonising or abandoning
+    "inventory": 3600,  # fleets return and ships get built
+    "slots": 600,
+    "research": 24 * 3600,  # we see our own research finish anyway
+}
+
+
+class EmpireSnapshot:
+    """
+    Empire state that survives between runs.
+
+    Every field carries the time it was last updated and a version number that
+    increases whenever its value changes. A field is trusted while it is
+    younger than its TTL and, for ship inventories, until the next fleet lands
+    on the planet; stale fields read as None so callers rediscover them
+    from the game and store the fresh value back. The file is written
+    atomically, so a crash mid-save never leaves a half-written snapshot.
+    """
+
+    SCHEMA_VERSION = 1
+
+    def __init__(self, path: Path | None = None, ttls: dict[str, float] | None = None):
+        self.path = path
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._fields: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path: Path, ttls: dict[str, float] | None = None) -> "EmpireSnapshot":
+        """Load a snapshot; a missing, corrupt or outdated file gives an empty one."""
+        snapshot = cls(path, ttls)
+        if not path.exists():
+            return snapshot
+        try:
+            with path.open("r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError) as e:
+            log.warning(f"Ignoring unreadable snapshot {path}: {e}")
+            return snapshot
+        if not isinstance(data, dict) or data.get("schema") != cls.SCHEMA_VERSION:
+            log.warning(f"Ignoring snapshot {path} from another version")
+            return snapshot
+        snapshot._fields = data.get("fields", {})
+        return snapshot
+
+    def save(self):
+        """Write the snapshot atomically (temp file + rename) if anything changed."""
+        if self.path is None or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"schema": self.SCHEMA_VERSION, "saved_at": time.time(), "fields": self._fields}
+
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(data, handle, ensure_ascii=False)
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self._dirty = False
+
+    # === Generic fields ===
+
+    def _ttl(self, name: str) -> float:
+        return self.ttls.get(name.split(".", 1)[0], 0)
+
+    def get(self, name: str, now: float | None = None, stale_ok: bool = False) -> Any:
+        """A field's value if it is still fresh (or stale_ok), otherwise None."""
+        entry = self._fields.get(name)
+        if entry is None:
+            return None
+        now = time.time() if now is None else now
+        if not stale_ok and (
+            now - entry["updated_at"] > self._ttl(name) or now >= entry.get("expires_at", float("inf"))
+        ):
+            return None
+        return entry["value"]
+
+    def set(self, name: str, value: Any):
+        """Store a field, bumping its version if the value changed."""
+        entry = self._fields.get(name)
+        version = entry["version"] if entry else 0
+        if entry is None or entry["value"] != value:
+            version += 1
+        now = time.time()
+        self._fields[name] = {"value": value, "updated_at": now, "version": version}
+        if entry and entry.get("expires_at", 0) > now:
+            # A fleet still on its way isn't part of this reading either
+            self._fields[name]["expires_at"] = entry["expires_at"]
+        self._dirty = True
+
+    def invalidate(self, name: str):
+        if self._fields.pop(name, None) is not None:
+            self._dirty = True
+
+    def version(self, name: str) -> int:
+        """Number of distinct values a field has had (0 if never set)."""
+        entry = self._fields.get(name)
+        return entry["version"] if entry else 0
+
+    def age(self, name: str) -> float | None:
+        entry = self._fields.get(name)
+        return None if entry is None else time.time() - entry["updated_at"]
+
+    def is_stale(self, name: str, now: float | None = None) -> bool:
+        """Whether a field is missing or older than its TTL."""
+        return self.get(name, now=now) is None
+
+    # === Typed helpers ===
+
+    def planets(self, stale_ok: bool = False) -> list[PlanetInfo] | None:
+        value = self.get("planets", stale_ok=stale_ok)
+        if value is None:
+            return None
+        return [PlanetInfo(p["name"], p["planet_id"], tuple(p["coords"])) for p in value]
+
+    def set_planets(self, planets: list[PlanetInfo]):
+        self.set("planets", [
+            {"name": p.name, "planet_id": p.planet_id, "coords": list(p.coords)} for p in planets
+        ])
+
+    def inventory(self, planet_id: int, stale_ok: bool = False) -> dict[str, int] | None:
+        return self.get(f"inventory.{planet_id}", stale_ok=stale_ok)
+
+    def set_inventory(self, planet_id: int, inventory: dict[str, int]):
+        self.set(f"inventory.{planet_id}", dict(inventory))
+
+    def consume_ships(self, planet_id: int, ships: dict[str, int]):
+        """Subtract ships that just left a planet from its cached inventory."""
+        entry = self._fields.get(f"inventory.{planet_id}")
+        if entry is None:
+            return
+        remaining = dict(entry["value"])
+        for name, amount in ships.items():
+            own = next((key for key in remaining if key.lower() == name.lower()), None)
+            if own is not None:
+                remaining[own] = max(0, remaining[own] - amount)
+        # Keep the original timestamp: the rest of the inventory is as old as before
+        entry["value"] = {name: amount for name, amount in remaining.items() if amount > 0}
+        entry["version"] += 1
+        self._dirty = True
+
+    def expire_inventory(self, planet_id: int, at: float):
+        """Stop trusting a planet's cached inventory from the given unix time (a fleet lands)."""
+        entry = self._fields.get(f"inventory.{planet_id}")
+        if entry is None or entry.get("expires_at", float("inf")) <= at:
+            return
+        entry["expires_at"] = at
+        self._dirty = True
+
+    def expect_landings(self, landings: dict[tuple[int, int, int], float]) -> int:
+        """
+        Expire the cached inventory of every planet a fleet is about to land on.
+
+        Args:
+            landings: Unix time of the next landing per coordinates
+
+        Returns:
+            Number of our planets with a landing
+        """
+        planets = {p.coords: p for p in self.planets(stale_ok=True) or []}
+        landed = 0
+        for coords, at in landings.items():
+            planet = planets.get(tuple(coords))
+            if planet is not None:
+                self.expire_inventory(planet.planet_id, at)
+                landed += 1
+        return landed
+
+    def expedition_slots(self, stale_ok: bool = False) -> tuple[int, int] | None:
+        value = self.get("slots", stale_ok=stale_ok)
+        return None if value is None else tuple(value)
+
+    def set_expedition_slots(self, current: int, maximum: int):
+        self.set("slots", [current, maximum])
+
+    def research_levels(self) -> dict[str, int] | None:
+        return self.get("research")
+
+    def set_research_levels(self, levels: dict[str, int]):
+        self.set("research", dict(levels))
@@ -0,0 +1,256 @@
+"""Recover from page failures in place instead of restarting the whole run."""
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, TypeVar
+
+from playwright.sync_api import Error as PlaywrightError, Page, TimeoutError as PlaywrightTimeout
+
+from .login import LoginHandler
+from .utils.log import dump_recent, elapsed_ms, get_logger
+
+if TYPE_CHECKING:
+    from .bot import OGameBot
+
+log = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Failure classes
+SELECTOR_TIMEOUT = "selector_timeout"  # page is fine, an element didn't show up in time
+NAVIGATION_ERROR = "navigation_error"  # a load failed (network error, aborted, detached frame)
+SESSION_LOST = "session_lost"  # logged out, or the tab is no longer a game page
+BROWSER_CRASH = "browser_crash"  # page, context or browser is gone
+
+# Recovery actions, cheapest first
+RETRY = "retry"  # run the step again as it is
+RELOAD = "reload"  # reload the game page
+REATTACH = "reattach"  # find the game tab again, logging in if needed
+RELAUNCH = "relaunch"  # close the browser and start a new one
+
+# What to try for each class, in order; a class is given up on after its last action
+LADDERS = {
+    SELECTOR_TIMEOUT: (RETRY, RELOAD),
+    NAVIGATION_ERROR: (RELOAD, REATTACH),
+    SESSION_LOST: (REATTACH, RELAUNCH),
+    BROWSER_CRASH: (RELAUNCH, RELAUNCH),
+}
+
+# Playwright messages of errors that mean the browser side is gone
+_CLOSED_MARKERS = ("has been closed", "Target closed", "crashed", "Browser closed", "Connection closed")
+
+
+@dataclass(frozen=True)
+class Recovery:
+    """One failure and what it took to get past it."""
+
+    step: str
+    kind: str
+    actions: tuple[str, ...]
+    duration: float  # seconds from the failure to the step succeeding (or giving up)
+    recovered: bool
+
+
+@dataclass
+class RecoveryStats:
+    """Recoveries of a run, for the end-of-run report."""
+
+    recoveries: list[Recovery] = field(default_factory=list)
+
+    def add(self, recovery: Recovery):
+        self.recoveries.append(recovery)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Count, recovered count and mean recovery seconds per failure class."""
+        result = {}
+        for kind in LADDERS:
+            matching = [r for r in self.recoveries if r.kind == kind]
+            if not matching:
+                continue
+            result[kind] = {
+                "count": len(matching),
+                "recovered": sum(r.recovered for r in matching),
+                "mean": sum(r.duration for r in matching) / len(matching),
+            }
+        return result
+
+    def report(self):
+        for kind, summary in self.summary().items():
+            log.info(
+                f"Recoveries from {kind.replace('_', ' ')}: {summary['recovered']:.0f}/{summary['count']:.0f}, "
+                f"mean {summary['mean']:.1f}s"
+            )
+
+
+class Supervisor:
+    """
+    Run steps against the game page and recover from what breaks them.
+
+    A failed step (a Playwright error, or a falsy result when `ok` is given)
+    is classified by probing the page, then the cheapest fix for its class is
+    applied and the step is run again: retry, reload the page, find the game
+    tab again, or relaunch the browser. Repeated failures of a class move up
+    its ladder, with exponential backoff between attempts. A bot left
+    without a page by a failed relaunch counts as a browser crash. Other
+    exceptions are bugs and are not caught.
+    """
+
+    def __init__(
+        self,
+        bot: "OGameBot",
+        max_attempts: int = 4,
+        backoff: float = 1.0,
+        max_backoff: float = 30.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            bot: Bot whose page is supervised and which performs reattach/relaunch
+            max_attempts: Recovery attempts per failure before giving up
+            backoff: Seconds to wait before the second attempt; doubles after each
+            max_backoff: Longest wait between attempts
+            sleep: Sleep function (injectable for tests)
+        """
+        self.bot = bot
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.sleep = sleep
+        self.stats = RecoveryStats()
+
+    @property
+    def page(self) -> Page:
+        """The current game page; it changes after a reattach or relaunch."""
+        return self.bot.page
+
+    # === Classifying ===
+
+    def classify(self, error: Exception | None = None) -> str:
+        """
+        Work out why a step failed.
+
+        Args:
+            error: The error raised, or None for a falsy result
+
+        Returns:
+            One of SELECTOR_TIMEOUT, NAVIGATION_ERROR, SESSION_LOST, BROWSER_CRASH
+        """
+        if error is not None and any(marker in str(error) for marker in _CLOSED_MARKERS):
+            return BROWSER_CRASH
+        try:
+            page = self.bot.page
+            if page.is_closed():
+                return BROWSER_CRASH
+            if not self._in_game(page):
+                return SESSION_LOST
+        except RuntimeError:
+            return BROWSER_CRASH
+        except PlaywrightError as e:
+            return BROWSER_CRASH if any(marker in str(e) for marker in _CLOSED_MARKERS) else NAVIGATION_ERROR
+
+        if error is None or isinstance(error, PlaywrightTimeout):
+            return SELECTOR_TIMEOUT
+        return NAVIGATION_ERROR
+
+    def _has_page(self) -> bool:
+        try:
+            self.bot.page
+        except RuntimeError:
+            return False
+        return True
+
+    @staticmethod
+    def _in_game(page: Page) -> bool:
+        """Cheap probe: a game URL with the game's chrome on it, checked without waiting."""
+        if "/game/" not in page.url:
+            return False
+        return page.locator(", ".join(LoginHandler.GAME_INDICATORS)).count() > 0
+
+    # === Running ===
+
+    def run(self, step_name: str, step: Callable[[], T], ok: Callable[[T], bool] | None = None) -> T:
+        """
+        Run a step, recovering and running it again until it succeeds or attempts run out.
+
+        Steps must be safe to repeat and must re-establish their own starting
+        point (e.g. open the fleet page), since a recovery may leave the
+        browser anywhere.
+
+        Args:
+            step_name: Name for the log and the recovery stats
+            step: The step to run
+            ok: Judges a result; falsy results are failures when given
+
+        Returns:
+            The step's result. After giving up, the last falsy result is
+            returned, or the last error is raised.
+        """
+        failed_at: float | None = None
+        cause = None  # class of the first failure, which the recovery is recorded under
+        actions: list[str] = []
+        rungs: dict[str, int] = {}
+
+        while True:
+            error = None
+            try:
+                result = step()
+                if ok is None or ok(result):
+                    if failed_at is not None:
+                        self._record(step_name, cause, actions, failed_at, recovered=True)
+                    return result
+            except PlaywrightError as e:
+                error = e
+            except RuntimeError as e:
+                # No page at all (a relaunch that failed half way) is a crash;
+                # with a page attached it is a bug and not ours to handle
+                if self._has_page():
+                    raise
+                error = e
+
+            kind = self.classify(error)
+            if failed_at is None:
+                failed_at, cause = time.monotonic(), kind
+            ladder = LADDERS[kind]
+            rung = rungs.get(kind, 0)
+            if len(actions) >= self.max_attempts or rung >= len(ladder):
+                self._record(step_name, cause, actions, failed_at, recovered=False)
+                if kind != SELECTOR_TIMEOUT:
+                    # A healthy page that still says no is usually the game refusing, not a fault
+                    dump_recent("recovery")
+                if error is not None:
+                    raise error
+                return result
+
+            action = ladder[rung]
+            rungs[kind] = rung + 1
+            if actions:
+                self.sleep(min(self.backoff * 2 ** (len(actions) - 1), self.max_backoff))
+            log.warning(
+                f"{step_name}: {kind.replace('_', ' ')}, trying {action}"
+                + (f" ({error})" if error is not None else ""),
+                extra={"event": "failure", "step": step_name, "kind": kind, "action": action},
+            )
+            actions.append(action)
+            self._apply(action)
+
+    def _apply(self, action: str):
+        """Perform a recovery action; a failed one shows up when the step runs again."""
+        try:
+            if action == RELOAD:
+                self.bot.reload_page()
+            elif action == REATTACH:
+                self.bot.reattach()
+            elif action == RELAUNCH:
+                self.bot.relaunch()
+        except (PlaywrightError, RuntimeError) as e:
+            log.warning(f"Recovery action {action} failed: {e}")
+
+    def _record(self, step_name: str, kind: str, actions: list[str], failed_at: float, recovered: bool):
+        recovery = Recovery(step_name, kind, tuple(actions), time.monotonic() - failed_at, recovered)
+        self.stats.add(recovery)
+        log.info(
+            f"{step_name}: {'recovered from' if recovered else 'gave up on'} {kind.replace('_', ' ')} "
+            f"after {recovery.duration:.1f}s ({', '.join(actions) or 'no action'})",
+            extra={"event": "recovery", "step": step_name, "kind": kind, "actions": list(actions),
+                   "recovered": recovered, "duration_ms": elapsed_ms(failed_at)},
+        )
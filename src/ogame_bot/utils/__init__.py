@@ -1,5 +1,6 @@
 """Utility functions."""
 
 from .delay import human_delay
+from .governor import ActionGovernor, pace
 
-__all__ = ["human_delay"]
+__all__ = ["human_delay", "ActionGovernor", "pace"]
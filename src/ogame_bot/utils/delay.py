@@ -3,6 +3,10 @@
 import random
 import time
 
+from .log import get_logger
+
+log = get_logger(__name__)
+
 
 def human_delay(min_sec: float = 0.5, max_sec: float = 1.0) -> float:
     """
@@ -23,6 +27,6 @@ def human_delay(min_sec: float = 0.5, max_sec: float = 1.0) -> float:
     # Clamp to min/max
     delay = max(min_sec, min(max_sec, delay))
 
-    print(f"  (waiting {delay:.1f}s)")
+    log.debug(f"  (waiting {delay:.1f}s)", extra={"event": "human_delay", "delay_s": round(delay, 2)})
     time.sleep(delay)
     return delay
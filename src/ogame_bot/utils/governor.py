@@ -0,0 +1,138 @@
+"""Token-bucket action governor shared by every page action."""
+
+import time
+from typing import Callable
+
+from .log import current_account
+
+
+# Action classes: UI clicks/typing, page loads, direct HTTP requests, fleet sends
+ACTION_CLASSES = ("click", "navigate", "request", "dispatch")
+
+# (actions per minute, burst) per action class, and for the account as a whole
+DEFAULT_CLASS_LIMITS = {
+    "click": (40, 6),
+    "navigate": (20, 3),
+    "request": (30, 5),
+    "dispatch": (10, 2),
+}
+DEFAULT_ACCOUNT_LIMIT = (60, 8)
+
+
+class TokenBucket:
+    """Classic token bucket: refills at rate tokens/second up to capacity."""
+
+    def __init__(self, per_minute: float, burst: int, now: float):
+        self.rate = per_minute / 60
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = now
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until one token is available."""
+        self._refill(now)
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def take(self, now: float):
+        self._refill(now)
+        self.tokens -= 1
+
+
+class ActionGovernor:
+    """
+    Enforce "at most X actions per minute" per account and per action class.
+
+    An action needs a token from both its class bucket and its account's
+    overall bucket. Buckets are created on first use for each account.
+    """
+
+    def __init__(
+        self,
+        class_limits: dict[str, tuple[float, int]] | None = None,
+        account_limit: tuple[float, int] = DEFAULT_ACCOUNT_LIMIT,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.class_limits = {**DEFAULT_CLASS_LIMITS, **(class_limits or {})}
+        self.account_limit = account_limit
+        self.clock = clock
+        self.sleep = sleep
+        self._buckets: dict[tuple[str, str], TokenBucket] = {}
+        self.waited = 0.0  # total seconds spent waiting for tokens
+
+    @classmethod
+    def per_minute(cls, actions_per_minute: float) -> "ActionGovernor":
+        """Governor with the account ceiling set and class limits scaled to match."""
+        scale = actions_per_minute / DEFAULT_ACCOUNT_LIMIT[0]
+        limits = {
+            name: (rate * scale, burst) for name, (rate, burst) in DEFAULT_CLASS_LIMITS.items()
+        }
+        return cls(class_limits=limits, account_limit=(actions_per_minute, DEFAULT_ACCOUNT_LIMIT[1]))
+
+    def _bucket(self, account: str, action: str) -> TokenBucket:
+        key = (account, action)
+        if key not in self._buckets:
+            if action == "*":
+                per_minute, burst = self.account_limit
+            elif action in self.class_limits:
+                per_minute, burst = self.class_limits[action]
+            else:
+                raise ValueError(f"Unknown action class: {action}")
+            self._buckets[key] = TokenBucket(per_minute, burst, self.clock())
+        return self._buckets[key]
+
+    def wait_time(self, action: str, account: str | None = None) -> float:
+        """Seconds until an action of this class may run (0 = now)."""
+        account = account or current_account.get()
+        now = self.clock()
+        return max(
+            self._bucket(account, action).wait_time(now),
+            self._bucket(account, "*").wait_time(now),
+        )
+
+    def take(self, action: str, account: str | None = None):
+        """Consume the tokens for an action without waiting."""
+        account = account or current_account.get()
+        now = self.clock()
+        self._bucket(account, action).take(now)
+        self._bucket(account, "*").take(now)
+
+    def acquire(self, action: str, account: str | None = None) -> float:
+        """Wait until an action may run, then consume its tokens. Returns seconds waited."""
+        waited = 0.0
+        while (wait := self.wait_time(action, account)) > 0:
+            self.sleep(wait)
+            waited += wait
+        self.take(action, account)
+        self.waited += waited
+        return waited
+
+
+_governor = ActionGovernor()
+
+
+def set_governor(governor: ActionGovernor):
+    """Replace the process-wide governor (e.g., with limits from the config)."""
+    global _governor
+    _governor = governor
+
+
+def get_governor() -> ActionGovernor:
+    return _governor
+
+
+def pace(action: str) -> float:
+    """
+    Block until the shared governor allows one action of this class.
+
+    Called by every Fleet, Navigation, LoginHandler and Production action
+    and by direct requests. Returns seconds waited.
+    """
+    return _governor.acquire(action)
+
@@ -0,0 +1,202 @@
+"""Structured event log: JSON lines on disk, console as a renderer, recent events kept for crashes."""
+
+import json
+import logging
+import logging.handlers
+import queue
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+ROOT_LOGGER = "ogame_bot"
+
+# Context attached to every event logged while set
+current_account: ContextVar[str] = ContextVar("current_account", default="default")
+current_phase: ContextVar[str | None] = ContextVar("current_phase", default=None)
+current_mission: ContextVar[str | None] = ContextVar("current_mission", default=None)
+
+_CONTEXT = {"account": current_account, "phase": current_phase, "mission": current_mission}
+
+# Attributes every LogRecord has; anything else was passed through `extra`
+_STANDARD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Logger for a module, e.g. get_logger(__name__)."""
+    short = name.rsplit(".", 1)[-1]
+    return logging.getLogger(f"{ROOT_LOGGER}.{short}")
+
+
+@contextmanager
+def log_context(**fields: str | None):
+    """Set account/phase/mission for every event logged inside the block."""
+    tokens = [(_CONTEXT[name], _CONTEXT[name].set(value)) for name, value in fields.items()]
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+class _ContextFilter(logging.Filter):
+    """Stamp records with the context at the time they were logged (before the queue)."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        for name, var in _CONTEXT.items():
+            if not hasattr(record, name):
+                setattr(record, name, var.get())
+        return True
+
+
+def _event(record: logging.LogRecord) -> dict[str, Any]:
+    event = {
+        "ts": round(record.created, 3),
+        "level": record.levelname.lower(),
+        "logger": record.name.removeprefix(f"{ROOT_LOGGER}."),
+        "msg": record.getMessage(),
+    }
+    for key, value in vars(record).items():
+        if key not in _STANDARD_ATTRS and value is not None:
+            event[key] = value
+    if record.exc_info and record.exc_info[0] is not None:
+        event["exc"] = logging.Formatter().formatException(record.exc_info)
+    return event
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, with context and extra fields as keys."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return json.dumps(_event(record), ensure_ascii=False, default=str)
+
+
+class ConsoleFormatter(logging.Formatter):
+    """Readable console lines; the account is shown once more than one is in use."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        prefix = ""
+        account = getattr(record, "account", "default")
+        if account != "default":
+            prefix = f"[{account}] "
+        if record.levelno >= logging.WARNING:
+            prefix += f"{record.levelname}: "
+        text = prefix + record.getMessage()
+        if record.exc_info and record.exc_info[0] is not None:
+            text += "\n" + self.formatException(record.exc_info)
+        return text
+
+
+class RingBufferHandler(logging.Handler):
+    """Keep the most recent records in memory, to dump when something fails."""
+
+    def __init__(self, capacity: int = 1000):
+        super().__init__(logging.DEBUG)
+        self.records: deque[logging.LogRecord] = deque(maxlen=capacity)
+
+    def emit(self, record: logging.LogRecord):
+        self.records.append(record)
+
+    def dump(self, path: Path) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        formatter = JsonFormatter()
+        with path.open("w", encoding="utf-8") as handle:
+            for record in list(self.records):
+                handle.write(formatter.format(record) + "\n")
+        return path
+
+
+class _LogRuntime:
+    def __init__(self, log_dir: Path, listener: logging.handlers.QueueListener, ring: RingBufferHandler):
+        self.log_dir = log_dir
+        self.listener = listener
+        self.ring = ring
+
+
+_runtime: _LogRuntime | None = None
+
+
+def setup_logging(
+    log_dir: Path,
+    console_level: int | str = logging.INFO,
+    max_bytes: int = 10 * 1024 * 1024,
+    backups: int = 5,
+    ring_size: int = 1000,
+):
+    """
+    Route the bot's events to rotating JSONL files and the console.
+
+    Callers only put records on a queue; a background thread writes the files
+    and the console, so a slow terminal or pipe never stalls a click. Every
+    level goes to the files and the ring buffer; the console gets
+    console_level and up.
+
+    Args:
+        log_dir: Folder for events.jsonl (rotated) and crash dumps
+        console_level: Lowest level shown on the console
+        max_bytes: Size at which events.jsonl is rotated
+        backups: Rotated files to keep
+        ring_size: Recent events kept in memory for dump_recent()
+    """
+    global _runtime
+    if _runtime is not None:
+        return
+
+    log_dir.mkdir(parents=True, exist_ok=True)
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_dir / "events.jsonl", maxBytes=max_bytes, backupCount=backups, encoding="utf-8"
+    )
+    file_handler.setFormatter(JsonFormatter())
+    console = logging.StreamHandler()
+    console.setFormatter(ConsoleFormatter())
+    console.setLevel(console_level)
+
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(records, file_handler, console, respect_handler_level=True)
+    ring = RingBufferHandler(ring_size)
+
+    logger = logging.getLogger(ROOT_LOGGER)
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    queue_handler = logging.handlers.QueueHandler(records)
+    for handler in (queue_handler, ring):
+        handler.addFilter(_ContextFilter())
+        logger.addHandler(handler)
+
+    listener.start()
+    _runtime = _LogRuntime(log_dir, listener, ring)
+
+
+def dump_recent(reason: str = "failure") -> Path | None:
+    """
+    Write the in-memory recent events to a crash file.
+
+    Returns:
+        Path of the dump, or None if logging isn't set up
+    """
+    if _runtime is None:
+        return None
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    path = _runtime.ring.dump(_runtime.log_dir / f"{reason}-{stamp}.jsonl")
+    get_logger("log").warning(f"Recent events written to {path}")
+    return path
+
+
+def shutdown_logging():
+    """Flush queued events and stop the writer thread."""
+    global _runtime
+    if _runtime is None:
+        return
+    _runtime.listener.stop()
+    logger = logging.getLogger(ROOT_LOGGER)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    _runtime = None
+
+
+def elapsed_ms(start: float) -> int:
+    """Milliseconds since a time.monotonic() reading, for `duration_ms` fields."""
+    return round((time.monotonic() - start) * 1000)
@@ -0,0 +1,21 @@
+"""Helpers for building in-game URLs."""
+
+from urllib.parse import urlencode, urlsplit
+
+
+def game_url(page_url: str, **params) -> str:
+    """
+    Build a URL to the game's index.php on the same server as page_url.
+
+    Args:
+        page_url: Any URL of the current game page
+        **params: Query parameters (e.g., page="componentOnly", component="eventList")
+
+    Returns:
+        Absolute URL like https://s123-es.ogame.gameforge.com/game/index.php?page=...
+    """
+    parts = urlsplit(page_url)
+    base = f"{parts.scheme}://{parts.netloc}/game/index.php"
+    if not params:
+        return base
+    return f"{base}?{urlencode(params)}"
@@ -0,0 +1,50 @@
+"""Shared fixtures: the fake game server and a headless browser page."""
+
+import os
+import threading
+
+import pytest
+
+from src.ogame_bot.utils.governor import ActionGovernor, get_governor, set_governor
+
+from tests.fake_game import FakeGame
+
+
+@pytest.fixture
+def fake_game():
+    server = FakeGame()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(scope="session")
+def browser():
+    """Headless Chromium; tests using it are skipped where none is installed."""
+    sync_api = pytest.importorskip("playwright.sync_api")
+    with sync_api.sync_playwright() as playwright:
+        try:
+            # CHROMIUM_PATH points at a browser other than Playwright's own download
+            launched = playwright.chromium.launch(executable_path=os.getenv("CHROMIUM_PATH") or None)
+        except sync_api.Error as e:
+            pytest.skip(f"Chromium is not available: {e}")
+        yield launched
+        launched.close()
+
+
+@pytest.fixture
+def fast_governor():
+    # The real limits would make a test wait for tokens
+    previous = get_governor()
+    set_governor(ActionGovernor.per_minute(6000))
+    yield get_governor()
+    set_governor(previous)
+
+
+@pytest.fixture
+def page(browser, fast_governor):
+    context = browser.new_context()
+    yield context.new_page()
+    context.close()
@@ -0,0 +1,127 @@
+"""A local fake of the game server, for tests that drive a real browser page."""
+
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+from src.ogame_bot.game_data import PlanetInfo
+
+HOME = PlanetInfo("Home", 33620001, (1, 100, 8))
+
+# Ships on HOME, as (technology id, aria-label, amount)
+SHIPS = [(203, "Nave grande de carga", 12), (206, "Crucero", 3)]
+
+FLEET_PAGE = """<!doctype html>
+<html><body>
+<ul id="technologies">{ships}</ul>
+<script>
+window.fleetDispatcher = {{
+    fleetSendingToken: {token},
+    shipsOnPlanet: {on_planet},
+    currentPlanet: {{galaxy: {galaxy}, system: {system}, position: {position}}},
+}};
+</script>
+</body></html>"""
+
+SHIP_ITEM = """
+<li class="technology" data-technology="{id}" aria-label="{name}">
+    <span class="amount" data-value="{amount}">{amount}</span><input type="text">
+</li>"""
+
+# A hostile attack on HOME, as the eventList component renders it
+HOSTILE_EVENT = """
+<table id="eventContent"><tbody>
+<tr class="eventFleet" id="eventRow-{event_id}" data-mission-type="1" data-return-flight="false"
+    data-arrival-time="{arrival}">
+    <td class="countDown hostile">2m 10s</td>
+    <td class="arrivalTime">12:00:00 Clock</td>
+    <td class="coordsOrigin"><a href="#">[1:200:4]</a></td>
+    <td class="destFleet"><span>Home</span></td>
+    <td class="destCoords"><a href="#">[{galaxy}:{system}:{position}]</a></td>
+</tr>
+</tbody></table>"""
+
+
+class FakeGame(ThreadingHTTPServer):
+    """
+    Just enough of a game server for the fleet dispatcher and the event list.
+
+    The fleet page carries a fleetDispatcher with a send token; sendFleet
+    accepts a POST only with the current token and hands out a new one.
+    Every accepted send is kept in `sends` as its form fields.
+    """
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.token = "token-0"
+        self.sends: list[dict[str, str]] = []
+        self.refused: list[dict[str, str]] = []
+        self.event_list = "<table id=\"eventContent\"><tbody></tbody></table>"
+
+    def url(self, **params) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/game/index.php?{urlencode(params)}"
+
+    @property
+    def event_list_url(self) -> str:
+        return self.url(page="componentOnly", component="eventList", ajax=1)
+
+    def attack(self, event_id: int, arrival: int, target: PlanetInfo = HOME):
+        """Show a hostile attack on a planet in the event list."""
+        galaxy, system, position = target.coords
+        self.event_list = HOSTILE_EVENT.format(
+            event_id=event_id, arrival=arrival, galaxy=galaxy, system=system, position=position
+        )
+
+    def fleet_page(self) -> str:
+        galaxy, system, position = HOME.coords
+        return FLEET_PAGE.format(
+            ships="".join(SHIP_ITEM.format(id=id, name=name, amount=amount) for id, name, amount in SHIPS),
+            token=json.dumps(self.token),
+            on_planet=json.dumps([{"id": id, "number": amount} for id, _, amount in SHIPS]),
+            galaxy=galaxy, system=system, position=position,
+        )
+
+    def send_fleet(self, form: dict[str, str]) -> dict:
+        if form.get("token") != self.token:
+            self.refused.append(form)
+            return {"success": False, "errors": [{"message": "invalid token"}]}
+        self.sends.append(form)
+        self.token = f"token-{len(self.sends)}"
+        return {"success": True, "message": "Fleet dispatched", "fleetSendingToken": self.token}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: FakeGame
+
+    def log_message(self, format, *args):
+        pass
+
+    def _query(self) -> dict[str, str]:
+        return {name: values[0] for name, values in parse_qs(urlsplit(self.path).query).items()}
+
+    def _reply(self, body: str, content_type: str = "text/html"):
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        query = self._query()
+        if query.get("component") == "eventList":
+            self._reply(self.server.event_list)
+        elif query.get("component") == "fleetdispatch":
+            self._reply(self.server.fleet_page())
+        else:
+            self._reply("<!doctype html><html><body><div id=\"planetList\"></div></body></html>")
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length).decode("utf-8")
+        if self._query().get("action") != "sendFleet":
+            self.send_error(404)
+            return
+        form = {name: values[0] for name, values in parse_qs(body).items()}
+        self._reply(json.dumps(self.server.send_fleet(form)), "application/json")
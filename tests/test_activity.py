@@ -0,0 +1,81 @@
+import time
+
+from src.ogame_bot.activity import ActivityStore
+
+A, B = (1, 100, 4), (1, 100, 5)
+DAY = 86400
+
+
+def _at(hour, days_ago=1):
+    """Unix time of a local hour of day, some days back."""
+    today = time.localtime()
+    midnight = time.mktime((today.tm_year, today.tm_mon, today.tm_mday, 0, 0, 0, 0, 0, -1))
+    return midnight - days_ago * DAY + hour * 3600 + 60
+
+
+def test_activity_by_hour_counts_activity_within_15_minutes(tmp_path):
+    store = ActivityStore(tmp_path)
+    store.record([(A, 5, 0), (B, None, 0)], at=_at(3))
+    store.record([(A, 40, 0), (B, 14, 0)], at=_at(3, days_ago=2))
+
+    profile = store.activity_by_hour(A)
+
+    assert profile[3] == 0.5
+    assert profile[4] is None
+    assert store.activity_by_hour(B)[3] == 0.5
+    assert store.activity_by_hour((9, 9, 9)) == [None] * 24
+
+
+def test_append_after_a_torn_write_keeps_rows_aligned(tmp_path):
+    store = ActivityStore(tmp_path)
+    store.record([(A, 5, 100), (B, None, 200)], at=1000)
+    # A crash mid-append: one more value in two columns, half a value in another
+    with (tmp_path / "raw.time").open("ab") as handle:
+        handle.write((2000).to_bytes(4, "little") + b"\x01\x02")
+    with (tmp_path / "raw.target").open("ab") as handle:
+        handle.write(b"\x01\x00")
+
+    assert len(store.raw.read()["time"]) == 2
+
+    store.record([(B, 1, 300)], at=3000)
+
+    raw = ActivityStore(tmp_path).raw.read()
+    assert list(raw["time"]) == [1000, 1000, 3000]
+    assert list(raw["target"]) == [0, 1, 1]
+    assert list(raw["debris"]) == [100, 200, 300]
+    assert store.last_debris(B) == 300
+
+
+def test_downsample_folds_old_samples_without_changing_the_profile(tmp_path):
+    store = ActivityStore(tmp_path, raw_days=14)
+    for days_ago in (20, 21, 1):
+        store.record([(A, 5 if days_ago != 21 else None, 0)], at=_at(22, days_ago=days_ago))
+    before = store.activity_by_hour(A)
+
+    assert store.downsample() == 2
+    assert store.downsample() == 0
+
+    assert len(store.raw.read()["time"]) == 1
+    assert list(store.hourly.read()["samples"]) == [1, 1]
+    assert ActivityStore(tmp_path).activity_by_hour(A) == before
+
+
+def test_rank_targets_puts_the_least_active_first(tmp_path):
+    store = ActivityStore(tmp_path)
+    for days_ago in (1, 2):
+        store.record([(A, 2, 0), (B, None, 0)], at=_at(10, days_ago=days_ago))
+    arrival = _at(10, days_ago=0)
+
+    ranked = store.rank_targets([A, B, (9, 9, 9)], arrival={A: arrival, B: arrival, (9, 9, 9): arrival})
+
+    assert ranked == [(B, 0.0), ((9, 9, 9), 0.5), (A, 1.0)]
+
+
+def test_targets_survive_a_reopen(tmp_path):
+    ActivityStore(tmp_path).record([(A, 1, 7)], at=1000)
+
+    reopened = ActivityStore(tmp_path)
+
+    assert reopened.targets == [A]
+    assert reopened.last_debris(A) == 7
+    assert reopened.last_debris(B) is None
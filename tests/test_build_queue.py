@@ -0,0 +1,71 @@
+import time
+
+import pytest
+
+from src.ogame_bot.actions.production import ResourceState
+from src.ogame_bot.build_queue import BuildQueueExecutor, QueueState
+from src.ogame_bot.economy import get_tech
+from src.ogame_bot.game_data import PlanetInfo
+from src.ogame_bot.mission_config import BuildPlan
+
+NOW = 1_700_000_000.0
+HOME = PlanetInfo("Home", 1, (1, 100, 8))
+METAL_MINE = get_tech("metal_mine")
+
+
+def _resources(amounts, rates=(1.0, 1.0, 1.0), storage=(1e6, 1e6, 1e6)):
+    return ResourceState(amounts=amounts, rates=rates, storage=storage, observed_at=NOW)
+
+
+def _executor():
+    return BuildQueueExecutor(page=None, plan=BuildPlan(planets={}, research=[]), retry_after=900)
+
+
+def _queue(resources, target=5, level=4, **fields):
+    return QueueState("Home", HOME, [(METAL_MINE, target)], {METAL_MINE.tech_id: level}, resources, **fields)
+
+
+def test_affordable_at_waits_for_the_slowest_resource():
+    state = _resources((100, 100, 0), rates=(1.0, 0.5, 0.0))
+
+    assert state.affordable_at((50, 50, 0)) == NOW
+    assert state.affordable_at((160, 150, 0)) == NOW + 100
+
+
+def test_affordable_at_is_none_when_it_never_will_be():
+    assert _resources((0, 0, 0), rates=(1.0, 1.0, 0.0)).affordable_at((10, 10, 10)) is None
+    assert _resources((0, 0, 0), storage=(100, 100, 100)).affordable_at((200, 0, 0)) is None
+
+
+def test_projected_stops_at_the_storage_cap():
+    state = _resources((90, 200, 0), rates=(1.0, 1.0, 1.0), storage=(100, 100, 100))
+
+    assert state.projected(NOW + 50) == (100, 200, 50)
+    assert state.projected(NOW - 50) == (90, 200, 0)
+
+
+def test_due_at_is_when_the_next_level_is_affordable():
+    cost = METAL_MINE.cost(5)
+    queue = _queue(_resources((0, 0, 0), rates=(cost[0] / 60, cost[1] / 30, 1.0)))
+
+    assert _executor().due_at(queue) == pytest.approx(NOW + 60)
+
+
+def test_due_at_waits_for_the_queue_and_a_failed_attempt():
+    queue = _queue(_resources((1e5, 1e5, 1e5)), free_at=NOW + 300)
+    executor = _executor()
+
+    assert executor.due_at(queue) == NOW + 300
+    queue.blocked_until = NOW + 600
+    assert executor.due_at(queue) == NOW + 600
+
+
+def test_due_at_retries_later_without_a_projection():
+    queue = _queue(_resources((0, 0, 0), rates=(0.0, 0.0, 0.0)))
+
+    before = time.time()
+    assert _executor().due_at(queue) >= before + 900
+
+
+def test_due_at_is_none_once_the_plan_is_reached():
+    assert _executor().due_at(_queue(_resources((0, 0, 0)), level=5)) is None
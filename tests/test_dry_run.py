@@ -0,0 +1,92 @@
+from src.ogame_bot.dry_run import build_plan, format_plan
+from src.ogame_bot.game_data import EXPEDITION_POSITION, Mission, PlanetInfo
+from src.ogame_bot.journal import DispatchJournal
+from src.ogame_bot.mission_config import ExpeditionConfig, FarmingConfig
+from src.ogame_bot.snapshot import EmpireSnapshot
+
+CARGO = "Nave grande de carga"
+HOME = PlanetInfo("Home", 1, (1, 100, 8))
+COLONY = PlanetInfo("Colony", 2, (1, 200, 8))
+
+
+def _snapshot(slots=(1, 3), home=20, colony=10):
+    snapshot = EmpireSnapshot()
+    snapshot.set_planets([HOME, COLONY])
+    snapshot.set_inventory(HOME.planet_id, {CARGO: home})
+    snapshot.set_inventory(COLONY.planet_id, {CARGO: colony})
+    snapshot.set_expedition_slots(*slots)
+    return snapshot
+
+
+def _age(snapshot, seconds):
+    for entry in snapshot._fields.values():
+        entry["updated_at"] -= seconds
+
+
+def test_expeditions_fill_the_free_slots():
+    plan = build_plan(ExpeditionConfig(("Home",), {CARGO: 5}), None, _snapshot(slots=(1, 3)))
+
+    assert plan.complete
+    assert plan.expeditions_wanted == 2
+    assert [(m.mission, m.origin, m.target) for m in plan.missions] == [
+        (Mission.EXPEDITION, "Home", (1, 100, EXPEDITION_POSITION)),
+    ] * 2
+
+
+def test_farming_gets_the_ships_expeditions_leave_behind():
+    expeditions = ExpeditionConfig(("Home",), {CARGO: 10}, max_expeditions=2)
+    farming = FarmingConfig(("Home", "Colony"), {CARGO: 10}, [(1, 101, 1), (1, 199, 1)])
+
+    plan = build_plan(expeditions, farming, _snapshot(slots=(0, 5)))
+
+    attacks = {m.target: m.origin for m in plan.missions if m.mission == Mission.ATTACK}
+    # Home's 20 cargos all went on expeditions, so both attacks leave from Colony
+    assert plan.count(Mission.EXPEDITION) == 2
+    assert attacks == {(1, 199, 1): "Colony"}
+    assert plan.unassigned_targets == [(1, 101, 1)]
+
+
+def test_targets_hit_recently_are_skipped(tmp_path):
+    journal = DispatchJournal.open(tmp_path / "dispatch.jsonl")
+    journal.confirm(journal.begin((1, 101, 1), Mission.ATTACK, {CARGO: 10}))
+    farming = FarmingConfig(("Home",), {CARGO: 10}, [(1, 101, 1), (1, 102, 1)])
+
+    plan = build_plan(ExpeditionConfig(("Home",), {CARGO: 1}), farming, _snapshot(slots=(3, 3)), journal)
+    journal.close()
+
+    assert plan.skipped_targets == [(1, 101, 1)]
+    assert [m.target for m in plan.missions] == [(1, 102, 1)]
+
+
+def test_nothing_to_send_from_fresh_state_is_complete():
+    farming = FarmingConfig(("Home",), {CARGO: 50}, [(1, 101, 1)])
+
+    plan = build_plan(ExpeditionConfig(("Home",), {CARGO: 5}), farming, _snapshot(slots=(3, 3)))
+
+    assert plan.complete
+    assert not plan.would_send
+    assert "Nothing would be sent." in format_plan(plan)
+
+
+def test_state_past_its_ttl_makes_the_plan_incomplete():
+    snapshot = _snapshot(slots=(3, 3))
+    _age(snapshot, 5 * 24 * 3600)
+
+    plan = build_plan(ExpeditionConfig(("Home",), {CARGO: 5}), None, snapshot)
+
+    # Slots full five days ago says nothing about now: this must not read as "nothing to send"
+    assert not plan.would_send
+    assert not plan.complete
+    assert "expedition slots (out of date)" in plan.unknown
+    assert "ships on Home (out of date)" in plan.unknown
+    assert plan.state_age >= 5 * 24 * 3600
+
+
+def test_missing_planets_and_state_are_unknown():
+    snapshot = EmpireSnapshot()
+    snapshot.set_planets([HOME])
+
+    plan = build_plan(ExpeditionConfig(("Home", "Nowhere"), {CARGO: 5}), None, snapshot)
+
+    assert set(plan.unknown) == {"ships on Home", "planet 'Nowhere'", "expedition slots"}
+    assert plan.to_dict()["complete"] is False
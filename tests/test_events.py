@@ -0,0 +1,91 @@
+from src.ogame_bot.actions.events import EventListPoller, EventTimeline, FleetEvent, fleet_landings, parse_event_list
+
+NOW = 1_700_000_000
+
+EVENT_LIST = """
+<table id="eventContent"><tbody>
+<tr class="eventFleet" id="eventRow-101" data-mission-type="15" data-return-flight="true"
+    data-arrival-time="1700000600">
+    <td class="countDown friendly">10m</td>
+    <td class="coordsOrigin"><a href="#">[1:100:16]</a></td>
+    <td class="destCoords"><a href="#">[1:100:8]</a></td>
+    <td class="icon_movement"><table><tr><td class="tooltip">Naves: 10</td></tr></table></td>
+</tr>
+<tr class="eventFleet" id="eventRow-102" data-mission-type="1" data-return-flight="false"
+    data-arrival-time="1700000300">
+    <td class="countDown hostile">5m</td>
+    <td class="coordsOrigin"><a href="#">[2:50:4]</a></td>
+    <td class="destCoords"><a href="#">[1:100:8]</a></td>
+</tr>
+<tr class="eventFleet" id="eventRow-103" data-mission-type="" data-arrival-time="1700000900">
+    <td class="countDown">15m</td>
+</tr>
+</tbody></table>"""
+
+
+def _event(event_id, arrival, hostile=False, mission=1):
+    return FleetEvent(event_id, mission, (1, 1, 1), (1, 1, 2), arrival, False, hostile)
+
+
+def _poller(*events):
+    poller = EventListPoller(page=None, min_interval=5, max_interval=120)
+    poller.timeline.update(list(events))
+    return poller
+
+
+def test_parse_event_list_reads_rows_and_skips_incomplete_ones():
+    events = parse_event_list(EVENT_LIST)
+
+    assert events == [
+        FleetEvent(101, 15, (1, 100, 16), (1, 100, 8), 1700000600, True, False),
+        FleetEvent(102, 1, (2, 50, 4), (1, 100, 8), 1700000300, False, True),
+    ]
+    assert events[0].mission_name == "expedition"
+
+
+def test_timeline_diff_reports_added_changed_and_removed():
+    timeline = EventTimeline()
+    timeline.update([_event(1, NOW + 60), _event(2, NOW + 120)])
+
+    diff = timeline.update([_event(2, NOW + 120, hostile=True), _event(3, NOW + 30)])
+
+    assert [event.event_id for event in diff.added] == [3]
+    assert [event.event_id for event in diff.changed] == [2]
+    assert [event.event_id for event in diff.removed] == [1]
+    assert [event.event_id for event in diff.new_hostile] == [2]
+    assert [event.event_id for event in timeline.events] == [3, 2]
+    assert not timeline.update(timeline.events)
+
+
+def test_next_event_skips_arrivals_in_the_past():
+    timeline = EventTimeline()
+    timeline.update([_event(1, NOW - 10), _event(2, NOW + 10)])
+
+    assert timeline.next_event(now=NOW).event_id == 2
+    assert timeline.next_event(now=NOW + 11) is None
+
+
+def test_poll_interval_tightens_as_the_next_arrival_approaches():
+    assert _poller().next_interval(now=NOW) == 120
+    assert _poller(_event(1, NOW + 3600)).next_interval(now=NOW) == 120
+    assert _poller(_event(1, NOW + 200)).next_interval(now=NOW) == 50
+    assert _poller(_event(1, NOW + 8)).next_interval(now=NOW) == 5
+
+
+def test_poll_interval_is_minimal_while_a_hostile_fleet_is_in_flight():
+    poller = _poller(_event(1, NOW + 3600, hostile=True))
+
+    assert poller.next_interval(now=NOW) == 5
+
+
+def test_fleet_landings_put_returns_at_their_origin():
+    home, colony, target = (1, 100, 8), (1, 200, 8), (1, 101, 1)
+    events = [
+        FleetEvent(1, 1, home, target, NOW + 100, False, False),
+        FleetEvent(2, 1, home, target, NOW + 200, True, False),
+        FleetEvent(3, 15, home, (1, 100, 16), NOW + 150, True, False),
+        FleetEvent(4, 4, home, colony, NOW + 50, False, False),
+        FleetEvent(5, 1, (2, 2, 2), colony, NOW + 10, False, True),
+    ]
+
+    assert fleet_landings(events) == {target: NOW + 100, home: NOW + 150, colony: NOW + 50}
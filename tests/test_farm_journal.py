@@ -0,0 +1,80 @@
+import pytest
+
+from src.ogame_bot.actions.fleet import Fleet
+from src.ogame_bot.journal import CONFIRMED, FAILED, PENDING, DispatchJournal
+
+SHIPS = {"Nave grande de carga": 10}
+TARGET = (1, 101, 1)
+
+
+class FakeNavigation:
+    def select_planet(self, name):
+        return True
+
+    def click_menu_by_text(self, text):
+        return True
+
+
+class RetryingSupervisor:
+    """Runs a step up to three times, like the real supervisor's ladders."""
+
+    page = None
+
+    def run(self, step_name, step, ok):
+        for _ in range(3):
+            result = step()
+            if ok(result):
+                break
+        return result
+
+
+@pytest.fixture
+def journal(tmp_path):
+    journal = DispatchJournal.open(tmp_path / "dispatch.jsonl")
+    yield journal
+    journal.close()
+
+
+def _fleet(journal, outcomes):
+    """A fleet whose sends go as listed: True, False, or "submitted" (failed after submitting)."""
+    fleet = Fleet(None, human_delays=False, journal=journal, supervisor=RetryingSupervisor())
+    fleet._navigation = FakeNavigation
+    fleet._open_fleet = lambda planet: True
+    remaining = list(outcomes)
+
+    def dispatch(ships, coords, mission):
+        outcome = remaining.pop(0)
+        fleet._send_started = outcome == "submitted"
+        return outcome is True
+
+    fleet.dispatch = dispatch
+    return fleet
+
+
+def _statuses(journal):
+    return [(entry.target, entry.status) for entry in journal.entries.values()]
+
+
+def test_retried_attack_is_journaled_once(journal):
+    fleet = _fleet(journal, [False, False, True])
+
+    assert fleet.send_farm_attacks("Home", SHIPS, [TARGET]) == 1
+
+    assert _statuses(journal) == [(TARGET, CONFIRMED)]
+
+
+def test_attack_given_up_on_is_failed(journal):
+    fleet = _fleet(journal, [False, False, False])
+
+    assert fleet.send_farm_attacks("Home", SHIPS, [TARGET]) == 0
+
+    assert _statuses(journal) == [(TARGET, FAILED)]
+
+
+def test_attack_in_doubt_stays_pending(journal):
+    fleet = _fleet(journal, ["submitted"])
+
+    fleet.send_farm_attacks("Home", SHIPS, [TARGET])
+
+    # Neither sent again nor failed: reconcile() settles it from the event list
+    assert _statuses(journal) == [(TARGET, PENDING)]
@@ -0,0 +1,46 @@
+import time
+
+from src.ogame_bot.actions.events import EventListPoller
+from src.ogame_bot.fleetsave import FleetsaveEngine
+from src.ogame_bot.game_data import EXPEDITION_POSITION, Mission
+
+from tests.fake_game import HOME, SHIPS
+
+
+def _engine(fake_game, page) -> FleetsaveEngine:
+    page.goto(fake_game.url(page="ingame", component="overview"))
+    engine = FleetsaveEngine(page)
+    engine.update_inventory(HOME, {name: amount for _, name, amount in SHIPS})
+    return engine
+
+
+def test_fire_sends_every_ship_on_an_expedition(fake_game, page):
+    engine = _engine(fake_game, page)
+
+    assert engine.fire(engine.plans[HOME.coords])
+
+    [send] = fake_game.sends
+    galaxy, system, _ = HOME.coords
+    assert (send["galaxy"], send["system"], send["position"]) == (str(galaxy), str(system), str(EXPEDITION_POSITION))
+    assert send["mission"] == str(int(Mission.EXPEDITION))
+    assert {key: value for key, value in send.items() if key.startswith("am")} == {
+        f"am{id}": str(amount) for id, _, amount in SHIPS
+    }
+    assert send["token"] == "token-0"
+    assert engine.latency.summary()["count"] == 1
+
+
+def test_hostile_event_list_fires_the_save_once(fake_game, page):
+    engine = _engine(fake_game, page)
+    poller = EventListPoller(page, url=fake_game.event_list_url)
+    engine.watch(poller)
+
+    poller.poll()
+    assert fake_game.sends == []
+
+    fake_game.attack(event_id=5001, arrival=int(time.time()) + 130)
+    poller.poll()
+    poller.poll()
+
+    assert len(fake_game.sends) == 1
+    assert fake_game.refused == []
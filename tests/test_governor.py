@@ -0,0 +1,89 @@
+import pytest
+
+from src.ogame_bot.utils.governor import DEFAULT_CLASS_LIMITS, ActionGovernor, TokenBucket
+
+
+class FakeClock:
+    """Clock that only moves when the governor sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _governor(clock, **limits):
+    return ActionGovernor(clock=clock, sleep=clock.sleep, **limits)
+
+
+def test_bucket_allows_a_burst_then_refills_at_its_rate():
+    bucket = TokenBucket(per_minute=30, burst=3, now=0)
+    for _ in range(3):
+        assert bucket.wait_time(0) == 0
+        bucket.take(0)
+
+    assert bucket.wait_time(0) == pytest.approx(2)
+    assert bucket.wait_time(1) == pytest.approx(1)
+    assert bucket.wait_time(2) == 0
+
+
+def test_bucket_never_holds_more_than_its_burst():
+    bucket = TokenBucket(per_minute=60, burst=2, now=0)
+
+    bucket.take(3600)
+    bucket.take(3600)
+
+    assert bucket.wait_time(3600) == pytest.approx(1)
+
+
+def test_per_minute_scales_every_class_to_the_account_ceiling():
+    governor = ActionGovernor.per_minute(30)
+
+    assert governor.account_limit[0] == 30
+    for name, (rate, burst) in DEFAULT_CLASS_LIMITS.items():
+        assert governor.class_limits[name] == (rate / 2, burst)
+
+
+def test_an_action_needs_a_token_from_both_its_class_and_the_account():
+    clock = FakeClock()
+    governor = _governor(clock, class_limits={"dispatch": (60, 1)}, account_limit=(6, 2))
+
+    governor.take("dispatch", "a")
+    # The class bucket refills in 1 s, the account bucket still has a token
+    assert governor.wait_time("dispatch", "a") == pytest.approx(1)
+    governor.take("click", "a")
+    # Now the account is empty too: 10 s until its next token
+    assert governor.wait_time("click", "a") == pytest.approx(10)
+
+
+def test_accounts_have_separate_buckets():
+    clock = FakeClock()
+    governor = _governor(clock, account_limit=(6, 1))
+
+    governor.take("click", "a")
+
+    assert governor.wait_time("click", "a") > 0
+    assert governor.wait_time("click", "b") == 0
+
+
+def test_acquire_sleeps_until_the_token_is_there():
+    clock = FakeClock()
+    governor = _governor(clock, class_limits={"navigate": (30, 1)})
+
+    assert governor.acquire("navigate", "a") == 0
+    assert governor.acquire("navigate", "a") == pytest.approx(2)
+    assert governor.acquire("navigate", "a") == pytest.approx(2)
+
+    assert clock.sleeps == [pytest.approx(2), pytest.approx(2)]
+    assert governor.waited == pytest.approx(4)
+
+
+def test_unknown_action_class_is_rejected():
+    with pytest.raises(ValueError):
+        ActionGovernor().wait_time("teleport", "a")
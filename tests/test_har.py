@@ -0,0 +1,94 @@
+import base64
+import json
+
+from src.ogame_bot.har import scrub_har
+
+TOKEN = "a1b2c3d4e5"
+
+
+def _write(tmp_path, entries):
+    path = tmp_path / "session.har"
+    path.write_text(json.dumps({"log": {"entries": entries}}), encoding="utf-8")
+    return path
+
+
+def _entries(path):
+    return json.loads(path.read_text(encoding="utf-8"))["log"]["entries"]
+
+
+def test_token_gets_one_placeholder_across_response_and_request(tmp_path):
+    path = _write(tmp_path, [
+        {
+            "request": {"url": "https://s1/game/index.php?page=ingame", "headers": []},
+            "response": {"headers": [], "content": {"text": json.dumps({"newAjaxToken": TOKEN})}},
+        },
+        {
+            "request": {
+                "url": f"https://s1/game/index.php?page=ingame&token={TOKEN}",
+                "headers": [],
+                "queryString": [{"name": "token", "value": TOKEN}],
+                "postData": {"text": f"galaxy=1&token={TOKEN}"},
+            },
+            "response": {"headers": [], "content": {}},
+        },
+    ])
+
+    assert scrub_har(path) == 1
+    handed_out, sent_back = _entries(path)
+    placeholder = json.loads(handed_out["response"]["content"]["text"])["newAjaxToken"]
+    assert placeholder.startswith("SCRUBBED")
+    assert sent_back["request"]["url"].endswith(f"token={placeholder}")
+    assert sent_back["request"]["queryString"][0]["value"] == placeholder
+    assert sent_back["request"]["postData"]["text"] == f"galaxy=1&token={placeholder}"
+
+
+def test_fields_that_only_contain_secret_words_are_kept(tmp_path):
+    body = {"author": TOKEN, "keyboard": TOKEN, "considered": TOKEN}
+    path = _write(tmp_path, [{
+        "request": {"url": f"https://s1/page?keyboard={TOKEN}", "headers": []},
+        "response": {"headers": [], "content": {"text": json.dumps(body)}},
+    }])
+
+    assert scrub_har(path) == 0
+    entry = _entries(path)[0]
+    assert entry["request"]["url"] == f"https://s1/page?keyboard={TOKEN}"
+    assert json.loads(entry["response"]["content"]["text"]) == body
+
+
+def test_value_is_replaced_only_in_its_own_field(tmp_path):
+    html = f'<script>var token = "{TOKEN}";</script><p>{TOKEN}</p>'
+    path = _write(tmp_path, [{
+        "request": {"url": "https://s1/game", "headers": []},
+        "response": {"headers": [], "content": {"text": html}},
+    }])
+
+    scrub_har(path)
+    text = _entries(path)[0]["response"]["content"]["text"]
+    assert 'var token = "SCRUBBED0000"' in text
+    assert f"<p>{TOKEN}</p>" in text
+
+
+def test_base64_bodies_are_scrubbed(tmp_path):
+    html = f'<input type="hidden" name="token" value="{TOKEN}">'
+    path = _write(tmp_path, [{
+        "request": {"url": "https://s1/game", "headers": []},
+        "response": {
+            "headers": [],
+            "content": {"text": base64.b64encode(html.encode()).decode(), "encoding": "base64"},
+        },
+    }])
+
+    scrub_har(path)
+    body = base64.b64decode(_entries(path)[0]["response"]["content"]["text"]).decode()
+    assert TOKEN not in body
+    assert 'value="SCRUBBED0000"' in body
+
+
+def test_cookie_values_are_scrubbed_but_names_kept(tmp_path):
+    path = _write(tmp_path, [{
+        "request": {"url": "https://s1/game", "headers": [{"name": "Cookie", "value": "PHPSESSID=s3cr3t-value"}]},
+        "response": {"headers": [], "content": {}},
+    }])
+
+    scrub_har(path)
+    assert _entries(path)[0]["request"]["headers"][0]["value"] == "PHPSESSID=SCRUBBED0000"
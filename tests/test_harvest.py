@@ -0,0 +1,101 @@
+from src.ogame_bot.game_data import EXPEDITION_POSITION
+from src.ogame_bot.harvest import DebrisField, HarvestJob, HarvestQueue, HarvestStats, nearby_systems
+from src.ogame_bot.planner import Origin
+
+NOW = 1_000_000.0
+
+
+def _field(coords, metal, crystal=0):
+    return DebrisField(coords, metal, crystal, 0, seen_at=NOW)
+
+
+def _queue(*fields, min_total=0, refresh=1800):
+    queue = HarvestQueue(min_total=min_total, refresh=refresh)
+    systems = {}
+    for debris in fields:
+        systems.setdefault(debris.coords[:2], []).append(debris)
+    for system, found in systems.items():
+        queue.update(system, found, at=NOW)
+    return queue
+
+
+def test_rank_prefers_resources_per_second_over_size():
+    near = _field((1, 100, 5), 15000, 5000)
+    far = _field((3, 100, 5), 40000, 20000)
+    queue = _queue(near, far)
+
+    jobs = queue.rank([Origin("Home", (1, 100, 8), {"Reciclador": 3})])
+
+    assert [job.field for job in jobs] == [near, far]
+    assert jobs[0].ships == {"Reciclador": 1}
+    # Only two recyclers were left for the big field; the job carries what fits
+    assert jobs[1].ships == {"Reciclador": 2}
+    assert jobs[1].load == 40000
+
+
+def test_deep_space_fields_need_pathfinders():
+    deep = _field((1, 100, EXPEDITION_POSITION), 25000)
+    queue = _queue(deep)
+
+    assert queue.rank([Origin("Home", (1, 100, 8), {"Reciclador": 10})]) == []
+    [job] = queue.rank([Origin("Home", (1, 100, 8), {"explorador": 10})])
+    assert job.ships == {"explorador": 3}
+
+
+def test_small_fields_are_left_alone():
+    queue = _queue(_field((1, 100, 5), 5000), _field((1, 100, 6), 50000), min_total=20000)
+
+    assert [debris.coords for debris in queue.open_fields(now=NOW)] == [(1, 100, 6)]
+
+
+def test_claimed_field_is_not_sent_to_again_until_rescanned():
+    debris = _field((1, 100, 5), 20000)
+    queue = _queue(debris)
+    landing = NOW + 600
+    queue.claim(debris.coords, landing)
+
+    assert queue.open_fields(now=NOW) == []
+    # The claim has run out, but nothing is known about the field until the system is scanned again
+    assert queue.open_fields(now=landing + 1) == []
+    assert queue.due(now=landing) == [(1, 100)]
+
+
+def test_scan_before_landing_keeps_the_rescan_at_landing():
+    debris = _field((1, 100, 5), 20000)
+    queue = _queue(debris, refresh=1800)
+    landing = NOW + 600
+    queue.claim(debris.coords, landing)
+
+    queue.update((1, 100), [debris], at=NOW + 100)
+
+    assert queue.open_fields(now=NOW + 100) == []
+    assert queue.next_scan[(1, 100)] == landing
+
+    queue.update((1, 100), [_field((1, 100, 5), 3000)], at=landing)
+    assert queue.next_scan[(1, 100)] == landing + 1800
+    assert [d.total for d in queue.open_fields(now=landing)] == [3000]
+
+
+def test_update_reports_new_and_resized_fields():
+    queue = _queue(_field((1, 100, 5), 20000), _field((1, 100, 6), 30000))
+
+    changed = queue.update((1, 100), [_field((1, 100, 5), 20000), _field((1, 100, 7), 1000)], at=NOW + 10)
+
+    assert changed == 1
+    assert set(queue.fields) == {(1, 100, 5), (1, 100, 7)}
+    assert queue.due(now=NOW + 10) == []
+
+
+def test_stats_credit_the_expected_load_on_arrival():
+    stats = HarvestStats(started=NOW)
+    job = HarvestJob(_field((1, 100, 5), 20000), Origin("Home", (1, 100, 8), {}), {"Reciclador": 1}, 900)
+    stats.record(job, sent_at=NOW)
+
+    assert stats.expected(now=NOW + 899) == 0
+    assert stats.expected(now=NOW + 900) == 20000
+    assert stats.per_hour(now=NOW + 3600) == 20000
+
+
+def test_nearby_systems_stay_inside_the_galaxy():
+    assert nearby_systems((2, 3, 8), 2) == [(2, 1), (2, 2), (2, 3), (2, 4), (2, 5)]
+    assert nearby_systems((2, 499, 8), 1) == [(2, 498), (2, 499)]
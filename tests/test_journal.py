@@ -0,0 +1,96 @@
+import json
+import time
+
+from src.ogame_bot.actions.events import FleetEvent
+from src.ogame_bot.game_data import Mission
+from src.ogame_bot.journal import CONFIRMED, FAILED, PENDING, DispatchJournal
+
+SHIPS = {"Nave grande de carga": 10}
+
+
+def _lines(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_states_survive_a_reopen(tmp_path):
+    path = tmp_path / "dispatch.jsonl"
+    journal = DispatchJournal.open(path)
+    sent = journal.begin((1, 1, 1), Mission.ATTACK, SHIPS, "Home")
+    refused = journal.begin((1, 1, 2), Mission.ATTACK, SHIPS, "Home")
+    journal.begin((1, 1, 3), Mission.ATTACK, SHIPS, "Home")
+    journal.confirm(sent)
+    journal.fail(refused)
+    journal.close()
+
+    reopened = DispatchJournal.read(path)
+
+    statuses = {entry.target: entry.status for entry in reopened.entries.values()}
+    assert statuses == {(1, 1, 1): CONFIRMED, (1, 1, 2): FAILED, (1, 1, 3): PENDING}
+    assert reopened.entries[sent.entry_id].origin == "Home"
+
+
+def test_recent_targets_include_pending_but_not_failed(tmp_path):
+    journal = DispatchJournal.open(tmp_path / "dispatch.jsonl")
+    journal.confirm(journal.begin((1, 1, 1), Mission.ATTACK, SHIPS))
+    journal.begin((1, 1, 2), Mission.ATTACK, SHIPS)
+    journal.fail(journal.begin((1, 1, 3), Mission.ATTACK, SHIPS))
+    journal.begin((1, 1, 4), Mission.EXPEDITION, SHIPS)
+
+    assert journal.recent_targets(Mission.ATTACK) == {(1, 1, 1), (1, 1, 2)}
+    assert journal.skip_recent([(1, 1, 3), [1, 1, 1], (1, 1, 4)]) == [(1, 1, 3), (1, 1, 4)]
+    journal.close()
+
+
+def test_cooldown_expires(tmp_path):
+    journal = DispatchJournal.open(tmp_path / "dispatch.jsonl", cooldown=600)
+    journal.confirm(journal.begin((1, 1, 1), Mission.ATTACK, SHIPS))
+
+    assert journal.recent_targets(now=time.time() + 599) == {(1, 1, 1)}
+    assert journal.recent_targets(now=time.time() + 601) == set()
+    journal.close()
+
+
+def test_torn_last_line_is_ignored(tmp_path):
+    path = tmp_path / "dispatch.jsonl"
+    journal = DispatchJournal.open(path)
+    journal.confirm(journal.begin((1, 1, 1), Mission.ATTACK, SHIPS))
+    journal.close()
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write('{"id": "abc", "target": [1, 1, 2], "mis')
+
+    reopened = DispatchJournal.read(path)
+
+    assert [entry.target for entry in reopened.entries.values()] == [(1, 1, 1)]
+
+
+def test_open_compacts_superseded_states_and_expired_entries(tmp_path):
+    path = tmp_path / "dispatch.jsonl"
+    journal = DispatchJournal.open(path)
+    kept = journal.begin((1, 1, 1), Mission.ATTACK, SHIPS)
+    journal.confirm(kept)
+    journal.close()
+    old = {"id": "old", "target": [1, 1, 2], "mission": int(Mission.ATTACK), "ships": SHIPS,
+           "at": time.time() - 8 * 24 * 3600, "origin": "", "status": CONFIRMED}
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(old) + "\n")
+
+    DispatchJournal.open(path).close()
+
+    assert [(line["id"], line["status"]) for line in _lines(path)] == [(kept.entry_id, CONFIRMED)]
+
+
+def test_reconcile_settles_pending_entries_against_fleets_in_flight(tmp_path):
+    journal = DispatchJournal.open(tmp_path / "dispatch.jsonl")
+    flying = journal.begin((1, 1, 1), Mission.ATTACK, SHIPS)
+    lost = journal.begin((1, 1, 2), Mission.ATTACK, SHIPS)
+    events = [
+        FleetEvent(1, int(Mission.ATTACK), (1, 2, 3), (1, 1, 1), int(time.time()) + 60, False, False),
+        # Someone else's attack on the other target doesn't count
+        FleetEvent(2, int(Mission.ATTACK), (4, 4, 4), (1, 1, 2), int(time.time()) + 60, False, True),
+    ]
+
+    assert journal.reconcile(events) == (1, 1)
+    assert journal.entries[flying.entry_id].status == CONFIRMED
+    assert journal.entries[lost.entry_id].status == FAILED
+    assert journal.pending() == []
+    journal.close()
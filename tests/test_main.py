@@ -0,0 +1,50 @@
+import json
+import logging
+
+import main
+from src.ogame_bot.config import OGameConfig
+
+
+def test_main_sets_up_logging_from_the_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv("CHROME_USER_DATA_DIR", str(tmp_path / "profile"))
+    monkeypatch.setenv("LOG_DIR", str(tmp_path / "logs"))
+    monkeypatch.setenv("LOG_LEVEL", "warning")
+    monkeypatch.setattr("sys.argv", ["main.py", "--build-queue"])
+    seen = {}
+
+    def fake_main(args, config):
+        # Stop before any mode opens a browser
+        seen["config"] = config
+        main.log.info("smoke", extra={"event": "smoke"})
+
+    monkeypatch.setattr(main, "_main", fake_main)
+
+    assert main.main() is None
+
+    assert seen["config"].log_level == "warning"
+    [line] = (tmp_path / "logs" / "events.jsonl").read_text(encoding="utf-8").splitlines()
+    assert json.loads(line)["event"] == "smoke"
+
+
+def test_log_settings_default_to_the_documented_values(monkeypatch, tmp_path):
+    monkeypatch.setenv("CHROME_USER_DATA_DIR", str(tmp_path))
+    monkeypatch.delenv("LOG_DIR", raising=False)
+    monkeypatch.delenv("LOG_LEVEL", raising=False)
+
+    config = OGameConfig.from_env()
+
+    assert config.log_dir.endswith(".ogame-bot/logs")
+    assert logging.getLevelName(config.log_level) == logging.INFO
+
+
+def test_fleetsave_watch_mode_runs_the_watch(tmp_path, monkeypatch):
+    monkeypatch.setenv("CHROME_USER_DATA_DIR", str(tmp_path / "profile"))
+    monkeypatch.setenv("LOG_DIR", str(tmp_path / "logs"))
+    watches = []
+    monkeypatch.setattr(main, "_watch_fleetsave", lambda config, minutes: watches.append(minutes))
+
+    for argv in (["--fleetsave-watch"], ["--fleetsave-watch", "30"]):
+        monkeypatch.setattr("sys.argv", ["main.py", *argv])
+        main.main()
+
+    assert watches == [0, 30]
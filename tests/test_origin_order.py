@@ -0,0 +1,69 @@
+from src.ogame_bot.actions.fleet import Fleet
+from src.ogame_bot.actions.navigation import Navigation
+from src.ogame_bot.game_data import Mission, PlanetInfo
+from src.ogame_bot.planner import MissionRequest, Origin, plan_missions
+from src.ogame_bot.snapshot import EmpireSnapshot
+
+CARGO = "Nave grande de carga"
+HOME = PlanetInfo("Home", 1, (1, 100, 8))
+COLONY = PlanetInfo("Colony", 2, (1, 200, 8))
+
+
+class Element:
+    def __init__(self, page, selector):
+        self.page = page
+        self.selector = selector
+
+    def get_attribute(self, name, timeout=None):
+        return str(self.page.showing)
+
+    def wait_for(self, **kwargs):
+        pass
+
+    def click(self):
+        self.page.clicks.append(self.selector)
+        self.page.showing = int(self.selector.removeprefix("#planet-"))
+
+
+class GamePage:
+    """Shows one planet; clicking a planet in the list switches to it."""
+
+    def __init__(self, showing):
+        self.showing = showing
+        self.clicks = []
+
+    def locator(self, selector):
+        return Element(self, selector)
+
+    def wait_for_load_state(self, state):
+        pass
+
+
+def _snapshot():
+    snapshot = EmpireSnapshot()
+    snapshot.set_planets([HOME, COLONY])
+    return snapshot
+
+
+def test_select_planet_skips_the_planet_already_showing(fast_governor, monkeypatch):
+    monkeypatch.setattr("src.ogame_bot.actions.navigation.human_delay", lambda: None)
+    page = GamePage(showing=COLONY.planet_id)
+    nav = Navigation(page, snapshot=_snapshot())
+
+    assert nav.select_planet("Colony")
+    assert page.clicks == []
+
+    assert nav.select_planet("Home")
+    assert page.clicks == ["#planet-1"]
+
+
+def test_origins_start_with_the_planet_showing():
+    # The last origin read isn't necessarily the planet showing: inventories
+    # from the snapshot are used without visiting the planet
+    origins = [Origin("Colony", COLONY.coords, {CARGO: 10}), Origin("Home", HOME.coords, {CARGO: 10})]
+    requests = [MissionRequest(Mission.ATTACK, {CARGO: 10}, target) for target in ((1, 101, 1), (1, 199, 1))]
+    plan = plan_missions(requests, origins)
+
+    for showing, first in ((COLONY, "Colony"), (HOME, "Home")):
+        fleet = Fleet(GamePage(showing=showing.planet_id), snapshot=_snapshot())
+        assert fleet._origin_order(plan)[0] == first
@@ -0,0 +1,76 @@
+from src.ogame_bot.game_data import EXPEDITION_POSITION, Mission, flight_time
+from src.ogame_bot.planner import MissionRequest, Origin, capacity, plan_missions
+
+CARGO = "Nave grande de carga"
+SHIPS = {CARGO: 10}
+
+
+def _origin(name, coords, cargos=10):
+    return Origin(name, coords, {CARGO: cargos})
+
+
+def _attack(target):
+    return MissionRequest(Mission.ATTACK, SHIPS, target)
+
+
+def test_minimises_total_flight_time_rather_than_each_mission():
+    # One load of cargos per planet. Sending t1 from its nearest planet (A)
+    # would force t2 onto B, which is much further from t2 than A is
+    a = _origin("A", (1, 100, 8))
+    b = _origin("B", (1, 110, 8))
+    t1, t2 = (1, 104, 8), (1, 100, 9)
+
+    plan = plan_missions([_attack(t1), _attack(t2)], [a, b])
+
+    assert {(assignment.origin.name, assignment.target) for assignment in plan.assignments} == {("B", t1), ("A", t2)}
+    expected = flight_time(b.coords, t1, SHIPS) + flight_time(a.coords, t2, SHIPS)
+    assert plan.total_flight_time == expected
+    assert plan.total_flight_time < flight_time(a.coords, t1, SHIPS) + flight_time(b.coords, t2, SHIPS)
+
+
+def test_origin_sends_as_many_missions_as_its_ships_cover():
+    near = _origin("Near", (1, 100, 8), cargos=20)
+    far = _origin("Far", (2, 100, 8))
+    targets = [(1, 100, 9), (1, 100, 10), (1, 100, 11)]
+
+    plan = plan_missions([_attack(target) for target in targets], [near, far])
+
+    groups = plan.by_origin()
+    assert len(groups["Near"]) == 2
+    assert len(groups["Far"]) == 1
+    assert plan.unassigned == []
+
+
+def test_missions_nobody_can_supply_are_unassigned():
+    plan = plan_missions(
+        [_attack((1, 1, 1)), MissionRequest(Mission.ATTACK, {"Crucero": 5}, (1, 1, 2))],
+        [_origin("A", (1, 2, 3))],
+    )
+
+    assert [assignment.target for assignment in plan.assignments] == [(1, 1, 1)]
+    assert [request.target for request in plan.unassigned] == [(1, 1, 2)]
+
+
+def test_max_missions_keeps_the_cheapest():
+    origin = _origin("A", (1, 100, 8), cargos=100)
+    near, far = (1, 100, 9), (1, 300, 9)
+
+    plan = plan_missions([_attack(far), _attack(near)], [origin], max_missions=1)
+
+    assert [assignment.target for assignment in plan.assignments] == [near]
+    assert [request.target for request in plan.unassigned] == [far]
+
+
+def test_expeditions_fly_to_position_16_of_the_origin_system():
+    origin = _origin("A", (3, 42, 7))
+
+    plan = plan_missions([MissionRequest(Mission.EXPEDITION, SHIPS)], [origin])
+
+    assert plan.assignments[0].target == (3, 42, EXPEDITION_POSITION)
+
+
+def test_capacity_matches_ship_names_in_any_case():
+    inventory = {"nave grande de CARGA": 25, "Explorador": 3}
+
+    assert capacity(inventory, {CARGO: 10, "explorador": 1}) == 2
+    assert capacity(inventory, {"Crucero": 1}) == 0
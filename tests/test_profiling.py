@@ -0,0 +1,96 @@
+import json
+import zipfile
+
+import pytest
+
+from src.ogame_bot.actions.fleet import SCRIPT, Fleet
+from src.ogame_bot.game_data import Mission
+from src.ogame_bot.profiling import RunProfiler, format_report
+from src.ogame_bot.utils.delay import human_delay
+from src.ogame_bot.utils.governor import ActionGovernor, get_governor, set_governor
+
+
+class FakeTracing:
+    def __init__(self):
+        self.running = False
+
+    def start(self, **kwargs):
+        assert not self.running
+        self.running = True
+
+    def stop(self, path):
+        assert self.running
+        self.running = False
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr("trace.network", "")
+
+
+class FakeContext:
+    def __init__(self):
+        self.tracing = FakeTracing()
+
+
+class SentPage:
+    def evaluate(self, script, arg):
+        return {"ok": True}
+
+    def reload(self, **kwargs):
+        pass
+
+
+@pytest.fixture
+def slow_dispatch():
+    # One dispatch token, refilled every 0.2 s
+    previous = get_governor()
+    set_governor(ActionGovernor(class_limits={"dispatch": (300, 1)}, account_limit=(6000, 10)))
+    yield
+    set_governor(previous)
+
+
+def test_governor_waits_are_reported_as_pacing(tmp_path, slow_dispatch):
+    profiler = RunProfiler(tmp_path)
+    fleet = Fleet(SentPage(), human_delays=False, mode=SCRIPT)
+    profiler.start()
+
+    for _ in range(2):
+        fleet.dispatch_script({"Explorador": 1}, (1, 1, 16), Mission.EXPEDITION)
+    human_delay(0.1, 0.1)
+
+    report = json.loads((profiler.finish() / "report.json").read_text(encoding="utf-8"))
+
+    assert report["pacing"] == pytest.approx(0.2, abs=0.05)
+    assert report["human_delay"] == pytest.approx(0.1, abs=0.05)
+    assert report["python"] < 0.1
+    [row] = [row for row in report["methods"] if row["method"] == "Fleet.dispatch_script"]
+    assert row["pacing"] == pytest.approx(0.2, abs=0.05)
+    assert row["python"] < 0.1
+    assert report["wall"] >= 0.3
+    assert "pacing" in format_report(report)
+
+
+def test_relaunched_browser_gets_its_own_trace(tmp_path):
+    profiler = RunProfiler(tmp_path)
+    profiler.start()
+    profiler.attach(FakeContext())
+    profiler.detach()
+    profiler.attach(FakeContext())
+
+    directory = profiler.finish()
+
+    assert sorted(path.name for path in directory.glob("trace*.zip")) == ["trace.2.zip", "trace.zip"]
+
+
+def test_phase_trace_restarts_after_a_relaunch_within_the_phase(tmp_path):
+    profiler = RunProfiler(tmp_path, phase="farming")
+    profiler.attach(FakeContext())
+
+    with profiler.phase("expeditions"):
+        pass
+    with profiler.phase("farming"):
+        profiler.detach()
+        profiler.attach(FakeContext())
+    profiler.detach()
+    profiler.attach(FakeContext())
+    directory = profiler.finish()
+
+    assert sorted(path.name for path in directory.glob("trace*.zip")) == ["trace.2.zip", "trace.zip"]
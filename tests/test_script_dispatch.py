@@ -0,0 +1,79 @@
+import pytest
+from playwright.sync_api import Error as PlaywrightError
+
+from src.ogame_bot.actions.fleet import SCRIPT, TARGET_DEBRIS, Fleet
+from src.ogame_bot.game_data import Mission
+
+SHIPS = {"Nave grande de carga": 10}
+TARGET = (1, 100, 5)
+
+
+class ScriptPage:
+    """Stands in for the fleet page: evaluate() answers with a canned result."""
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+        self.reloads = 0
+
+    def evaluate(self, script, arg):
+        self.calls.append(arg)
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+    def reload(self, **kwargs):
+        self.reloads += 1
+
+
+@pytest.fixture
+def fleet(fast_governor):
+    def make(result):
+        fleet = Fleet(ScriptPage(result), human_delays=False, mode=SCRIPT)
+        fleet.wizard_runs = []
+
+        def wizard(*args):
+            fleet.wizard_runs.append(args)
+            return True
+
+        fleet._run_wizard = wizard
+        return fleet
+    return make
+
+
+def test_page_without_a_dispatcher_falls_back_to_the_wizard(fleet):
+    fleet = fleet({"ok": False, "missing": True})
+
+    assert fleet.dispatch(SHIPS, TARGET, Mission.ATTACK)
+
+    assert len(fleet.wizard_runs) == 1
+    assert fleet.page.reloads == 0
+
+
+def test_sent_mission_reloads_the_page_and_skips_the_wizard(fleet):
+    fleet = fleet({"ok": True, "message": ""})
+
+    assert fleet.dispatch(SHIPS, TARGET, Mission.RECYCLE, TARGET_DEBRIS, speed=5)
+
+    assert fleet.wizard_runs == []
+    assert fleet.page.reloads == 1
+    assert fleet.page.calls == [{"ships": SHIPS, "target": [1, 100, 5, TARGET_DEBRIS], "mission": 8, "speed": 10}]
+
+
+def test_refused_mission_is_not_retried_in_the_wizard(fleet):
+    fleet = fleet({"ok": False, "error": "only 3 Nave grande de carga"})
+
+    assert not fleet.dispatch(SHIPS, TARGET, Mission.ATTACK)
+
+    assert fleet.wizard_runs == []
+    # The game answered, so nothing is in doubt
+    assert not fleet._send_started
+
+
+def test_broken_off_call_is_in_doubt_and_not_retried(fleet):
+    fleet = fleet(PlaywrightError("Execution context was destroyed"))
+
+    assert not fleet.dispatch(SHIPS, TARGET, Mission.ATTACK)
+
+    assert fleet.wizard_runs == []
+    assert fleet._send_started
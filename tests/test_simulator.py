@@ -0,0 +1,109 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.ogame_bot.economy import get_tech  # noqa: E402
+from src.ogame_bot.simulator import (  # noqa: E402
+    METAL,
+    SIM_TECHS,
+    PlanetEconomy,
+    optimize_build_order,
+    production,
+    simulate,
+    storage,
+)
+
+START = np.zeros((1, len(SIM_TECHS)), dtype=np.int64)
+HOT = np.array([40.0])
+NO_NANITE = np.array([0.0])
+
+
+def _run(items, resources=(1000.0, 1000.0, 0.0), hours=1.0, levels=START):
+    return simulate(
+        np.array(items, dtype=np.int64).reshape(len(items), 1, -1),
+        levels, np.array([resources]), HOT, NO_NANITE, hours, steps=100,
+    )
+
+
+def _score(planet, sequence, hours):
+    levels = np.array([[planet.levels.get(key, 0) for key in SIM_TECHS]])
+    result = simulate(
+        np.array([[sequence]], dtype=np.int64), levels, np.array([planet.resources]),
+        np.array([float(planet.max_temperature)]), NO_NANITE, hours, steps=120,
+    )
+    return float(result.production[0, 0] @ np.array([1.0, 1.5, 3.0]))
+
+
+def test_empty_planet_only_has_base_production():
+    assert production(START, HOT)[0].tolist() == [30, 15, 0]
+
+
+def test_resources_grow_with_production_without_a_plan():
+    result = _run([[-1]], resources=(0.0, 0.0, 0.0), hours=2)
+
+    assert result.resources[0, 0] == pytest.approx([60, 30, 0])
+    assert result.started[0, 0] == 0
+
+
+def test_affordable_item_is_paid_and_built():
+    cost = get_tech("metal_mine").cost(1)
+
+    result = _run([[METAL]])
+
+    assert result.started[0, 0] == 1
+    assert result.levels[0, 0, METAL] == 1
+    # Paid up front: at most one hour of crystal production (15) is back
+    assert result.resources[0, 0, 1] <= 1000 - cost[1] + 15 + 1e-6
+
+
+def test_item_waits_until_it_is_affordable():
+    result = _run([[METAL]], resources=(0.0, 0.0, 0.0), hours=1)
+
+    # 30 metal/h never reaches the 60 the mine costs within the hour
+    assert result.started[0, 0] == 0
+    assert result.levels[0, 0, METAL] == 0
+
+
+def test_resources_stop_at_the_storage_cap():
+    cap = storage(START)[0]
+
+    result = _run([[-1]], resources=tuple(cap - 1), hours=10)
+
+    # No synthesizer, so deuterium doesn't grow at all
+    assert result.resources[0, 0, :2] == pytest.approx(cap[:2])
+
+
+def test_batch_matches_one_simulation_per_plan():
+    plans = [[METAL, METAL], [SIM_TECHS.index("solar_plant"), METAL]]
+
+    together = _run(plans, hours=24)
+
+    for index, plan in enumerate(plans):
+        alone = _run([plan], hours=24)
+        assert together.levels[index].tolist() == alone.levels[0].tolist()
+        assert together.resources[index] == pytest.approx(alone.resources[0])
+
+
+def test_optimized_plan_continues_from_the_current_levels():
+    planet = PlanetEconomy("Home", {"metal_mine": 3, "solar_plant": 3}, (5000.0, 3000.0, 500.0))
+
+    plan = optimize_build_order([planet], horizon_hours=24, depth=4, beam_width=4, steps=120)
+
+    items = plan.planets["Home"]
+    assert items and plan.research == []
+    levels = dict(planet.levels)
+    for key, target in items:
+        assert target == levels.get(key, 0) + 1
+        levels[key] = target
+
+
+def test_wider_beam_is_never_worse_than_greedy():
+    planet = PlanetEconomy("Home", {"metal_mine": 5, "crystal_mine": 3, "solar_plant": 5}, (8000.0, 4000.0, 0.0))
+
+    def sequence(width):
+        plan = optimize_build_order([planet], horizon_hours=48, depth=5, beam_width=width, steps=120)
+        return [SIM_TECHS.index(key) for key, _ in plan.planets["Home"]]
+
+    greedy, beam = sequence(1), sequence(8)
+
+    assert _score(planet, beam, 48) >= _score(planet, greedy, 48) - 1e-6
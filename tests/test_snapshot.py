@@ -0,0 +1,117 @@
+import json
+import time
+
+import pytest
+
+from src.ogame_bot.game_data import PlanetInfo
+from src.ogame_bot.snapshot import EmpireSnapshot
+
+HOME = PlanetInfo("Home", 1, (1, 100, 8))
+
+
+def test_fields_expire_after_their_ttl():
+    snapshot = EmpireSnapshot(ttls={"slots": 600, "inventory": 3600})
+    snapshot.set_expedition_slots(1, 3)
+    snapshot.set_inventory(HOME.planet_id, {"Explorador": 2})
+    now = time.time()
+
+    assert snapshot.get("slots", now=now + 599) == [1, 3]
+    assert snapshot.get("slots", now=now + 601) is None
+    assert snapshot.is_stale("slots", now=now + 601)
+    # The TTL is looked up by the part before the dot
+    assert snapshot.get("inventory.1", now=now + 3000) == {"Explorador": 2}
+    assert snapshot.get("slots", now=now + 601, stale_ok=True) == [1, 3]
+
+
+def test_version_only_moves_when_the_value_changes():
+    snapshot = EmpireSnapshot()
+    assert snapshot.version("slots") == 0
+
+    snapshot.set_expedition_slots(1, 3)
+    snapshot.set_expedition_slots(1, 3)
+    assert snapshot.version("slots") == 1
+
+    snapshot.set_expedition_slots(2, 3)
+    assert snapshot.version("slots") == 2
+
+
+def test_consume_ships_keeps_the_reading_time():
+    snapshot = EmpireSnapshot()
+    snapshot.set_inventory(HOME.planet_id, {"Nave grande de carga": 10, "Explorador": 2})
+    snapshot._fields["inventory.1"]["updated_at"] -= 100
+
+    snapshot.consume_ships(HOME.planet_id, {"nave grande de carga": 4, "Explorador": 2})
+
+    assert snapshot.inventory(HOME.planet_id) == {"Nave grande de carga": 6}
+    assert snapshot.version("inventory.1") == 2
+    assert snapshot.age("inventory.1") >= 100
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = tmp_path / "empire.json"
+    snapshot = EmpireSnapshot(path)
+    snapshot.set_planets([HOME])
+    snapshot.save()
+
+    loaded = EmpireSnapshot.load(path)
+
+    assert loaded.planets() == [HOME]
+    assert loaded.version("planets") == 1
+    assert [p.name for p in tmp_path.iterdir()] == ["empire.json"]
+
+
+def test_failed_save_leaves_the_previous_file(tmp_path):
+    path = tmp_path / "empire.json"
+    snapshot = EmpireSnapshot(path)
+    snapshot.set_planets([HOME])
+    snapshot.save()
+    before = path.read_text(encoding="utf-8")
+
+    snapshot.set("broken", object())
+    with pytest.raises(TypeError):
+        snapshot.save()
+
+    assert path.read_text(encoding="utf-8") == before
+    assert [p.name for p in tmp_path.iterdir()] == ["empire.json"]
+
+
+def test_unreadable_or_outdated_files_give_an_empty_snapshot(tmp_path):
+    torn = tmp_path / "torn.json"
+    torn.write_text('{"schema": 1, "fields": {', encoding="utf-8")
+    old = tmp_path / "old.json"
+    old.write_text(json.dumps({"schema": 0, "fields": {"slots": {}}}), encoding="utf-8")
+
+    assert EmpireSnapshot.load(torn).planets() is None
+    assert EmpireSnapshot.load(old).expedition_slots() is None
+    assert EmpireSnapshot.load(tmp_path / "missing.json").planets() is None
+
+
+def test_inventory_expires_when_a_fleet_lands_on_the_planet():
+    snapshot = EmpireSnapshot()
+    snapshot.set_planets([HOME])
+    snapshot.set_inventory(HOME.planet_id, {"Nave grande de carga": 10})
+    snapshot.consume_ships(HOME.planet_id, {"Nave grande de carga": 10})
+    now = time.time()
+
+    assert snapshot.expect_landings({HOME.coords: now + 600, (9, 9, 9): now + 60}) == 1
+
+    assert snapshot.inventory(HOME.planet_id) == {}
+    assert snapshot.get("inventory.1", now=now + 600) is None
+    # A reading taken while the fleet is still out doesn't include it either
+    snapshot.set_inventory(HOME.planet_id, {"Explorador": 1})
+    assert snapshot.get("inventory.1", now=now + 600) is None
+    assert snapshot.get("inventory.1", now=now + 599) == {"Explorador": 1}
+
+
+def test_inventory_expiry_survives_a_save(tmp_path):
+    path = tmp_path / "empire.json"
+    snapshot = EmpireSnapshot(path)
+    snapshot.set_planets([HOME])
+    snapshot.set_inventory(HOME.planet_id, {"Explorador": 1})
+    snapshot.expire_inventory(HOME.planet_id, time.time() - 1)
+    snapshot.save()
+
+    loaded = EmpireSnapshot.load(path)
+
+    assert loaded.inventory(HOME.planet_id) is None
+    assert loaded.is_stale("inventory.1")
@@ -0,0 +1,190 @@
+import pytest
+from playwright.sync_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeout
+
+from src.ogame_bot.supervisor import (
+    BROWSER_CRASH,
+    NAVIGATION_ERROR,
+    RELAUNCH,
+    RELOAD,
+    REATTACH,
+    RETRY,
+    SELECTOR_TIMEOUT,
+    SESSION_LOST,
+    Supervisor,
+)
+
+GAME_URL = "https://s1-es.ogame.gameforge.com/game/index.php?page=ingame"
+
+
+class FakeLocator:
+    def __init__(self, count):
+        self._count = count
+
+    def count(self):
+        return self._count
+
+
+class FakePage:
+    def __init__(self, url=GAME_URL, indicators=1, closed=False):
+        self.url = url
+        self.indicators = indicators
+        self.closed = closed
+
+    def is_closed(self):
+        return self.closed
+
+    def locator(self, selector):
+        return FakeLocator(self.indicators)
+
+
+class FakeBot:
+    """Records recovery actions; relaunch and reattach bring back a healthy game page."""
+
+    def __init__(self, page=None):
+        self._page = page or FakePage()
+        self.actions = []
+
+    @property
+    def page(self):
+        if self._page is None:
+            raise RuntimeError("Browser not started")
+        return self._page
+
+    def reload_page(self):
+        self.actions.append(RELOAD)
+
+    def reattach(self):
+        self.actions.append(REATTACH)
+        self._page = FakePage()
+
+    def relaunch(self):
+        self.actions.append(RELAUNCH)
+        self._page = FakePage()
+
+
+def _supervisor(bot, **kwargs):
+    sleeps = []
+    supervisor = Supervisor(bot, sleep=sleeps.append, **kwargs)
+    return supervisor, sleeps
+
+
+def _steps(*outcomes):
+    """A step that raises or returns each outcome in turn, then returns True."""
+    remaining = list(outcomes)
+
+    def step():
+        outcome = remaining.pop(0) if remaining else True
+        if callable(outcome):
+            outcome = outcome()
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+    return step
+
+
+@pytest.mark.parametrize("page, error, kind", [
+    (FakePage(), None, SELECTOR_TIMEOUT),
+    (FakePage(), PlaywrightTimeout("Timeout 5000ms exceeded"), SELECTOR_TIMEOUT),
+    (FakePage(), PlaywrightError("net::ERR_CONNECTION_RESET"), NAVIGATION_ERROR),
+    (FakePage(url="https://lobby.ogame.gameforge.com/es_ES/hub"), None, SESSION_LOST),
+    (FakePage(indicators=0), PlaywrightTimeout("Timeout"), SESSION_LOST),
+    (FakePage(closed=True), None, BROWSER_CRASH),
+    (FakePage(), PlaywrightError("Target closed"), BROWSER_CRASH),
+])
+def test_classify(page, error, kind):
+    supervisor, _ = _supervisor(FakeBot(page))
+
+    assert supervisor.classify(error) == kind
+
+
+def test_classify_without_a_page_is_a_crash():
+    bot = FakeBot()
+    bot._page = None
+
+    assert _supervisor(bot)[0].classify() == BROWSER_CRASH
+
+
+def test_selector_timeouts_retry_then_reload():
+    bot = FakeBot()
+    supervisor, sleeps = _supervisor(bot, backoff=2)
+
+    result = supervisor.run("send", _steps(False, False), ok=bool)
+
+    assert result is True
+    assert bot.actions == [RELOAD]
+    assert sleeps == [2]
+    [recovery] = supervisor.stats.recoveries
+    assert (recovery.kind, recovery.actions, recovery.recovered) == (SELECTOR_TIMEOUT, (RETRY, RELOAD), True)
+
+
+def test_gives_up_after_the_ladder_and_returns_the_last_result():
+    supervisor, _ = _supervisor(FakeBot())
+
+    assert supervisor.run("send", lambda: 0, ok=bool) == 0
+
+    [recovery] = supervisor.stats.recoveries
+    assert recovery.actions == (RETRY, RELOAD)
+    assert not recovery.recovered
+
+
+def test_gives_up_by_raising_the_last_error():
+    error = PlaywrightError("net::ERR_CONNECTION_RESET")
+    supervisor, _ = _supervisor(FakeBot())
+
+    with pytest.raises(PlaywrightError):
+        supervisor.run("open", _steps(error, error, error))
+
+    assert supervisor.stats.recoveries[0].actions == (RELOAD, REATTACH)
+
+
+def test_backoff_doubles_up_to_the_cap_as_failures_climb_the_ladders():
+    bot = FakeBot()
+    supervisor, sleeps = _supervisor(bot, backoff=1, max_backoff=3)
+
+    def logged_out():
+        bot._page.url = "https://lobby.ogame.gameforge.com/es_ES/hub"
+        return PlaywrightTimeout("Timeout")
+
+    net = PlaywrightError("net::ERR_ABORTED")
+    supervisor.run("open", _steps(net, net, logged_out, logged_out))
+
+    assert bot.actions == [RELOAD, REATTACH, REATTACH, RELAUNCH]
+    assert sleeps == [1, 2, 3]
+    # Recorded under the class of the first failure
+    assert supervisor.stats.summary()[NAVIGATION_ERROR]["recovered"] == 1
+
+
+def test_max_attempts_bounds_the_recovery():
+    bot = FakeBot()
+    supervisor, _ = _supervisor(bot, max_attempts=1)
+
+    with pytest.raises(PlaywrightError):
+        supervisor.run("open", _steps(*[PlaywrightError("net::ERR_ABORTED")] * 3))
+
+    assert bot.actions == [RELOAD]
+
+
+def test_missing_page_is_relaunched():
+    bot = FakeBot()
+    bot._page = None
+
+    def step():
+        return bot.page is not None
+
+    assert _supervisor(bot)[0].run("phase", step)
+    assert bot.actions == [RELAUNCH]
+
+
+def test_runtime_error_with_a_page_is_a_bug():
+    supervisor, _ = _supervisor(FakeBot())
+
+    with pytest.raises(RuntimeError):
+        supervisor.run("phase", _steps(RuntimeError("bug")))
+
+
+def test_other_exceptions_are_not_caught():
+    bot = FakeBot()
+
+    with pytest.raises(KeyError):
+        _supervisor(bot)[0].run("phase", _steps(KeyError("x")))
+    assert bot.actions == []